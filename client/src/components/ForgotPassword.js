@@ -33,7 +33,7 @@ function ForgotPassword() {
                 .then((res) => res.json())
                 .then((data) => {
                     setSubmitted(true);
-                    if (data.email_sent !== undefined) setEmailSent(!!data.email_sent);
+                    if (data.email_queued !== undefined) setEmailSent(!!data.email_queued);
                     if (data.error) setError(data.error);
                 })
                 .catch(() => setError('Something went wrong. Please try again.'));
@@ -350,7 +350,7 @@ function Leagues() {
                                             {league.name}
                                         </Typography>
                                         <Typography variant="body2" color="text.secondary">
-                                            {league.members?.length || 0} members
+                                            {league.member_count ?? league.members?.length ?? 0} members
                                         </Typography>
                                         {league.invite_code && (
                                             <Box
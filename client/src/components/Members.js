@@ -449,7 +449,13 @@ function Members() {
 
     function getPredictions() {
         setLoadingPredictions(true)
-        const url = leagueId ? `/api/v1/predictions?league_id=${leagueId}` : '/api/v1/predictions'
+        // The predictions and results tables show one round at a time: only fetch that round
+        const params = new URLSearchParams()
+        if (leagueId) params.set('league_id', leagueId)
+        const roundNum = parseInt(gameWeek, 10)
+        if (!Number.isNaN(roundNum)) params.set('round', roundNum)
+        const query = params.toString()
+        const url = query ? `/api/v1/predictions?${query}` : '/api/v1/predictions'
         authenticatedFetch(url)
         .then(response => {
             if (!response.ok) {
@@ -810,7 +816,6 @@ function Members() {
         const hasLeagueInUrl = /\bleague=\d+/.test(location.search)
         if (hasLeagueInUrl) return
         getAvailableRounds()
-        getPredictions()
         loadCurrentRoundAndFixtures()
     }, [])
 
@@ -819,9 +824,14 @@ function Members() {
         if (!leagueId || leagueDetail?.id !== leagueId || !effectiveCompetition) return
         loadCurrentRoundAndFixtures()
         getAvailableRounds()
-        getPredictions()
     }, [leagueId, leagueDetail, effectiveCompetition])
 
+    // Predictions are fetched per round: refetch when the week (or league) changes
+    useEffect(() => {
+        if (!gameWeek || (leagueId && !effectiveCompetition)) return
+        getPredictions()
+    }, [gameWeek, leagueId, effectiveCompetition])
+
     // When competition changes (non-league picker or after league loads), refresh rounds and fixtures
     useEffect(() => {
         if (leagueId && !effectiveCompetition) return
@@ -85,7 +85,7 @@ function Profile() {
             setLeaguesLoading(true)
         }
         setLeaguesError(null)
-        refreshUserLeagues(authenticatedFetch)
+        refreshUserLeagues(authenticatedFetch, { members: 'full' })
             .then((leagues) => setLeagues(leagues))
             .catch((e) => {
                 if (!cached.length) setLeaguesError(e.message || 'Failed to load leagues')
@@ -136,7 +136,7 @@ function Profile() {
             .catch((e) => {
                 setLeaguesError(e.message || 'Failed to update notification setting')
                 // Best-effort refresh
-                refreshUserLeagues(authenticatedFetch)
+                refreshUserLeagues(authenticatedFetch, { members: 'full' })
                     .then((list) => setLeagues(list))
                     .catch(() => {})
             })
@@ -97,9 +97,11 @@ export function applyLeagueCompetitionToState(league, setSelectedCompetition) {
 
 /**
  * Fetch /api/v1/leagues, update snapshot, return leagues array.
+ * members: 'none' (default; the list only needs member_count) or 'full' (member rows, e.g. for the profile).
+ * Without member rows, the snapshot keeps each league's previously cached members.
  */
-export function refreshUserLeagues(authenticatedFetch) {
-    return authenticatedFetch('/api/v1/leagues')
+export function refreshUserLeagues(authenticatedFetch, { members = 'none' } = {}) {
+    return authenticatedFetch(`/api/v1/leagues?members=${members}`)
         .then((res) => {
             if (res.status === 401 || res.status === 404) {
                 const err = new Error('Session expired')
@@ -115,7 +117,14 @@ export function refreshUserLeagues(authenticatedFetch) {
             return res.json()
         })
         .then((data) => {
-            const leagues = data.leagues || []
+            let leagues = data.leagues || []
+            if (members === 'none') {
+                const cached = new Map(getCachedLeagues().map((l) => [Number(l.id), l]))
+                leagues = leagues.map((l) => {
+                    const prev = cached.get(Number(l.id))
+                    return prev?.members ? { ...l, members: prev.members } : l
+                })
+            }
             writeLeaguesSnapshot(leagues)
             return leagues
         })
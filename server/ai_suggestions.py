@@ -0,0 +1,129 @@
+"""Model backends for Ask AI score suggestions.
+
+A backend predicts every fixture of a round in one call: predict_round(fixtures, standings) takes plain dicts
+(fixture_id, home_team, away_team, round) and the competition table (list of standings rows, or None) and returns
+{fixture_id: {'home_team_score', 'away_team_score', 'rationale'}}; fixtures it could not score are left out.
+app.py stores the result in fixture_ai_suggestions and serves members from there.
+
+Backends:
+  - OpenAIBackend: one structured (JSON) chat completion per round; the client is created once per process.
+  - LocalBackend: deterministic stand-in (table points, home advantage and a hash of the team names) for tests and
+    offline development; never calls out.
+"""
+import hashlib
+import json
+
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OpenAI = None
+    OPENAI_AVAILABLE = False
+
+MAX_GOALS = 20
+
+
+def _valid_score(value):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if 0 <= value <= MAX_GOALS else None
+
+
+def standings_text(standings, competition_name='League'):
+    """The table as prompt lines, or a note that it is unavailable."""
+    if not standings:
+        return f'The current {competition_name} table could not be loaded; base predictions on general knowledge of the teams.'
+    lines = [f"{e['position']}. {e['team']} – P{e['played']} W{e['won']} D{e['drawn']} L{e['lost']} GF{e['goalsFor']} "
+             f"GA{e['goalsAgainst']} GD{e['goalDifference']} Pts{e['points']}" for e in standings]
+    return f'Current {competition_name} table (after latest matchweek):\n' + '\n'.join(lines)
+
+
+class OpenAIBackend:
+    """All fixtures of a round in one JSON-mode chat completion."""
+
+    def __init__(self, api_key, model='gpt-4o-mini'):
+        self.client = OpenAI(api_key=api_key)
+        self.model = model
+        self.name = f'openai:{model}'
+
+    def predict_round(self, fixtures, standings, competition_name='League'):
+        listing = '\n'.join(f"- fixture_id {f['fixture_id']}: {f['home_team']} (home) vs {f['away_team']} (away)"
+                            for f in fixtures)
+        prompt = f"""Fixtures{f" (Round {fixtures[0]['round']})" if fixtures and fixtures[0].get('round') else ''}:
+{listing}
+
+{standings_text(standings, competition_name)}
+
+Predict the full-time score of every fixture. Consider table position, form, and home advantage. Reply with valid JSON only, no other text:
+{{"predictions": [{{"fixture_id": <id>, "home_team_score": <integer 0-{MAX_GOALS}>, "away_team_score": <integer 0-{MAX_GOALS}>, "rationale": "<one short sentence>"}}, ...]}}"""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {'role': 'system', 'content': 'You are a football expert. Reply only with valid JSON in the exact format requested.'},
+                {'role': 'user', 'content': prompt},
+            ],
+            response_format={'type': 'json_object'},
+            max_tokens=80 * len(fixtures) + 50,
+        )
+        content = (response.choices[0].message.content or '').strip()
+        rows = json.loads(content).get('predictions') if content else None
+        wanted = {f['fixture_id'] for f in fixtures}
+        out = {}
+        for row in rows or []:
+            if not isinstance(row, dict):
+                continue
+            try:
+                fixture_id = int(row.get('fixture_id'))
+            except (TypeError, ValueError):
+                continue
+            home, away = _valid_score(row.get('home_team_score')), _valid_score(row.get('away_team_score'))
+            if fixture_id in wanted and home is not None and away is not None:
+                out[fixture_id] = {'home_team_score': home, 'away_team_score': away,
+                                   'rationale': str(row.get('rationale') or '').strip()}
+        return out
+
+
+class LocalBackend:
+    """Deterministic suggestions without a model: same fixtures and table always give the same scores."""
+
+    name = 'local'
+
+    def predict_round(self, fixtures, standings, competition_name='League'):
+        points = {(e.get('team') or '').strip().lower(): e.get('points') or 0 for e in standings or []}
+        out = {}
+        for f in fixtures:
+            home, away = f['home_team'] or '', f['away_team'] or ''
+            seed = int(hashlib.sha256(f'{home}|{away}'.encode('utf-8')).hexdigest()[:8], 16)
+            edge = points.get(home.strip().lower(), 0) - points.get(away.strip().lower(), 0) + 3  # home advantage
+            home_goals = 1 + seed % 2 + (1 if edge > 10 else 0)
+            away_goals = (seed >> 1) % 2 + (1 if edge < -10 else 0)
+            out[f['fixture_id']] = {
+                'home_team_score': home_goals,
+                'away_team_score': away_goals,
+                'rationale': f'{home} at home' + (' with the stronger table record.' if edge > 3 else '.'),
+            }
+        return out
+
+
+_backend = [None]
+_unavailable = ['Ask AI is not configured']
+
+
+def configure(backend='openai', api_key='', model='gpt-4o-mini'):
+    """Pick the backend: 'openai' (needs the openai package and an API key) or 'local'."""
+    _backend[0] = None
+    if backend == 'local':
+        _backend[0] = LocalBackend()
+    elif not OPENAI_AVAILABLE:
+        _unavailable[0] = 'Ask AI is not available (openai package not installed)'
+    elif not (api_key or '').strip():
+        _unavailable[0] = 'Ask AI is not configured (OPENAI_API_KEY not set)'
+    else:
+        _backend[0] = OpenAIBackend(api_key.strip(), model=model)
+
+
+def get_backend():
+    """(backend, None) or (None, reason it is unavailable)."""
+    return (_backend[0], None) if _backend[0] is not None else (None, _unavailable[0])
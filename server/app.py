@@ -1,97 +1,51 @@
 #!/usr/bin/env python3
 
 # Standard library imports
+import base64
+import bisect
 import json
 import os
 import secrets
-import smtplib
 import threading
-import unicodedata
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.utils import parseaddr
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from datetime import datetime, timedelta, timezone, date, time
+import click
 import jwt
 
 # Remote library imports
-from flask import request, make_response, session, send_from_directory
+from flask import g as request_g, has_request_context, request, make_response, session, send_from_directory
 from flask_restful import Resource
 
 # Local imports
 from config import app, db, api, bcrypt
 # Add your model imports
 from models import (
-    User, Game, Prediction, Fixture, League, LeagueMembership, LeagueWeekWinner,
+    User, Game, Prediction, Fixture, League, LeagueMembership, LeagueWeekWinner, LeagueStanding, Team, TeamAlias,
+    LeagueRoundClose, LeagueRoundStanding, FixtureAISuggestion, JobLock, JobRun,
     TournamentEdition, TournamentGroupTeam, BracketEntry, GroupPrediction, BracketPick,
 )
-from sqlalchemy import func, or_, select
-
-
-def _normalize_team_name(s):
-    """Normalize team name for matching (e.g. 'Brighton & Hove Albion' vs 'Brighton and Hove Albion')."""
-    if s is None:
-        return ''
-    t = (s or '').strip().lower()
-    t = t.replace('&', 'and').replace('  ', ' ')
-    while '  ' in t:
-        t = t.replace('  ', ' ')
-    return t
-
-
-# Common short names / aliases for Premier League teams (normalized key -> normalized canonical name)
-_TEAM_ALIASES = {
-    'wolves': 'wolverhampton wanderers',
-    'spurs': 'tottenham hotspur',
-    'tottenham': 'tottenham hotspur',
-    'man utd': 'manchester united',
-    'man united': 'manchester united',
-    'man utd.': 'manchester united',
-    "man u": 'manchester united',
-    'man city': 'manchester city',
-    'city': 'manchester city',
-    'west ham': 'west ham united',
-    'forest': 'nottingham forest',
-    'notts forest': 'nottingham forest',
-    'newcastle': 'newcastle united',
-    'brighton': 'brighton and hove albion',
-    'villa': 'aston villa',
-    'bournemouth': 'afc bournemouth',
-    'utd': 'manchester united',  # risky but common
-}
-
-
-def _team_names_equivalent(a, b):
-    """True if both team names refer to the same team (normalized + aliases)."""
-    an = _normalize_team_name(a)
-    bn = _normalize_team_name(b)
-    if an == bn:
-        return True
-    ac = _TEAM_ALIASES.get(an, an)
-    bc = _TEAM_ALIASES.get(bn, bn)
-    return ac == bc
-
-
-def _fixture_matches_game(fixture, home_team, away_team):
-    """True if fixture's teams match the given home/away (exact, case-insensitive, normalized, or alias).
-    Uses _normalize_team_name_for_match so 'Chelsea FC' matches 'Chelsea' (leaderboard and predictions)."""
-    if not fixture or not fixture.fixture_home_team or not fixture.fixture_away_team:
-        return False
-    f_h = (fixture.fixture_home_team or '').strip()
-    f_a = (fixture.fixture_away_team or '').strip()
-    g_h = (home_team or '').strip()
-    g_a = (away_team or '').strip()
-    if f_h == g_h and f_a == g_a:
-        return True
-    if f_h.lower() == g_h.lower() and f_a.lower() == g_a.lower():
-        return True
-    if _normalize_team_name(f_h) == _normalize_team_name(g_h) and _normalize_team_name(f_a) == _normalize_team_name(g_a):
-        return True
-    if _team_names_equivalent(f_h, g_h) and _team_names_equivalent(f_a, g_a):
-        return True
-    if _normalize_team_name_for_match(f_h) == _normalize_team_name_for_match(g_h) and _normalize_team_name_for_match(f_a) == _normalize_team_name_for_match(g_a):
-        return True
-    return False
+from sqlalchemy import and_, case, event, func, or_, select, tuple_, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, selectinload
+import ai_suggestions
+import email_outbox
+import leaderboard_cache
+import scheduler
+import scoring
+import standings_cache
+from team_matching import (
+    FixtureIndex,
+    _fixture_matches_game,
+    _normalize_team_name,
+    _normalize_team_name_for_match,
+    add_team_alias,
+    is_registered_spelling,
+    registered_team_for,
+    set_team_registry,
+)
 
 
 def _normalize_datetime_for_compare(dt):
@@ -132,11 +86,20 @@ def _game_for_fixture(fixture, games_list, league_created_at=None):
     When league_created_at is provided, only return games on/after that timestamp with a
     known kickoff that aligns to the fixture date. This prevents prior-season picks from
     being matched to a new season fixture that happens to have the same home/away teams.
+    Games linked by fixture_id match only their own fixture; name matching is the fallback
+    for unlinked (legacy) rows.
     """
     if not fixture or not games_list:
         return None
     season_scoped = league_created_at is not None
+    fixture_id = getattr(fixture, 'id', None)
     for g in games_list:
+        linked_id = getattr(g, 'fixture_id', None)
+        if linked_id is not None and linked_id == fixture_id and _game_date_on_or_after_league(g, league_created_at, strict_missing_date=season_scoped):
+            return g
+    for g in games_list:
+        if getattr(g, 'fixture_id', None) is not None:
+            continue
         if season_scoped:
             if not _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True):
                 continue
@@ -233,9 +196,18 @@ def health():
     return make_response({'status': 'ok'}, 200)
 
 
-def _send_missing_predictions_notifications():
-    """Find leagues with fixtures in <24h, members who opted in and have no predictions for those fixtures; send reminder email. Returns (sent_count, error_message or None)."""
-    now_utc = datetime.now(timezone.utc)
+# Reminder sweep commits last_missing_predictions_round after every this many sent emails.
+REMINDER_COMMIT_BATCH = 25
+
+
+def _missing_prediction_reminders(now_utc=None):
+    """Plan the reminder sweep with set-based queries: returns ([(membership, league, reminder_round)], stats).
+    A member is due a reminder when their league's competition has fixtures in the next 24h, they opted in,
+    were not yet reminded for that round, and have no prediction for any of those fixtures (linked by
+    fixture_id, or an unlinked game whose teams match one of them via FixtureIndex)."""
+    stats = {'fixtures': 0, 'leagues': 0, 'members_checked': 0, 'members_missing': 0}
+    if now_utc is None:
+        now_utc = datetime.now(timezone.utc)
     # Use naive UTC for DB comparison (Fixture.fixture_date is often stored without tz)
     now_naive = now_utc.replace(tzinfo=None) if now_utc.tzinfo else now_utc
     end_naive = now_naive + timedelta(hours=24)
@@ -243,57 +215,95 @@ def _send_missing_predictions_notifications():
         Fixture.fixture_date.isnot(None),
         Fixture.fixture_date > now_naive,
         Fixture.fixture_date <= end_naive,
-        or_(Fixture.is_completed == False, Fixture.is_completed.is_(None)),
+        _fixture_not_completed_filter(),
     ).all()
-    if not upcoming:
-        return 0, None
+    stats['fixtures'] = len(upcoming)
     # Group by competition_slug (eng.1 and None treated as same for league matching)
     fixtures_by_comp = {}
     for f in upcoming:
-        comp = getattr(f, 'competition_slug', None) or 'eng.1'
-        fixtures_by_comp.setdefault(comp, []).append(f)
-    base_url = (app.config.get('RESET_PASSWORD_BASE_URL') or '').strip().rstrip('/') or 'https://playfantasypredictor.com'
-    sent = 0
+        fixtures_by_comp.setdefault(getattr(f, 'competition_slug', None) or 'eng.1', []).append(f)
+    # Round we're reminding about (e.g. 28) — send only once per round per (user, league)
+    reminder_rounds = {}
     for comp_slug, fixtures in fixtures_by_comp.items():
-        # Round we're reminding about (e.g. 28) — send only once per round per (user, league)
         reminder_round = min((f.fixture_round for f in fixtures if f.fixture_round is not None), default=None)
-        if reminder_round is None:
-            continue
-        if comp_slug == 'eng.1':
-            leagues = League.query.filter(or_(League.competition_slug == 'eng.1', League.competition_slug.is_(None))).all()
+        if reminder_round is not None:
+            reminder_rounds[comp_slug] = reminder_round
+    if not reminder_rounds:
+        return [], stats
+
+    league_filter = League.competition_slug.in_(list(reminder_rounds))
+    if 'eng.1' in reminder_rounds:
+        league_filter = or_(league_filter, League.competition_slug.is_(None))
+    leagues = {league.id: league for league in League.query.filter(league_filter).all()}
+    stats['leagues'] = len(leagues)
+    if not leagues:
+        return [], stats
+    memberships = (
+        LeagueMembership.query.join(User, User.id == LeagueMembership.user_id)
+        .options(contains_eager(LeagueMembership.user))
+        .filter(
+            LeagueMembership.league_id.in_(list(leagues)),
+            LeagueMembership.notify_missing_predictions.is_(True),
+            User.deleted_at.is_(None),
+        )
+        .all()
+    )
+    league_comp = {lid: league.competition_slug or 'eng.1' for lid, league in leagues.items()}
+    memberships = [lm for lm in memberships if lm.last_missing_predictions_round != reminder_rounds[league_comp[lm.league_id]]]
+    stats['members_checked'] = len(memberships)
+    if not memberships:
+        return [], stats
+
+    # All relevant picks in one query: linked to an upcoming fixture, or unlinked (legacy name matching)
+    user_ids = {lm.user_id for lm in memberships}
+    upcoming_ids = [f.id for f in upcoming]
+    linked_by_user = {}
+    unlinked_by_user = {}
+    for g in Game.query.filter(
+        Game.user_id.in_(list(user_ids)),
+        or_(Game.fixture_id.in_(upcoming_ids), Game.fixture_id.is_(None)),
+    ).all():
+        if g.fixture_id is not None:
+            linked_by_user.setdefault(g.user_id, set()).add(g.fixture_id)
         else:
-            leagues = League.query.filter(League.competition_slug == comp_slug).all()
-        for league in leagues:
-            for lm in league.league_memberships:
-                if not getattr(lm, 'notify_missing_predictions', False):
-                    continue
-                if lm.user.deleted_at:
-                    continue
-                # Already sent a reminder for this round — only send once per round
-                if getattr(lm, 'last_missing_predictions_round', None) == reminder_round:
-                    continue
-                # Check if member has any prediction (Game) for any of the upcoming fixtures
-                has_any = False
-                for fixture in fixtures:
-                    g = Game.query.filter_by(
-                        user_id=lm.user_id,
-                        home_team=fixture.fixture_home_team,
-                        away_team=fixture.fixture_away_team,
-                    ).first()
-                    if g:
-                        has_any = True
-                        break
-                    for g in Game.query.filter_by(user_id=lm.user_id).all():
-                        if _fixture_matches_game(fixture, g.home_team, g.away_team):
-                            has_any = True
-                            break
-                    if has_any:
-                        break
-                if has_any:
-                    continue
-                link = f"{base_url}/#/predictions?league={league.id}"
-                subject = f"Reminder: submit predictions for {league.name}"
-                body = f"""Hi,
+            unlinked_by_user.setdefault(g.user_id, []).append(g)
+
+    indexes = {comp_slug: FixtureIndex(fixtures) for comp_slug, fixtures in fixtures_by_comp.items()}
+    comp_fixture_ids = {comp_slug: {f.id for f in fixtures} for comp_slug, fixtures in fixtures_by_comp.items()}
+    covered = {}  # (user_id, comp_slug) -> has a pick for one of the comp's upcoming fixtures
+    due = []
+    for lm in memberships:
+        comp_slug = league_comp[lm.league_id]
+        key = (lm.user_id, comp_slug)
+        if key not in covered:
+            covered[key] = bool(linked_by_user.get(lm.user_id, set()) & comp_fixture_ids[comp_slug]) or any(
+                indexes[comp_slug].candidates(g.home_team, g.away_team) for g in unlinked_by_user.get(lm.user_id, ())
+            )
+        if not covered[key]:
+            due.append((lm, leagues[lm.league_id], reminder_rounds[comp_slug]))
+    stats['members_missing'] = len(due)
+    return due, stats
+
+
+def _send_missing_predictions_notifications():
+    """Find leagues with fixtures in <24h, members who opted in and have no predictions for those fixtures; queue a
+    reminder email in the outbox. Each reminder and its last_missing_predictions_round marker commit together.
+    Returns (queued_count, error_message or None, stats) where stats has the sweep's counts and timings in ms
+    (query_ms: planning queries and matching, send_ms: queueing + commits)."""
+    t0 = time_module.perf_counter()
+    due, stats = _missing_prediction_reminders()
+    t1 = time_module.perf_counter()
+    base_url = (app.config.get('RESET_PASSWORD_BASE_URL') or '').strip().rstrip('/') or 'https://playfantasypredictor.com'
+    sent = 0
+    failed = 0
+    pending_commit = 0
+    for lm, league, reminder_round in due:
+        if not email_outbox.enabled():
+            failed += 1
+            continue
+        link = f"{base_url}/#/predictions?league={league.id}"
+        subject = f"Reminder: submit predictions for {league.name}"
+        body = f"""Hi,
 
 Your league "{league.name}" has fixtures in the next 24 hours and you haven't submitted predictions yet.
 
@@ -301,12 +311,27 @@ Submit your predictions here: {link}
 
 — Fantasy Predictor
 """
-                if send_notification_email(str(lm.user.email), subject, body):
-                    lm.last_missing_predictions_round = reminder_round
-                    db.session.commit()
-                    sent += 1
-                    print(f"Sent missing-predictions reminder to {lm.user.email} for league {league.name} (round {reminder_round})")
-    return sent, None
+        email_outbox.enqueue(str(lm.user.email), subject, body, kind='missing_predictions')
+        lm.last_missing_predictions_round = reminder_round
+        sent += 1
+        pending_commit += 1
+        if pending_commit >= REMINDER_COMMIT_BATCH:
+            db.session.commit()
+            pending_commit = 0
+    if pending_commit:
+        db.session.commit()
+    if sent:
+        email_outbox.notify()
+    t2 = time_module.perf_counter()
+    stats.update({
+        'sent': sent,
+        'failed': failed,
+        'query_ms': int((t1 - t0) * 1000),
+        'send_ms': int((t2 - t1) * 1000),
+        'total_ms': int((t2 - t0) * 1000),
+    })
+    print(f"Missing-predictions sweep: {stats}")
+    return sent, None, stats
 
 
 @app.route('/api/v1/notifications/send-missing-predictions', methods=['GET'])
@@ -316,10 +341,10 @@ def send_missing_predictions_cron():
     if not secret or secret != app.config.get('NOTIFICATION_CRON_SECRET'):
         return make_response({'error': 'Unauthorized'}, 401)
     try:
-        sent, err = _send_missing_predictions_notifications()
+        sent, err, stats = _send_missing_predictions_notifications()
         if err:
             return make_response({'error': err}, 500)
-        return make_response({'sent': sent}, 200)
+        return make_response({'sent': sent, 'stats': stats}, 200)
     except Exception as e:
         print(f"send_missing_predictions_cron failed: {e}")
         import traceback
@@ -352,21 +377,49 @@ def get_user_id_from_token():
     except jwt.InvalidTokenError:
         return None
 
+_UNSET = object()
+
+
+@app.before_request
+def _reset_request_identity():
+    """Identity and membership lookups are memoized on flask.g for one request; start each request empty
+    (tests may reuse one app context, and so one g, across requests)."""
+    request_g.pop('identity', None)
+
+
+def _request_identity():
+    """Per-request memo of the token's user id, active users and (user, league) memberships; None outside a request."""
+    if not has_request_context():
+        return None
+    identity = request_g.get('identity')
+    if identity is None:
+        identity = request_g.identity = {'user_id': _UNSET, 'active_users': {}, 'memberships': {}}
+    return identity
+
+
 def get_current_user_id():
-    """Get current user ID from token or session (for backward compatibility)"""
-    # Try token first (for cross-domain auth)
-    user_id = get_user_id_from_token()
-    if user_id:
-        return user_id
-    # Fall back to session (for same-domain auth)
-    return session.get('user_id')
+    """Get current user ID from token or session (for backward compatibility). The JWT is decoded once per request."""
+    identity = _request_identity()
+    if identity is not None and identity['user_id'] is not _UNSET:
+        return identity['user_id']
+    # Try token first (for cross-domain auth), then session (for same-domain auth)
+    user_id = get_user_id_from_token() or session.get('user_id')
+    if identity is not None:
+        identity['user_id'] = user_id
+    return user_id
 
 
 def get_active_user_by_id(user_id):
-    """Return the User with the given id if they exist and are not soft-deleted; else None."""
+    """Return the User with the given id if they exist and are not soft-deleted; else None. Memoized per request."""
     if not user_id:
         return None
-    return User.query.filter(User.id == user_id, User.deleted_at.is_(None)).first()
+    identity = _request_identity()
+    if identity is not None and user_id in identity['active_users']:
+        return identity['active_users'][user_id]
+    user = User.query.filter(User.id == user_id, User.deleted_at.is_(None)).first()
+    if identity is not None:
+        identity['active_users'][user_id] = user
+    return user
 
 
 def get_active_user_id_by_email(email):
@@ -431,10 +484,20 @@ def get_active_user_by_username(username):
 
 
 def get_league_membership(user_id, league_id):
-    """Return LeagueMembership for (user_id, league_id) or None."""
+    """Return LeagueMembership for (user_id, league_id) or None. Primary-key lookup (identity map first),
+    memoized per request so repeated admin/member checks in one handler cost one query."""
     if not user_id or not league_id:
         return None
-    return LeagueMembership.query.filter_by(user_id=user_id, league_id=league_id).first()
+    key = (int(user_id), int(league_id))
+    identity = _request_identity()
+    if identity is not None and key in identity['memberships']:
+        m = identity['memberships'][key]
+        if m is None or not sa_inspect(m).deleted and not sa_inspect(m).was_deleted:
+            return m
+    m = db.session.get(LeagueMembership, key)
+    if identity is not None:
+        identity['memberships'][key] = m
+    return m
 
 
 def is_league_admin(user_id, league_id):
@@ -443,41 +506,22 @@ def is_league_admin(user_id, league_id):
     return m is not None and m.role == 'admin'
 
 
-def _send_password_reset_via_sendgrid_api(to_email, from_email, from_name, subject, body, api_key):
-    """Send via SendGrid v3 HTTP API. Returns True on 202, False otherwise. Avoids SMTP timeouts."""
-    if not REQUESTS_AVAILABLE or not api_key:
-        return False
-    url = 'https://api.sendgrid.com/v3/mail/send'
-    payload = {
-        'personalizations': [{'to': [{'email': to_email}]}],
-        'from': {'email': from_email, 'name': from_name or None},
-        'subject': subject,
-        'content': [{'type': 'text/plain', 'value': body}],
-    }
-    if not payload['from']['name']:
-        del payload['from']['name']
-    headers = {'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'}
-    try:
-        r = requests.post(url, json=payload, headers=headers, timeout=15)
-        if r.status_code == 202:
-            return True
-        print(f"SendGrid API returned {r.status_code}: {r.text[:500]}")
-        return False
-    except Exception as e:
-        print(f"SendGrid API request failed [{type(e).__name__}]: {e}")
-        return False
+def _load_league_members(league):
+    """Load league.league_memberships and their users with two selectin queries instead of one lazy load per member."""
+    League.query.options(
+        selectinload(League.league_memberships).selectinload(LeagueMembership.user)
+    ).filter(League.id == league.id).all()
+    return league
 
 
-def send_password_reset_email(to_email, reset_link):
-    """Send password reset email. Prefers SendGrid HTTP API when using SendGrid (avoids SMTP timeouts)."""
-    server = (app.config.get('MAIL_SERVER') or '').strip().lower()
-    if not server:
-        return False
-    sender = app.config.get('MAIL_DEFAULT_SENDER') or app.config.get('MAIL_USERNAME') or 'noreply@localhost'
-    from_name, from_email = parseaddr(sender)
-    if not from_email:
-        from_email = sender if '@' in sender else 'noreply@localhost'
-    subject = 'Reset your password'
+def is_active_league_member(user_id, league_id):
+    """True if user_id is an active (not soft-deleted) user with a membership in the league. Indexed lookups only;
+    use instead of `user in league.members`, which loads every member."""
+    return get_active_user_by_id(user_id) is not None and get_league_membership(user_id, league_id) is not None
+
+
+def queue_password_reset_email(to_email, reset_link):
+    """Add the password reset email to the outbox (sent by email_outbox after the caller commits)."""
     body = f'''Someone requested a password reset for your account.
 
 Click the link below to set a new password (link expires in 1 hour):
@@ -486,66 +530,7 @@ Click the link below to set a new password (link expires in 1 hour):
 
 If you didn't request this, you can ignore this email.
 '''
-    # Use SendGrid HTTP API when possible — one fast HTTP request, no SMTP connection timeout
-    if 'sendgrid' in server and app.config.get('MAIL_PASSWORD'):
-        if _send_password_reset_via_sendgrid_api(to_email, from_email, from_name or 'Fantasy Predictor', subject, body, app.config['MAIL_PASSWORD']):
-            return True
-        # Fall back to SMTP if API fails (e.g. wrong key format)
-    # SMTP path
-    port = app.config.get('MAIL_PORT', 587)
-    use_tls = app.config.get('MAIL_USE_TLS', True)
-    username = app.config.get('MAIL_USERNAME')
-    password = app.config.get('MAIL_PASSWORD')
-    try:
-        with smtplib.SMTP(server, port, timeout=15) as smtp:
-            if use_tls:
-                smtp.starttls()
-            if username and password:
-                smtp.login(username, password)
-            smtp.sendmail(from_email, to_email, _make_plain_email_message(sender, to_email, subject, body))
-        return True
-    except Exception as e:
-        print(f"Password reset email failed [{type(e).__name__}]: {e}")
-        return False
-
-
-def _make_plain_email_message(sender, to_email, subject, body):
-    """Build a simple RFC-style message for SMTP."""
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = sender
-    msg['To'] = to_email
-    msg.attach(MIMEText(body, 'plain'))
-    return msg.as_string()
-
-
-def send_notification_email(to_email, subject, body):
-    """Send a transactional email (e.g. missing-predictions reminder). Uses same config as password reset."""
-    server = (app.config.get('MAIL_SERVER') or '').strip().lower()
-    if not server:
-        return False
-    sender = app.config.get('MAIL_DEFAULT_SENDER') or app.config.get('MAIL_USERNAME') or 'noreply@localhost'
-    from_name, from_email = parseaddr(sender)
-    if not from_email:
-        from_email = sender if '@' in sender else 'noreply@localhost'
-    if 'sendgrid' in server and app.config.get('MAIL_PASSWORD'):
-        if _send_password_reset_via_sendgrid_api(to_email, from_email, from_name or 'Fantasy Predictor', subject, body, app.config['MAIL_PASSWORD']):
-            return True
-    port = app.config.get('MAIL_PORT', 587)
-    use_tls = app.config.get('MAIL_USE_TLS', True)
-    username = app.config.get('MAIL_USERNAME')
-    password = app.config.get('MAIL_PASSWORD')
-    try:
-        with smtplib.SMTP(server, port, timeout=15) as smtp:
-            if use_tls:
-                smtp.starttls()
-            if username and password:
-                smtp.login(username, password)
-            smtp.sendmail(from_email, to_email, _make_plain_email_message(sender, to_email, subject, body))
-        return True
-    except Exception as e:
-        print(f"Notification email failed [{type(e).__name__}]: {e}")
-        return False
+    return email_outbox.enqueue(to_email, 'Reset your password', body, kind='password_reset')
 
 
 # Note: Renamed Predictions Resource class to avoid conflict with model
@@ -554,6 +539,18 @@ def send_notification_email(to_email, subject, body):
 # Ensure requests module is available
 try:
     import requests
+    import provider_client
+    provider_client.configure(
+        pool_size=app.config['PROVIDER_HTTP_POOL_SIZE'],
+        retries=app.config['PROVIDER_HTTP_RETRIES'],
+        backoff_factor=app.config['PROVIDER_HTTP_BACKOFF'],
+        connect_timeout=app.config['PROVIDER_HTTP_CONNECT_TIMEOUT'],
+    )
+    import provider_cache
+    provider_cache.configure(
+        directory=app.config['PROVIDER_CACHE_DIR'],
+        max_bytes=app.config['PROVIDER_CACHE_MAX_BYTES'],
+    )
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -564,13 +561,26 @@ except ImportError:
     print("Or activate the virtual environment first: pipenv shell")
     print("=" * 80)
 
-# OpenAI for Ask AI predictions (optional feature)
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    OpenAI = None
+leaderboard_cache.configure(
+    backend=app.config['LEADERBOARD_CACHE_BACKEND'],
+    url=app.config['LEADERBOARD_CACHE_URL'],
+    max_entries=app.config['LEADERBOARD_CACHE_MAX_ENTRIES'],
+    ttl_seconds=app.config['LEADERBOARD_CACHE_TTL_SECONDS'],
+)
+standings_cache.configure(
+    backend=app.config['STANDINGS_CACHE_BACKEND'],
+    url=app.config['STANDINGS_CACHE_URL'],
+    ttl_seconds=app.config['STANDINGS_CACHE_TTL_SECONDS'],
+    stale_seconds=app.config['STANDINGS_CACHE_STALE_SECONDS'],
+    locks=scheduler.RowLocks('standings:') if app.config['STANDINGS_CACHE_LOCK'] == 'database' else None,
+)
+
+# Ask AI predictions (optional feature): OpenAI, or the local stand-in for offline use
+ai_suggestions.configure(
+    backend=app.config['AI_SUGGESTIONS_BACKEND'],
+    api_key=os.getenv('OPENAI_API_KEY') or '',
+    model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+)
 
 # Views go here!
 class Users(Resource):
@@ -754,6 +764,17 @@ def _fixture_has_started(fixture, now=None):
     return now >= kickoff
 
 
+def _pick_result(pred_home, pred_away, actual_home, actual_away):
+    """Win (exact score), Draw (right outcome) or Loss for a pick against a scored fixture; None if a score is missing."""
+    if pred_home is None or pred_away is None or actual_home is None or actual_away is None:
+        return None
+    if pred_home == actual_home and pred_away == actual_away:
+        return 'Win'
+    pred_winner = 'home' if pred_home > pred_away else ('away' if pred_away > pred_home else 'draw')
+    actual_winner = 'home' if actual_home > actual_away else ('away' if actual_away > actual_home else 'draw')
+    return 'Draw' if pred_winner == actual_winner else 'Loss'
+
+
 def _compute_game_result(game, fixture, now=None):
     """Return Win/Draw/Loss, or None if the fixture is not scoreable yet (e.g. pre-kickoff ESPN 0-0)."""
     if not fixture or fixture.actual_home_score is None or fixture.actual_away_score is None:
@@ -762,13 +783,26 @@ def _compute_game_result(game, fixture, now=None):
         return None
     if not _fixture_has_started(fixture, now=now):
         return None
-    pred_home, pred_away = game.home_team_score, game.away_team_score
-    actual_home, actual_away = fixture.actual_home_score, fixture.actual_away_score
-    if pred_home == actual_home and pred_away == actual_away:
-        return 'Win'
-    pred_winner = 'home' if pred_home > pred_away else ('away' if pred_away > pred_home else 'draw')
-    actual_winner = 'home' if actual_home > actual_away else ('away' if actual_away > actual_home else 'draw')
-    return 'Draw' if pred_winner == actual_winner else 'Loss'
+    return _pick_result(game.home_team_score, game.away_team_score, fixture.actual_home_score, fixture.actual_away_score)
+
+
+def _score_pick_columns(pred_home, pred_away, pick_fixture_ids, fixtures_by_id, now=None):
+    """game_result (Win/Draw/Loss/None) per pick, scored in one columnar pass (scoring.score_picks) with the same
+    rule as _compute_game_result. The pick columns come straight from a column query (see _rescore_fixtures);
+    fixture columns are built once per fixture. Picks held as ORM objects score faster one by one with
+    _compute_game_result: gathering their columns costs more than the kernel saves."""
+    fixtures = list(fixtures_by_id.values())
+    slots = {fid: i for i, fid in enumerate(fixtures_by_id)}
+    fixture_idx = [slots[fid] for fid in pick_fixture_ids]
+    started = scoring.fixtures_started(
+        [f.fixture_date for f in fixtures], [bool(f.is_completed) for f in fixtures], now=now)
+    codes = scoring.score_picks(
+        pred_home, pred_away,
+        scoring.take([f.actual_home_score for f in fixtures], fixture_idx),
+        scoring.take([f.actual_away_score for f in fixtures], fixture_idx),
+        scoring.take(started, fixture_idx, dtype=bool),
+    )
+    return scoring.result_names(codes)
 
 
 def _fixture_scoreable(fixture, now=None):
@@ -778,6 +812,217 @@ def _fixture_scoreable(fixture, now=None):
     return _fixture_has_started(fixture, now=now)
 
 
+def _mark_standings_dirty(competition_slug):
+    """Remember a competition whose results changed; _refresh_dirty_standings() picks it up after commit."""
+    db.session.info.setdefault('standings_dirty_competitions', set()).add(competition_slug or 'eng.1')
+
+
+def _mark_member_standings_dirty(competition_slug, user_ids):
+    """Remember members whose standings in competition_slug's leagues changed (narrower than _mark_standings_dirty)."""
+    db.session.info.setdefault('standings_dirty_members', {}).setdefault(competition_slug or 'eng.1', set()).update(user_ids)
+
+
+def _mark_results_dirty(fixture):
+    """Flag a fixture for rescoring in the caller's transaction (fixtures.results_pending) and remember it so
+    _refresh_dirty_standings() rescores it right after commit. The rescore-results job picks up any left over."""
+    fixture.results_pending = True
+    db.session.info.setdefault('results_dirty_fixtures', []).append(fixture)
+    fixture_round = _as_round(fixture.fixture_round)
+    if fixture_round is not None:
+        # Earliest changed round per competition: closed rounds from there on are re-snapshotted after commit
+        rounds = db.session.info.setdefault('results_dirty_rounds', {})
+        comp_slug = fixture.competition_slug or 'eng.1'
+        rounds[comp_slug] = min(fixture_round, rounds.get(comp_slug, fixture_round))
+
+
+# Attribute changes on these models alter some league's leaderboard output (see _leaderboard_changes_in_flush)
+_LEADERBOARD_FIXTURE_ATTRS = ('actual_home_score', 'actual_away_score', 'is_completed', 'fixture_date', 'fixture_round',
+                              'competition_slug', 'fixture_home_team', 'fixture_away_team')
+_LEADERBOARD_LEAGUE_ATTRS = ('leaderboard_scope', 'season_started_at', 'competition_slug', 'format', 'created_at')
+
+
+def _bump_leaderboard_versions(connection, league_ids=(), user_ids=(), competition_slugs=()):
+    """Increment leagues.leaderboard_version for the given leagues, every league of user_ids and every league
+    playing competition_slugs (eng.1 includes legacy NULL) on connection, inside the caller's transaction."""
+    conditions = []
+    if league_ids:
+        conditions.append(League.id.in_(sorted(league_ids)))
+    if user_ids:
+        conditions.append(League.id.in_(
+            select(LeagueMembership.league_id).where(LeagueMembership.user_id.in_(sorted(user_ids))).scalar_subquery()))
+    if competition_slugs:
+        conditions.append(League.competition_slug.in_(sorted(competition_slugs)))
+        if 'eng.1' in competition_slugs:
+            conditions.append(League.competition_slug.is_(None))
+    if conditions:
+        connection.execute(
+            update(League.__table__).where(or_(*conditions))
+            .values(leaderboard_version=League.__table__.c.leaderboard_version + 1)
+        )
+
+
+def _changed(obj, attrs):
+    state = sa_inspect(obj)
+    return any(state.attrs[a].history.has_changes() for a in attrs)
+
+
+def _mark_leaderboard_changed(session, league_ids=(), user_ids=(), competitions=()):
+    """Remember leagues (directly, through a member, or through their competition) whose leaderboard output the
+    current transaction changes; _bump_changed_leaderboards() bumps them once at commit."""
+    changes = session.info.setdefault('leaderboard_changes', (set(), set(), set()))
+    changes[0].update(league_ids)
+    changes[1].update(user_ids)
+    changes[2].update(competitions)
+
+
+@event.listens_for(db.session, 'after_flush')
+def _leaderboard_changes_in_flush(session, flush_context):
+    """Collect every league whose leaderboard output this flush changes: fixtures in its competition (scores,
+    kickoff, round), a member's predictions, memberships (join, leave, display name, backfill), league settings,
+    stored standings, round closes and week winners. Bulk query updates bypass this; the rescoring engine's
+    game_result writes are followed by league_standings refreshes, which do not."""
+    league_ids, user_ids, competitions = set(), set(), set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        is_new_or_deleted = obj in session.new or obj in session.deleted
+        if isinstance(obj, Fixture):
+            if is_new_or_deleted or _changed(obj, _LEADERBOARD_FIXTURE_ATTRS):
+                competitions.add(obj.competition_slug or 'eng.1')
+        elif isinstance(obj, Game):
+            if obj.user_id is not None and (is_new_or_deleted or session.is_modified(obj, include_collections=False)):
+                user_ids.add(obj.user_id)
+        elif isinstance(obj, (LeagueMembership, LeagueStanding, LeagueWeekWinner, LeagueRoundClose)):
+            if obj.league_id is not None and (is_new_or_deleted or session.is_modified(obj, include_collections=False)):
+                league_ids.add(obj.league_id)
+        elif isinstance(obj, League) and obj.id is not None and not is_new_or_deleted:
+            if _changed(obj, _LEADERBOARD_LEAGUE_ATTRS):
+                league_ids.add(obj.id)
+        elif isinstance(obj, User) and obj.id is not None and not is_new_or_deleted:
+            if _changed(obj, ('deleted_at',)):
+                user_ids.add(obj.id)
+    if league_ids or user_ids or competitions:
+        _mark_leaderboard_changed(session, league_ids, user_ids, competitions)
+
+
+@event.listens_for(db.session, 'before_commit')
+def _bump_changed_leaderboards(session):
+    """One leaderboard_version UPDATE per transaction, at commit: an UPDATE per flush held the league rows locked
+    for the rest of the transaction and serialized concurrent writers (e.g. two members saving picks)."""
+    session.flush()  # before_commit runs ahead of commit's own flush; collect its changes first
+    changes = session.info.pop('leaderboard_changes', None)
+    if changes and any(changes):
+        _bump_leaderboard_versions(session.connection(), *changes)
+
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def _leaderboard_transaction_end(session):
+    session.info.pop('leaderboard_changes', None)
+
+
+RESCORE_CHUNK_SIZE = 500
+
+
+def _rescore_fixtures(fixture_ids=None, now=None):
+    """Rescoring engine: recompute games.game_result for every prediction linked to fixtures flagged
+    results_pending (all of them, or only fixture_ids), and mark the pickers' league standings dirty.
+
+    Work is proportional to the picks on those fixtures: per chunk, one UPDATE claims the flags (locking the
+    rows, so a concurrent score write re-flags after we commit), one query loads the fixtures, one the picks
+    (columns only) and one executemany writes the changed results. Legacy unlinked picks are matched by team
+    names: the distinct unlinked team pairs are loaded once, and per chunk only the picks on pairs matching a
+    chunk fixture are loaded, scored (see _unlinked_pick_fixture) and written the same way, and their members
+    marked too. Returns (fixtures rescored, games updated)."""
+    q = db.session.query(Fixture.id).filter(Fixture.results_pending.is_(True))
+    if fixture_ids is not None:
+        fixture_ids = [fid for fid in fixture_ids if fid is not None]
+        if not fixture_ids:
+            return 0, 0
+        q = q.filter(Fixture.id.in_(fixture_ids))
+    pending = sorted(fid for (fid,) in q.all())
+    if not pending:
+        return 0, 0
+    unlinked_pairs = None
+    rescored = updated = 0
+    for i in range(0, len(pending), RESCORE_CHUNK_SIZE):
+        chunk = pending[i:i + RESCORE_CHUNK_SIZE]
+        claimed = Fixture.query.filter(Fixture.id.in_(chunk), Fixture.results_pending.is_(True)).update(
+            {'results_pending': False}, synchronize_session=False)
+        if not claimed:
+            db.session.rollback()
+            continue
+        fixtures = {f.id: f for f in Fixture.query.filter(Fixture.id.in_(chunk)).populate_existing().all()}
+        picks = db.session.query(
+            Game.id, Game.user_id, Game.fixture_id, Game.home_team_score, Game.away_team_score, Game.game_result,
+        ).filter(Game.fixture_id.in_(chunk)).all()
+        results = _score_pick_columns(
+            [p.home_team_score for p in picks], [p.away_team_score for p in picks], [p.fixture_id for p in picks],
+            fixtures, now=now)
+        changes, legacy_changes = [], []
+        pickers = {}
+        for (game_id, user_id, fixture_id, _, _, stored), result in zip(picks, results):
+            if stored != result:
+                changes.append({'id': game_id, 'game_result': result})
+            pickers.setdefault(fixtures[fixture_id].competition_slug or 'eng.1', set()).add(user_id)
+        if changes:
+            db.session.bulk_update_mappings(Game, changes)
+        if unlinked_pairs is None:
+            unlinked_pairs = db.session.query(Game.home_team, Game.away_team).filter(
+                Game.fixture_id.is_(None), Game.user_id.isnot(None)).distinct().all()
+        index = FixtureIndex(fixtures.values()) if unlinked_pairs else None
+        pairs = [(h, a) for h, a in (unlinked_pairs or ()) if index.candidates(h, a)]
+        legacy = db.session.query(
+            Game.id, Game.user_id, Game.home_team, Game.away_team, Game.game_week,
+            Game.home_team_score, Game.away_team_score, Game.game_result,
+        ).filter(Game.fixture_id.is_(None), Game.user_id.isnot(None),
+                 tuple_(Game.home_team, Game.away_team).in_(pairs)).all() if pairs else []
+        legacy_fixtures = [_unlinked_pick_fixture(p, index.candidates(p.home_team, p.away_team)) for p in legacy]
+        scored = [(p, f) for p, f in zip(legacy, legacy_fixtures) if f is not None]
+        legacy_results = _score_pick_columns(
+            [p.home_team_score for p, _ in scored], [p.away_team_score for p, _ in scored], [f.id for _, f in scored],
+            fixtures, now=now)
+        for (pick, _), result in zip(scored, legacy_results):
+            if pick.game_result != result:
+                legacy_changes.append({'id': pick.id, 'game_result': result})
+        for pick in legacy:
+            for f in index.candidates(pick.home_team, pick.away_team):
+                pickers.setdefault(f.competition_slug or 'eng.1', set()).add(pick.user_id)
+        if legacy_changes:
+            db.session.bulk_update_mappings(Game, legacy_changes)
+        for comp_slug in {f.competition_slug or 'eng.1' for f in fixtures.values()}:
+            _mark_member_standings_dirty(comp_slug, pickers.get(comp_slug, set()))
+        db.session.commit()
+        rescored += len(fixtures)
+        updated += len(changes) + len(legacy_changes)
+    return rescored, updated
+
+
+def _unlinked_pick_fixture(pick, candidates):
+    """The candidate fixture an unlinked pick is scored against, with _link_game_fixtures' rules: a dated pick
+    takes the closest kickoff within the alignment window, an undated one only an unambiguous match."""
+    if pick.game_week is None:
+        return candidates[0] if len(candidates) == 1 else None
+    aligned = [f for f in candidates if _game_fixture_dates_align(pick, f)]
+    g_dt = _normalize_datetime_for_compare(pick.game_week)
+    return min(aligned, key=lambda f: (abs((_normalize_datetime_for_compare(f.fixture_date) - g_dt).total_seconds()), f.id),
+               default=None)
+
+
+def _set_fixture_result(fixture, home_score, away_score, is_completed):
+    """Write actual scores and completion on a fixture. Returns True (and flags the fixture for rescoring, which
+    marks its pickers' standings dirty) when anything changed."""
+    changed = (
+        fixture.actual_home_score != home_score
+        or fixture.actual_away_score != away_score
+        or bool(fixture.is_completed) != bool(is_completed)
+    )
+    fixture.actual_home_score = home_score
+    fixture.actual_away_score = away_score
+    fixture.is_completed = is_completed
+    if changed:
+        _mark_results_dirty(fixture)
+    return changed
+
+
 def _lowest_incomplete_fixture_round(comp_filter, season_start=None):
     """Smallest fixture_round with at least one non-completed fixture; None if all complete."""
     from sqlalchemy import distinct
@@ -810,38 +1055,69 @@ def get_competitions():
     return make_response({'competitions': SUPPORTED_COMPETITIONS}, 200)
 
 
-def _fetch_standings_data():
-    """Fetch current Premier League standings; returns (standings_list, matchweek) or (None, None) on error."""
+def _parse_pulselive_standings(data):
+    """Pulselive standings payload -> (standings_list, matchweek)."""
+    tables = data.get('tables') or []
+    entries = tables[0].get('entries', []) if tables else []
+    matchweek = data.get('matchweek')
+    standings = []
+    for e in entries:
+        team = e.get('team') or {}
+        overall = e.get('overall') or {}
+        standings.append({
+            'position': overall.get('position'),
+            'team': team.get('name') or team.get('shortName') or '—',
+            'played': overall.get('played', 0),
+            'won': overall.get('won', 0),
+            'drawn': overall.get('drawn', 0),
+            'lost': overall.get('lost', 0),
+            'goalsFor': overall.get('goalsFor', 0),
+            'goalsAgainst': overall.get('goalsAgainst', 0),
+            'goalDifference': (overall.get('goalsFor', 0) or 0) - (overall.get('goalsAgainst', 0) or 0),
+            'points': overall.get('points', 0),
+        })
+    return standings, matchweek
+
+
+def _fetch_standings_data(url=None):
+    """Fetch current Premier League standings; returns (standings_list, matchweek) or (None, None) on error.
+    Only the configured STANDINGS_API_URL goes through provider_cache; an override url (?api_url=) is fetched
+    directly so request-supplied URLs are never written to the on-disk cache."""
     if not REQUESTS_AVAILABLE:
         return None, None
     try:
-        resp = requests.get(STANDINGS_API_URL, headers={'Accept': 'application/json'}, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        tables = data.get('tables') or []
-        entries = tables[0].get('entries', []) if tables else []
-        matchweek = data.get('matchweek')
-        standings = []
-        for e in entries:
-            team = e.get('team') or {}
-            overall = e.get('overall') or {}
-            standings.append({
-                'position': overall.get('position'),
-                'team': team.get('name') or team.get('shortName') or '—',
-                'played': overall.get('played', 0),
-                'won': overall.get('won', 0),
-                'drawn': overall.get('drawn', 0),
-                'lost': overall.get('lost', 0),
-                'goalsFor': overall.get('goalsFor', 0),
-                'goalsAgainst': overall.get('goalsAgainst', 0),
-                'goalDifference': (overall.get('goalsFor', 0) or 0) - (overall.get('goalsAgainst', 0) or 0),
-                'points': overall.get('points', 0),
-            })
-        return standings, matchweek
+        if url and url != STANDINGS_API_URL:
+            resp = provider_client.get(url, headers={'Accept': 'application/json'}, timeout=15)
+            resp.raise_for_status()
+            return _parse_pulselive_standings(resp.json())
+        feed = provider_cache.fetch(STANDINGS_API_URL, headers={'Accept': 'application/json'}, timeout=15)
+        feed.raise_for_status()
+        return provider_cache.parsed(feed, _parse_pulselive_standings)
     except Exception:
         return None, None
 
 
+def _load_standings_payload(comp, url=None):
+    """Standings response body for a competition entry from its provider, or None if the fetch failed."""
+    if comp and comp.get('source') == 'football_data' and comp.get('football_data_code'):
+        standings_list, comp_name = _fetch_standings_football_data(comp['football_data_code'])
+        if standings_list is None:
+            return None
+        return {'matchweek': None, 'standings': standings_list, 'competition_name': comp_name or comp.get('name', 'League')}
+    standings_list, matchweek = _fetch_standings_data(url)
+    if standings_list is None:
+        return None
+    return {'matchweek': matchweek, 'standings': standings_list, 'competition_name': 'Premier League'}
+
+
+def _cached_standings(competition=None):
+    """Standings body through standings_cache (stale-while-revalidate, last good on provider failure): the
+    football-data.org table for a competition slug, or the Pulselive Premier League table when competition is None.
+    None when no table could be loaded."""
+    comp = next((c for c in SUPPORTED_COMPETITIONS if c.get('slug') == competition), None) if competition else None
+    return standings_cache.get(competition or 'pulselive', lambda: _load_standings_payload(comp))
+
+
 def _fetch_standings_football_data(competition_code):
     """Fetch standings from football-data.org for a competition (e.g. BL1, SA). Returns (standings_list, competition_name) or (None, None)."""
     api_key = (os.getenv('FOOTBALL_DATA_ORG_API_KEY') or '').strip()
@@ -850,11 +1126,15 @@ def _fetch_standings_football_data(competition_code):
     url = f'{FOOTBALL_DATA_ORG_BASE}/competitions/{competition_code}/standings'
     headers = {'X-Auth-Token': api_key, 'User-Agent': 'FantasyPredictor/1.0'}
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException:
+        feed = provider_cache.fetch(url, headers=headers, timeout=15)
+        feed.raise_for_status()
+        return provider_cache.parsed(feed, _parse_football_data_standings)
+    except (requests.RequestException, ValueError):
         return None, None
+
+
+def _parse_football_data_standings(data):
+    """football-data.org standings payload -> (standings_list, competition_name)."""
     competition_name = (data.get('competition') or {}).get('name') or 'League'
     standings_raw = data.get('standings') or []
     # League has one entry (type TOTAL); LEAGUE_CUP has multiple (groups). Take first table.
@@ -896,59 +1176,28 @@ def _fetch_standings_football_data(competition_code):
 
 @app.route('/api/v1/standings', methods=['GET'])
 def get_standings():
-    """Fetch league table from external API. Query: ?competition=slug (default eng.1). No standings for fifa.world."""
+    """League table from the external provider, via standings_cache. Query: ?competition=slug (default eng.1).
+    No standings for fifa.world."""
     if not REQUESTS_AVAILABLE:
         return make_response({'error': 'Standings unavailable (requests not available).'}, 503)
     competition = (request.args.get('competition') or 'eng.1').strip()
     if competition == 'fifa.world':
         return make_response({'standings': [], 'competition_name': 'FIFA World Cup', 'matchweek': None}, 200)
-    try:
-        comp = next((c for c in SUPPORTED_COMPETITIONS if c.get('slug') == competition), None)
-        if comp and comp.get('source') == 'football_data' and comp.get('football_data_code'):
-            standings_list, comp_name = _fetch_standings_football_data(comp['football_data_code'])
-            if standings_list is not None:
-                return make_response({
-                    'matchweek': None,
-                    'standings': standings_list,
-                    'competition_name': comp_name or comp.get('name', 'League'),
-                }, 200)
+    comp = next((c for c in SUPPORTED_COMPETITIONS if c.get('slug') == competition), None)
+    if comp and comp.get('source') == 'espn':
+        # ESPN leagues (La Liga, Ligue 1, MLS): no standings API in this app
+        return make_response({'standings': [], 'competition_name': comp.get('name', 'League'), 'matchweek': None}, 200)
+    if comp and comp.get('source') == 'football_data' and comp.get('football_data_code'):
+        payload = _cached_standings(competition)
+        if payload is None:
             return make_response({'error': 'Could not fetch standings (check FOOTBALL_DATA_ORG_API_KEY or competition has no table).', 'standings': [], 'competition_name': comp.get('name', '')}, 502)
-        if comp and comp.get('source') == 'espn':
-            # ESPN leagues (La Liga, Ligue 1, MLS): no standings API in this app
-            return make_response({'standings': [], 'competition_name': comp.get('name', 'League'), 'matchweek': None}, 200)
-        # Premier League (eng.1 or default)
-        url = request.args.get('api_url') or STANDINGS_API_URL
-        resp = requests.get(url, headers={'Accept': 'application/json'}, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        tables = data.get('tables') or []
-        entries = tables[0].get('entries', []) if tables else []
-        matchweek = data.get('matchweek')
-        standings = []
-        for e in entries:
-            team = e.get('team') or {}
-            overall = e.get('overall') or {}
-            standings.append({
-                'position': overall.get('position'),
-                'team': team.get('name') or team.get('shortName') or '—',
-                'played': overall.get('played', 0),
-                'won': overall.get('won', 0),
-                'drawn': overall.get('drawn', 0),
-                'lost': overall.get('lost', 0),
-                'goalsFor': overall.get('goalsFor', 0),
-                'goalsAgainst': overall.get('goalsAgainst', 0),
-                'goalDifference': (overall.get('goalsFor', 0) or 0) - (overall.get('goalsAgainst', 0) or 0),
-                'points': overall.get('points', 0),
-            })
-        return make_response({
-            'matchweek': matchweek,
-            'standings': standings,
-            'competition_name': 'Premier League',
-        }, 200)
-    except requests.RequestException as e:
-        return make_response({'error': f'Could not fetch standings: {str(e)}'}, 502)
-    except (KeyError, IndexError, TypeError) as e:
-        return make_response({'error': f'Invalid standings data: {str(e)}'}, 502)
+        return make_response(payload, 200)
+    # Premier League (eng.1 or default); an ?api_url= override is fetched directly, not cached
+    api_url = request.args.get('api_url')
+    payload = _load_standings_payload(None, api_url) if api_url else _cached_standings()
+    if payload is None:
+        return make_response({'error': 'Could not fetch standings from the provider.'}, 502)
+    return make_response(payload, 200)
 
 @app.route('/api/v1/fixtures/rounds', methods=['GET'])
 def get_available_rounds():
@@ -1092,9 +1341,10 @@ def repair_fixture_completed():
                 or_(Fixture.is_completed == False, Fixture.is_completed.is_(None))
             ).all()
             for f in to_fix:
-                f.is_completed = True
+                _set_fixture_result(f, f.actual_home_score, f.actual_away_score, True)
                 count += 1
             db.session.commit()
+            _refresh_dirty_standings()
             return make_response({
                 'message': f'Marked {count} fixture(s) in round {force_round} as completed.',
                 'updated': count,
@@ -1107,9 +1357,10 @@ def repair_fixture_completed():
             or_(Fixture.is_completed == False, Fixture.is_completed.is_(None))
         ).all()
         for f in to_fix:
-            f.is_completed = True
+            _set_fixture_result(f, f.actual_home_score, f.actual_away_score, True)
             count += 1
         db.session.commit()
+        _refresh_dirty_standings()
         return make_response({
             'message': f'Marked {count} fixture(s) as completed (had scores but is_completed was false).',
             'updated': count
@@ -1157,35 +1408,76 @@ ESPN_MAX_ROUNDS = {
 WORLD_CUP_DAY_TZ = timezone(timedelta(hours=-7))
 
 
-def _normalize_team_name_for_match(name):
-    """Normalize team name for deduplication: casing, accents (Curaçao/Curcao), umlauts (München/Munich), etc."""
-    if not name or not isinstance(name, str):
-        return ''
-    s = name.strip().lower()
-    # Strip accents (Curaçao -> curacao, Iran/New Zealand already ascii)
-    s = unicodedata.normalize('NFKD', s)
-    s = ''.join(c for c in s if not unicodedata.combining(c))
-    # Umlauts -> ascii so München matches Munich
-    for char, repl in [('ü', 'ue'), ('ö', 'oe'), ('ä', 'ae'), ('ß', 'ss')]:
-        s = s.replace(char, repl)
-    # Drop common prefixes so "FC Bayern München" and "Bayern Munich" match
-    for prefix in ('fc ', 'afc ', 'ssc ', 'sc ', 'cf ', 'fk ', 'real ', 'atletico '):
-        if s.startswith(prefix):
-            s = s[len(prefix):].strip()
-    # Drop common suffixes so "Chelsea FC" and "Chelsea" match (football-data.org uses suffix style)
-    for suffix in (' fc', ' fc.', ' afc', ' afc.'):
-        if s.endswith(suffix):
-            s = s[:-len(suffix)].strip()
-    # Place-name variants (German vs English)
-    s = s.replace('muenchen', 'munich')
-    s = s.replace('moenchengladbach', 'munchengladbach')
-    s = s.replace('&', ' and ')
-    while '  ' in s:
-        s = s.replace('  ', ' ')
-    return s.strip()
-
-
-def _propagate_fixture_team_names_to_games(old_home, old_away, new_home, new_away, fixture_date=None):
+_team_registry_loaded = False
+
+
+def _load_team_registry():
+    """Load teams/team_aliases into the in-process matcher so every spelling of a team resolves to its id.
+    Returns the number of aliases loaded; keeps the built-in alias list if the registry is unavailable."""
+    global _team_registry_loaded
+    try:
+        rows = db.session.query(TeamAlias.alias, TeamAlias.team_id, Team.competition_slug).join(Team).all()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Team registry not loaded (using built-in aliases): {e}")
+        return 0
+    if rows:
+        set_team_registry(rows)
+    _team_registry_loaded = True
+    return len(rows)
+
+
+def _register_team_spellings(names, competition_slug, source):
+    """Add provider spellings not yet in the registry (attached to the team with the same match key in the
+    competition, else a new team). Rows ride on the caller's sync commit; failures never break the sync. The
+    in-process registry learns the new spellings only once that commit succeeds (_publish_team_aliases)."""
+    if not _team_registry_loaded and not _load_team_registry():
+        return 0
+    learned = []  # (alias, team id, competition) for the in-process registry after commit
+    match_keys = {}  # (competition, match key) -> team id for spellings added in this call
+    added = 0
+    try:
+        with db.session.begin_nested():
+            for raw in sorted({(n or '').strip() for n in names} - {''}):
+                alias = _normalize_team_name(raw)
+                if is_registered_spelling(raw) or any(a == alias for a, _t, _c in learned):
+                    continue
+                existing = TeamAlias.query.filter_by(alias=alias).first()  # registered by another worker
+                if existing:
+                    learned.append((alias, existing.team_id, competition_slug))
+                    continue
+                team_id = registered_team_for(raw, competition_slug)
+                if team_id is None:
+                    team_id = match_keys.get((competition_slug or '', _normalize_team_name_for_match(raw)))
+                if team_id is None:
+                    team = Team(competition_slug=competition_slug, canonical_name=raw)
+                    db.session.add(team)
+                    db.session.flush()
+                    team_id = team.id
+                db.session.add(TeamAlias(team_id=team_id, alias=alias, source=source))
+                db.session.flush()
+                learned.append((alias, team_id, competition_slug))
+                match_keys.setdefault((competition_slug or '', _normalize_team_name_for_match(alias)), team_id)
+                added += 1
+    except Exception as e:
+        print(f"Team registry update skipped for {competition_slug}: {e}")
+        return 0
+    db.session.info.setdefault('team_aliases_learned', []).extend(learned)
+    return added
+
+
+@event.listens_for(db.session, 'after_commit')
+def _publish_team_aliases(session):
+    for alias, team_id, competition_slug in session.info.pop('team_aliases_learned', ()):
+        add_team_alias(alias, team_id, competition_slug)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_team_aliases(session):
+    session.info.pop('team_aliases_learned', None)
+
+
+def _propagate_fixture_team_names_to_games(old_home, old_away, new_home, new_away, fixture_date=None, competition_slug=None):
     """Update prediction rows when sync replaces placeholder team names (e.g. playoff path winners)."""
     if not old_home or not old_away:
         return
@@ -1203,6 +1495,18 @@ def _propagate_fixture_team_names_to_games(old_home, old_away, new_home, new_awa
                 continue
         game.home_team = new_home
         game.away_team = new_away
+        _mark_standings_dirty(competition_slug)
+
+
+def _note_provider_feeds(feeds, consumer):
+    """Remember feeds applied in this session; _mark_provider_feeds_processed() records them after commit."""
+    db.session.info.setdefault('provider_feeds', []).extend((f, consumer) for f in feeds)
+
+
+def _mark_provider_feeds_processed():
+    """Call after committing a sync: later syncs skip these feed bodies while they stay unchanged."""
+    for feed, consumer in db.session.info.pop('provider_feeds', None) or []:
+        provider_cache.mark_processed(feed, consumer)
 
 
 def _parse_bool_param(val):
@@ -1213,15 +1517,263 @@ def _parse_bool_param(val):
     return False
 
 
+def _utc_day(dt):
+    dt = _normalize_datetime_for_compare(dt)
+    return dt.astimezone(timezone.utc).date() if dt is not None else None
+
+
+class _FixtureSyncIndex:
+    """Existing fixtures of one competition, hashed the way the syncs look them up: external id, exact teams +
+    kickoff or round, normalized teams + round or UTC day. One query per sync instead of up to three per match.
+
+    Fixtures inserted or edited during the sync are re-added, so later items see them just as the per-row
+    queries did through autoflush. Buckets can therefore hold entries whose key has since changed; lookups
+    recompute the key and skip them. Buckets are in id order (new rows last), like the queries' .first().
+    """
+
+    _KEYS = {
+        'external_id': lambda f: f.external_id or None,
+        'teams_date': lambda f: (f.fixture_home_team, f.fixture_away_team, _normalize_datetime_for_compare(f.fixture_date)),
+        'teams_round': lambda f: (f.fixture_home_team, f.fixture_away_team, f.fixture_round),
+        'match_round': lambda f: (
+            _normalize_team_name_for_match(f.fixture_home_team), _normalize_team_name_for_match(f.fixture_away_team),
+            f.fixture_round),
+        'match_day': lambda f: (
+            _normalize_team_name_for_match(f.fixture_home_team), _normalize_team_name_for_match(f.fixture_away_team),
+            _utc_day(f.fixture_date)),
+    }
+
+    def __init__(self, competition_slug, include_legacy=False):
+        self.competition_slug = competition_slug
+        self._buckets = {name: {} for name in self._KEYS}
+        slug_filter = Fixture.competition_slug == competition_slug
+        if include_legacy:
+            slug_filter = or_(slug_filter, Fixture.competition_slug.is_(None), Fixture.competition_slug == '')
+        for fixture in Fixture.query.filter(slug_filter).order_by(Fixture.id).all():
+            self.add(fixture)
+
+    def add(self, fixture):
+        for name, key_fn in self._KEYS.items():
+            bucket = self._buckets[name].setdefault(key_fn(fixture), [])
+            if fixture not in bucket:
+                bucket.append(fixture)
+
+    def first(self, name, key, legacy=False):
+        """First fixture whose current `name` key equals key, in this competition (legacy: NULL/'' slug)."""
+        key_fn = self._KEYS[name]
+        for fixture in self._buckets[name].get(key, ()):
+            comp = fixture.competition_slug
+            in_scope = comp in (None, '') if legacy else comp == self.competition_slug
+            if in_scope and key_fn(fixture) == key:
+                return fixture
+        return None
+
+
+_FIXTURE_SYNC_COLUMNS = (
+    'competition_slug', 'external_id', 'fixture_round', 'fixture_home_team', 'fixture_away_team',
+    'actual_home_score', 'actual_away_score', 'is_completed',
+)
+
+
+def _fixture_sync_snapshot(fixture):
+    return tuple(getattr(fixture, c) for c in _FIXTURE_SYNC_COLUMNS) + (
+        _normalize_datetime_for_compare(fixture.fixture_date),)
+
+
+def _upsert_synced_fixtures(competition_slug, items, scores_only=False, exact_match='date', include_legacy=False):
+    """Apply parsed provider matches to a competition's fixtures against one in-memory _FixtureSyncIndex.
+
+    items: dicts with external_id, home_team, away_team, fixture_date, fixture_round, home_score, away_score,
+    is_completed. Lookup order per item: external id; exact teams + kickoff (exact_match='date', ESPN) or
+    teams + round ('round', football-data.org); normalized teams in the round (or UTC day when the item has
+    no round and exact_match='date'); with include_legacy, normalized teams in the round among NULL/'' slugs.
+    Only columns whose value differs are assigned, so the single flush at the end batches UPDATEs for real
+    changes and the INSERTs for new rows. Returns (added, matched, change_set) where change_set is
+    {'added': [ids], 'updated': [ids], 'unchanged': [ids]}; it is also merged into
+    db.session.info['fixture_changes'] for work that runs after the caller commits.
+    """
+    index = _FixtureSyncIndex(competition_slug, include_legacy=include_legacy)
+    status = {}  # fixture -> 'added' | 'updated' | 'unchanged' (first 'added'/'updated' wins for duplicate items)
+    matched = 0
+    for item in items:
+        external_id = item['external_id']
+        fixture_round = item['fixture_round']
+        fixture_date = item['fixture_date']
+        existing = index.first('external_id', external_id) if external_id else None
+        if not existing:
+            if exact_match == 'date':
+                if fixture_date:
+                    existing = index.first(
+                        'teams_date', (item['home_team'], item['away_team'], _normalize_datetime_for_compare(fixture_date)))
+            else:
+                existing = index.first('teams_round', (item['home_team'], item['away_team'], fixture_round))
+        # Match by normalized names so "Iran v New Zealand" / "Iran v new zealand" and "FC Bayern München" /
+        # "Bayern Munich" merge
+        if not existing:
+            norm_home = _normalize_team_name_for_match(item['home_team'])
+            norm_away = _normalize_team_name_for_match(item['away_team'])
+            if norm_home and norm_away:
+                if fixture_round is not None:
+                    existing = index.first('match_round', (norm_home, norm_away, fixture_round))
+                    if not existing and include_legacy:
+                        existing = index.first('match_round', (norm_home, norm_away, fixture_round), legacy=True)
+                elif exact_match == 'date' and fixture_date:
+                    existing = index.first('match_day', (norm_home, norm_away, _utc_day(fixture_date)))
+        if existing:
+            before = _fixture_sync_snapshot(existing)
+            if scores_only:
+                _set_fixture_result(existing, item['home_score'], item['away_score'], item['is_completed'])
+            else:
+                old_home, old_away = existing.fixture_home_team, existing.fixture_away_team
+                if not getattr(existing, 'manual_round_override', False) and existing.fixture_round != fixture_round:
+                    existing.fixture_round = fixture_round
+                if fixture_date and _normalize_datetime_for_compare(existing.fixture_date) != fixture_date:
+                    existing.fixture_date = fixture_date
+                if existing.fixture_home_team != item['home_team']:
+                    existing.fixture_home_team = item['home_team']
+                if existing.fixture_away_team != item['away_team']:
+                    existing.fixture_away_team = item['away_team']
+                if external_id and existing.external_id != external_id:
+                    existing.external_id = external_id
+                if existing.competition_slug != competition_slug:
+                    existing.competition_slug = competition_slug
+                _set_fixture_result(existing, item['home_score'], item['away_score'], item['is_completed'])
+                _propagate_fixture_team_names_to_games(
+                    old_home, old_away, item['home_team'], item['away_team'], fixture_date,
+                    competition_slug=competition_slug)
+                index.add(existing)
+            if _fixture_sync_snapshot(existing) != before:
+                if status.get(existing) != 'added':
+                    status[existing] = 'updated'
+            else:
+                status.setdefault(existing, 'unchanged')
+            matched += 1
+        elif not scores_only:
+            new_f = Fixture(
+                competition_slug=competition_slug,
+                external_id=external_id or None,
+                fixture_round=fixture_round,
+                fixture_date=fixture_date,
+                fixture_home_team=item['home_team'],
+                fixture_away_team=item['away_team'],
+                actual_home_score=item['home_score'],
+                actual_away_score=item['away_score'],
+                is_completed=item['is_completed'],
+            )
+            db.session.add(new_f)
+            index.add(new_f)
+            status[new_f] = 'added'
+            if item['home_score'] is not None and item['away_score'] is not None:
+                _mark_standings_dirty(competition_slug)
+    db.session.flush()
+    change_set = {'added': [], 'updated': [], 'unchanged': []}
+    for fixture, kind in status.items():
+        change_set[kind].append(fixture.id)
+    recorded = db.session.info.setdefault('fixture_changes', {'added': set(), 'updated': set(), 'unchanged': set()})
+    for kind, ids in change_set.items():
+        recorded[kind].update(ids)
+    return len(change_set['added']), matched, change_set
+
+
+def _fetch_espn_scoreboards(base_url, dates, headers, concurrency=None, delay_seconds=None, feeds=None):
+    """Fetch ESPN scoreboards for many dates in parallel. Returns [(date_str, data or None)] in the order of
+    dates, so round assignment downstream is identical to a sequential fetch. A failed date yields None.
+    At most `concurrency` requests are in flight; request starts are spaced by `delay_seconds` (host politeness).
+    Responses go through provider_cache; pass a list as `feeds` to collect the successful FeedResponses."""
+    if concurrency is None:
+        concurrency = app.config.get('ESPN_FETCH_CONCURRENCY', 8)
+    if delay_seconds is None:
+        delay_seconds = app.config.get('ESPN_FETCH_DELAY_SECONDS', 0.0)
+    pacing_lock = threading.Lock()
+    next_start = [0.0]
+
+    def _fetch(date_str):
+        if delay_seconds > 0:
+            with pacing_lock:
+                now = time_module.monotonic()
+                start_at = max(now, next_start[0])
+                next_start[0] = start_at + delay_seconds
+            if start_at > now:
+                time_module.sleep(start_at - now)
+        try:
+            feed = provider_cache.fetch(f"{base_url}?dates={date_str}", headers=headers, timeout=15)
+            feed.raise_for_status()
+            data = feed.json()
+            if feeds is not None:
+                feeds.append(feed)
+            return data
+        except Exception as e:
+            print(f"ESPN sync: skip date {date_str}: {e}")
+            return None
+
+    if concurrency <= 1 or len(dates) <= 1:
+        return [(d, _fetch(d)) for d in dates]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(dates))) as pool:
+        return list(zip(dates, pool.map(_fetch, dates)))
+
+
+def _espn_scoreboard_items(day_data, date_str):
+    """ESPN scoreboard payload for one date -> fixture item dicts (no fixture_round yet) for _upsert_synced_fixtures."""
+    items = []
+    events = day_data.get('events') or []
+    for ev in events:
+        external_id = str(ev.get('id') or '')
+        comps = ev.get('competitions') or []
+        comp0 = comps[0] if comps else {}
+        competitors = comp0.get('competitors') or []
+        home_team = away_team = None
+        home_score = away_score = None
+        for c in competitors:
+            name = (c.get('team') or {}).get('displayName') or (c.get('team') or {}).get('name') or ''
+            if (c.get('homeAway') or '').lower() == 'home':
+                home_team = name
+                try:
+                    home_score = int(c.get('score')) if c.get('score') is not None else None
+                except (TypeError, ValueError):
+                    home_score = None
+            else:
+                away_team = name
+                try:
+                    away_score = int(c.get('score')) if c.get('score') is not None else None
+                except (TypeError, ValueError):
+                    away_score = None
+        if not home_team or not away_team:
+            continue
+        status = (comp0.get('status') or {}) if comp0 else {}
+        is_completed = status.get('type', {}).get('state') == 'post' or status.get('completed') is True
+        date_val = ev.get('date')
+        fixture_date = None
+        if date_val:
+            try:
+                fixture_date = datetime.fromisoformat(date_val.replace('Z', '+00:00'))
+                if fixture_date.tzinfo is None:
+                    fixture_date = fixture_date.replace(tzinfo=timezone.utc)
+            except Exception:
+                pass
+        items.append({
+            'external_id': external_id,
+            'home_team': home_team,
+            'away_team': away_team,
+            'fixture_date': fixture_date,
+            'home_score': home_score,
+            'away_score': away_score,
+            'is_completed': is_completed,
+            'date_str': date_str,
+        })
+    return items
+
+
 def _sync_fixtures_espn(league_slug, scores_only=False):
-    """Fetch fixtures from ESPN API for a given league (e.g. esp.1, fifa.world). Returns (added, updated, seen, error)."""
+    """Fetch fixtures from ESPN API for a given league (e.g. esp.1, fifa.world). Returns (added, updated, seen, error).
+    When every scoreboard is unchanged since the last committed sync of this kind, nothing is parsed or written
+    and (0, 0, 0, None) is returned."""
     comp = next((c for c in SUPPORTED_COMPETITIONS if c.get('espn_slug') == league_slug or c.get('slug') == league_slug), None)
     competition_slug = (comp or {}).get('slug') or league_slug
-    base_url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league_slug}/scoreboard"
+    base_url = f"{app.config['ESPN_API_BASE_URL']}/{league_slug}/scoreboard"
     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-    resp = requests.get(base_url, headers=headers, timeout=15)
-    resp.raise_for_status()
-    info = resp.json()
+    feed = provider_cache.fetch(base_url, headers=headers, timeout=15)
+    feed.raise_for_status()
+    info = feed.json()
     leagues_list = info.get('leagues') or []
     calendar = leagues_list[0].get('calendar') if leagues_list else []
     dates_to_fetch = []
@@ -1293,61 +1845,17 @@ def _sync_fixtures_espn(league_slug, scores_only=False):
         dates_to_fetch = [datetime.now(timezone.utc).strftime('%Y%m%d')]
     dates_to_fetch = sorted(set(dates_to_fetch))[:250]
     matches_per_round = ESPN_MATCHES_PER_ROUND.get(league_slug)
+    feeds = [feed]
+    day_results = _fetch_espn_scoreboards(base_url, dates_to_fetch, headers, feeds=feeds)
+    # Round numbers depend on every event, so the sync is all-or-nothing: skip only if no scoreboard changed.
+    consumer = 'scores' if scores_only else 'fixtures'
+    if all(f.unchanged_for(consumer) for f in feeds):
+        return 0, 0, 0, None
+    _note_provider_feeds(feeds, consumer)
     collected = []
-    for date_str in dates_to_fetch:
-        url = f"{base_url}?dates={date_str}"
-        try:
-            r = requests.get(url, headers=headers, timeout=15)
-            r.raise_for_status()
-            day_data = r.json()
-        except Exception as e:
-            print(f"ESPN sync: skip date {date_str}: {e}")
-            continue
-        events = day_data.get('events') or []
-        for ev in events:
-            external_id = str(ev.get('id') or '')
-            comps = ev.get('competitions') or []
-            comp0 = comps[0] if comps else {}
-            competitors = comp0.get('competitors') or []
-            home_team = away_team = None
-            home_score = away_score = None
-            for c in competitors:
-                name = (c.get('team') or {}).get('displayName') or (c.get('team') or {}).get('name') or ''
-                if (c.get('homeAway') or '').lower() == 'home':
-                    home_team = name
-                    try:
-                        home_score = int(c.get('score')) if c.get('score') is not None else None
-                    except (TypeError, ValueError):
-                        home_score = None
-                else:
-                    away_team = name
-                    try:
-                        away_score = int(c.get('score')) if c.get('score') is not None else None
-                    except (TypeError, ValueError):
-                        away_score = None
-            if not home_team or not away_team:
-                continue
-            status = (comp0.get('status') or {}) if comp0 else {}
-            is_completed = status.get('type', {}).get('state') == 'post' or status.get('completed') is True
-            date_val = ev.get('date')
-            fixture_date = None
-            if date_val:
-                try:
-                    fixture_date = datetime.fromisoformat(date_val.replace('Z', '+00:00'))
-                    if fixture_date.tzinfo is None:
-                        fixture_date = fixture_date.replace(tzinfo=timezone.utc)
-                except Exception:
-                    pass
-            collected.append({
-                'external_id': external_id,
-                'home_team': home_team,
-                'away_team': away_team,
-                'fixture_date': fixture_date,
-                'home_score': home_score,
-                'away_score': away_score,
-                'is_completed': is_completed,
-                'date_str': date_str,
-            })
+    for date_str, day_data in day_results:
+        if day_data is not None:
+            collected.extend(_espn_scoreboard_items(day_data, date_str))
     def _event_sort_key(x):
         fd = x['fixture_date']
         return (fd if fd else datetime.max.replace(tzinfo=timezone.utc), x['external_id'] or '')
@@ -1389,79 +1897,10 @@ def _sync_fixtures_espn(league_slug, scores_only=False):
                 item['fixture_round'] = calendar_entries_by_date.get(item['date_str'])
                 if item['fixture_round'] is None:
                     item['fixture_round'] = i + 1
-    fixtures_added = 0
-    fixtures_updated = 0
-    for item in collected:
-        external_id = item['external_id']
-        fixture_round = item['fixture_round']
-        existing = Fixture.query.filter_by(competition_slug=competition_slug, external_id=external_id).first() if external_id else None
-        if not existing:
-            existing = Fixture.query.filter(
-                Fixture.competition_slug == competition_slug,
-                Fixture.fixture_home_team == item['home_team'],
-                Fixture.fixture_away_team == item['away_team'],
-                Fixture.fixture_date == item['fixture_date']
-            ).first() if item['fixture_date'] else None
-        # Match by normalized names so "Iran v New Zealand" and "Iran v new zealand" / "Mexico v South Korea" dupes merge
-        if not existing:
-            norm_home = _normalize_team_name_for_match(item['home_team'])
-            norm_away = _normalize_team_name_for_match(item['away_team'])
-            if norm_home and norm_away:
-                if fixture_round is not None:
-                    candidates = Fixture.query.filter(
-                        Fixture.competition_slug == competition_slug,
-                        Fixture.fixture_round == fixture_round,
-                    ).all()
-                elif item.get('fixture_date'):
-                    day_start = item['fixture_date'].replace(hour=0, minute=0, second=0, microsecond=0) if hasattr(item['fixture_date'], 'replace') else item['fixture_date']
-                    day_end = day_start + timedelta(days=1) if hasattr(day_start, '__add__') else day_start
-                    candidates = Fixture.query.filter(
-                        Fixture.competition_slug == competition_slug,
-                        Fixture.fixture_date >= day_start,
-                        Fixture.fixture_date < day_end,
-                    ).all()
-                else:
-                    candidates = []
-                for c in candidates:
-                    if (_normalize_team_name_for_match(c.fixture_home_team) == norm_home and
-                            _normalize_team_name_for_match(c.fixture_away_team) == norm_away):
-                        existing = c
-                        break
-        if existing:
-            if scores_only:
-                existing.actual_home_score = item['home_score']
-                existing.actual_away_score = item['away_score']
-                existing.is_completed = item['is_completed']
-            else:
-                old_home, old_away = existing.fixture_home_team, existing.fixture_away_team
-                if not getattr(existing, 'manual_round_override', False):
-                    existing.fixture_round = fixture_round
-                if item['fixture_date']:
-                    existing.fixture_date = item['fixture_date']
-                existing.fixture_home_team = item['home_team']
-                existing.fixture_away_team = item['away_team']
-                existing.actual_home_score = item['home_score']
-                existing.actual_away_score = item['away_score']
-                existing.is_completed = item['is_completed']
-                if external_id:
-                    existing.external_id = external_id
-                _propagate_fixture_team_names_to_games(
-                    old_home, old_away, item['home_team'], item['away_team'], item.get('fixture_date'))
-            fixtures_updated += 1
-        elif not scores_only:
-            new_f = Fixture(
-                competition_slug=competition_slug,
-                external_id=external_id or None,
-                fixture_round=fixture_round,
-                fixture_date=item['fixture_date'],
-                fixture_home_team=item['home_team'],
-                fixture_away_team=item['away_team'],
-                actual_home_score=item['home_score'],
-                actual_away_score=item['away_score'],
-                is_completed=item['is_completed'],
-            )
-            db.session.add(new_f)
-            fixtures_added += 1
+    _register_team_spellings(
+        [name for item in collected for name in (item['home_team'], item['away_team'])], competition_slug, 'espn')
+    fixtures_added, fixtures_updated, _changes = _upsert_synced_fixtures(
+        competition_slug, collected, scores_only=scores_only, exact_match='date')
     return fixtures_added, fixtures_updated, fixtures_seen, None
 
 
@@ -1469,24 +1908,9 @@ def _sync_fixtures_espn(league_slug, scores_only=False):
 FOOTBALL_DATA_ORG_BASE = 'https://api.football-data.org/v4'
 
 
-def _sync_fixtures_football_data(competition_code, competition_slug, scores_only=False):
-    """Fetch fixtures from football-data.org for a competition (e.g. BL1 = Bundesliga). Returns (added, updated, seen, error)."""
-    api_key = (os.getenv('FOOTBALL_DATA_ORG_API_KEY') or '').strip()
-    if not api_key:
-        return 0, 0, 0, 'FOOTBALL_DATA_ORG_API_KEY is not set. Get a free key at https://www.football-data.org/'
-    url = f'{FOOTBALL_DATA_ORG_BASE}/competitions/{competition_code}/matches'
-    headers = {'X-Auth-Token': api_key, 'User-Agent': 'FantasyPredictor/1.0'}
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        return 0, 0, 0, str(e)
-    matches = data.get('matches') if isinstance(data, dict) else []
-    if not isinstance(matches, list):
-        return 0, 0, 0, 'Unexpected API response: no matches list'
-    fixtures_added = 0
-    fixtures_updated = 0
+def _football_data_match_items(matches):
+    """football-data.org matches list -> fixture item dicts (matchday as fixture_round) for _upsert_synced_fixtures."""
+    items = []
     for m in matches:
         if not isinstance(m, dict):
             continue
@@ -1547,78 +1971,135 @@ def _sync_fixtures_football_data(competition_code, competition_slug, scores_only
                 except (TypeError, ValueError):
                     away_score = None
         status = (m.get('status') or '').upper()
-        is_completed = status == 'FINISHED'
-        existing = Fixture.query.filter_by(competition_slug=competition_slug, external_id=external_id).first() if external_id else None
-        if not existing:
-            existing = Fixture.query.filter(
-                Fixture.competition_slug == competition_slug,
-                Fixture.fixture_home_team == home_team,
-                Fixture.fixture_away_team == away_team,
-                Fixture.fixture_round == fixture_round,
-            ).first()
-        # Match by normalized names so "FC Bayern München" vs "Bayern Munich" dedupe
-        if not existing and fixture_round is not None:
-            norm_home = _normalize_team_name_for_match(home_team)
-            norm_away = _normalize_team_name_for_match(away_team)
-            if norm_home and norm_away:
-                candidates = Fixture.query.filter(
-                    Fixture.competition_slug == competition_slug,
-                    Fixture.fixture_round == fixture_round,
-                ).all()
-                for c in candidates:
-                    if (_normalize_team_name_for_match(c.fixture_home_team) == norm_home and
-                            _normalize_team_name_for_match(c.fixture_away_team) == norm_away):
-                        existing = c
-                        break
-                # Legacy Pulselive fixtures may have competition_slug NULL or ''; match so we update instead of duplicating
-                if not existing and competition_slug == 'eng.1':
-                    legacy = Fixture.query.filter(
-                        or_(Fixture.competition_slug.is_(None), Fixture.competition_slug == ''),
-                        Fixture.fixture_round == fixture_round,
-                    ).all()
-                    for c in legacy:
-                        if (_normalize_team_name_for_match(c.fixture_home_team) == norm_home and
-                                _normalize_team_name_for_match(c.fixture_away_team) == norm_away):
-                            existing = c
-                            break
-        if existing:
-            if scores_only:
-                existing.actual_home_score = home_score
-                existing.actual_away_score = away_score
-                existing.is_completed = is_completed
-            else:
-                old_home, old_away = existing.fixture_home_team, existing.fixture_away_team
-                if not getattr(existing, 'manual_round_override', False):
-                    existing.fixture_round = fixture_round
-                if fixture_date:
-                    existing.fixture_date = fixture_date
-                existing.fixture_home_team = home_team
-                existing.fixture_away_team = away_team
-                existing.actual_home_score = home_score
-                existing.actual_away_score = away_score
-                existing.is_completed = is_completed
-                if external_id:
-                    existing.external_id = external_id
-                existing.competition_slug = competition_slug
-                _propagate_fixture_team_names_to_games(old_home, old_away, home_team, away_team, fixture_date)
-            fixtures_updated += 1
-        elif not scores_only:
-            new_f = Fixture(
-                competition_slug=competition_slug,
-                external_id=external_id or None,
-                fixture_round=fixture_round,
-                fixture_date=fixture_date,
-                fixture_home_team=home_team,
-                fixture_away_team=away_team,
-                actual_home_score=home_score,
-                actual_away_score=away_score,
-                is_completed=is_completed,
-            )
-            db.session.add(new_f)
-            fixtures_added += 1
+        items.append({
+            'external_id': external_id,
+            'home_team': home_team,
+            'away_team': away_team,
+            'fixture_date': fixture_date,
+            'fixture_round': fixture_round,
+            'home_score': home_score,
+            'away_score': away_score,
+            'is_completed': status == 'FINISHED',
+        })
+    return items
+
+
+def _sync_fixtures_football_data(competition_code, competition_slug, scores_only=False):
+    """Fetch fixtures from football-data.org for a competition (e.g. BL1 = Bundesliga). Returns (added, updated, seen, error).
+    Returns (0, 0, 0, None) without parsing when the feed is unchanged since the last committed sync of this kind."""
+    api_key = (os.getenv('FOOTBALL_DATA_ORG_API_KEY') or '').strip()
+    if not api_key:
+        return 0, 0, 0, 'FOOTBALL_DATA_ORG_API_KEY is not set. Get a free key at https://www.football-data.org/'
+    url = f'{FOOTBALL_DATA_ORG_BASE}/competitions/{competition_code}/matches'
+    headers = {'X-Auth-Token': api_key, 'User-Agent': 'FantasyPredictor/1.0'}
+    try:
+        feed = provider_cache.fetch(url, headers=headers, timeout=20)
+        feed.raise_for_status()
+        consumer = 'scores' if scores_only else 'fixtures'
+        if feed.unchanged_for(consumer):
+            return 0, 0, 0, None
+        data = feed.json()
+    except (requests.RequestException, ValueError) as e:
+        return 0, 0, 0, str(e)
+    _note_provider_feeds([feed], consumer)
+    matches = data.get('matches') if isinstance(data, dict) else []
+    if not isinstance(matches, list):
+        return 0, 0, 0, 'Unexpected API response: no matches list'
+    items = _football_data_match_items(matches)
+    _register_team_spellings(
+        [name for item in items for name in (item['home_team'], item['away_team'])], competition_slug, 'football-data')
+    # Legacy Pulselive fixtures may have competition_slug NULL or ''; match so we update instead of duplicating
+    fixtures_added, fixtures_updated, _changes = _upsert_synced_fixtures(
+        competition_slug, items, scores_only=scores_only, exact_match='round',
+        include_legacy=competition_slug == 'eng.1')
     return fixtures_added, fixtures_updated, len(matches), None
 
 
+def _live_window_fixtures(competition_slug, now=None):
+    """Fixtures a live score poll must cover: kickoff within the SCORES_LIVE_WINDOW_* window around now, or
+    kicked off within SCORES_LIVE_LOOKBACK_HOURS and not completed yet."""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    now_naive = now.astimezone(timezone.utc).replace(tzinfo=None)  # Fixture.fixture_date is stored naive UTC
+    window_start = now_naive - timedelta(minutes=app.config['SCORES_LIVE_WINDOW_BEFORE_MINUTES'])
+    window_end = now_naive + timedelta(minutes=app.config['SCORES_LIVE_WINDOW_AFTER_MINUTES'])
+    lookback_start = now_naive - timedelta(hours=app.config['SCORES_LIVE_LOOKBACK_HOURS'])
+    return Fixture.query.filter(
+        _fixture_query_competition(competition_slug),
+        Fixture.fixture_date.isnot(None),
+        or_(
+            Fixture.fixture_date.between(window_start, window_end),
+            (Fixture.fixture_date >= lookback_start) & (Fixture.fixture_date <= now_naive) & _fixture_not_completed_filter(),
+        ),
+    ).order_by(Fixture.fixture_date).all()
+
+
+def _sync_scores_live(comp, now=None):
+    """Scores-only sync limited to _live_window_fixtures: the ESPN scoreboards for their dates, or one
+    football-data.org request bounded by dateFrom/dateTo. No request at all when nothing is live.
+    Returns (added, updated, seen, error) like the full syncs (added is always 0)."""
+    competition_slug = comp['slug']
+    fixtures = _live_window_fixtures(competition_slug, now=now)
+    if not fixtures:
+        return 0, 0, 0, None
+    # A result can start counting at kickoff without any score change (pre-match 0-0 from ESPN): rescore
+    # started fixtures that still have picks without a result.
+    started = {f.id: f for f in fixtures if _fixture_scoreable(f, now=now)}
+    if started:
+        unscored = db.session.query(Game.fixture_id).filter(
+            Game.fixture_id.in_(list(started)), Game.game_result.is_(None),
+            Game.home_team_score.isnot(None), Game.away_team_score.isnot(None),
+        ).distinct()
+        for (fixture_id,) in unscored:
+            _mark_results_dirty(started[fixture_id])
+    kickoffs = [_normalize_datetime_for_compare(f.fixture_date) for f in fixtures]
+    if comp.get('source') == 'espn':
+        league_slug = comp.get('espn_slug') or competition_slug
+        base_url = f"{app.config['ESPN_API_BASE_URL']}/{league_slug}/scoreboard"
+        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        # ESPN buckets events by US Eastern day, so late-evening UTC kickoffs can sit on the previous date.
+        dates = sorted({d.strftime('%Y%m%d') for k in kickoffs for d in (k, k - timedelta(hours=5))})
+        feeds = []
+        day_results = _fetch_espn_scoreboards(base_url, dates, headers, feeds=feeds)
+        if all(f.unchanged_for('live') for f in feeds):
+            return 0, 0, 0, None
+        _note_provider_feeds(feeds, 'live')
+        items = []
+        for date_str, day_data in day_results:
+            if day_data is not None:
+                items.extend(_espn_scoreboard_items(day_data, date_str))
+        for item in items:
+            item['fixture_round'] = None
+        _added, updated, _changes = _upsert_synced_fixtures(competition_slug, items, scores_only=True, exact_match='date')
+        return 0, updated, len(items), None
+    if comp.get('source') == 'football_data':
+        api_key = (os.getenv('FOOTBALL_DATA_ORG_API_KEY') or '').strip()
+        if not api_key:
+            return 0, 0, 0, 'FOOTBALL_DATA_ORG_API_KEY is not set. Get a free key at https://www.football-data.org/'
+        code = comp.get('football_data_code') or 'BL1'
+        date_from = min(kickoffs).date().isoformat()
+        date_to = (max(kickoffs) + timedelta(days=1)).date().isoformat()
+        url = f'{FOOTBALL_DATA_ORG_BASE}/competitions/{code}/matches?dateFrom={date_from}&dateTo={date_to}'
+        headers = {'X-Auth-Token': api_key, 'User-Agent': 'FantasyPredictor/1.0'}
+        try:
+            feed = provider_cache.fetch(url, headers=headers, timeout=20)
+            feed.raise_for_status()
+            if feed.unchanged_for('live'):
+                return 0, 0, 0, None
+            data = feed.json()
+        except (requests.RequestException, ValueError) as e:
+            return 0, 0, 0, str(e)
+        _note_provider_feeds([feed], 'live')
+        matches = data.get('matches') if isinstance(data, dict) else []
+        if not isinstance(matches, list):
+            return 0, 0, 0, 'Unexpected API response: no matches list'
+        items = _football_data_match_items(matches)
+        _added, updated, _changes = _upsert_synced_fixtures(
+            competition_slug, items, scores_only=True, exact_match='round', include_legacy=competition_slug == 'eng.1')
+        return 0, updated, len(matches), None
+    return 0, 0, 0, f"Unknown sync source for {competition_slug}"
+
+
 def _sync_fixtures_for_competition_slug(comp_slug):
     """Pull fixtures for a competition slug. Returns success dict or {'error': ...}."""
     comp_slug = (comp_slug or 'eng.1').strip()
@@ -1634,6 +2115,8 @@ def _sync_fixtures_for_competition_slug(comp_slug):
             if err:
                 return {'error': err}
             db.session.commit()
+            _mark_provider_feeds_processed()
+            _refresh_dirty_standings()
             return {
                 'message': 'Fixtures synced successfully (ESPN)',
                 'source': 'espn',
@@ -1649,6 +2132,8 @@ def _sync_fixtures_for_competition_slug(comp_slug):
             if err:
                 return {'error': err}
             db.session.commit()
+            _mark_provider_feeds_processed()
+            _refresh_dirty_standings()
             return {
                 'message': 'Fixtures synced successfully (football-data.org)',
                 'source': 'football_data',
@@ -1690,6 +2175,8 @@ def sync_fixtures():
                 if err:
                     return make_response({'error': err}, 500)
                 db.session.commit()
+                _mark_provider_feeds_processed()
+                _refresh_dirty_standings()
                 return make_response({
                     'message': 'Fixtures synced successfully (ESPN)',
                     'source': 'espn',
@@ -1715,6 +2202,8 @@ def sync_fixtures():
                 if err:
                     return make_response({'error': err}, 500)
                 db.session.commit()
+                _mark_provider_feeds_processed()
+                _refresh_dirty_standings()
                 return make_response({
                     'message': 'Fixtures synced successfully (football-data.org)',
                     'source': 'football_data',
@@ -1788,7 +2277,7 @@ def sync_fixtures():
                 qs_page["_next"] = [next_token]
                 page_url = urlunparse(parsed_page._replace(query=urlencode(qs_page, doseq=True)))
 
-            resp = requests.get(page_url, headers=headers, timeout=30)
+            resp = provider_client.get(page_url, headers=headers, timeout=30)
             resp.raise_for_status()
             external_data = resp.json()
 
@@ -1850,6 +2339,7 @@ def sync_fixtures():
                 print(json.dumps(sample, indent=2, default=str)[:1000])
             print("=" * 80)
         
+        team_names_seen = set()
         for fixture_data in fixtures_data:
             fixtures_seen += 1
             # Map Premier League API fields to your Fixture model
@@ -2008,6 +2498,7 @@ def sync_fixtures():
             if not home_team or not away_team:
                 print(f"Skipping fixture due to missing team data: round={fixture_round}, home={home_team}, away={away_team}")
                 continue
+            team_names_seen.update((home_team, away_team))
             
             # Try to extract round from additional fields if still missing
             if not fixture_round:
@@ -2108,7 +2599,8 @@ def sync_fixtures():
                     existing_fixture.fixture_date = fixture_date
                 existing_fixture.fixture_home_team = home_team
                 existing_fixture.fixture_away_team = away_team
-                _propagate_fixture_team_names_to_games(old_home, old_away, home_team, away_team, fixture_date)
+                _propagate_fixture_team_names_to_games(
+                    old_home, old_away, home_team, away_team, fixture_date, competition_slug='eng.1')
                 fixtures_updated += 1
             else:
                 # Create new fixture
@@ -2122,7 +2614,9 @@ def sync_fixtures():
                 db.session.add(new_fixture)
                 fixtures_added += 1
         
+        _register_team_spellings(team_names_seen, 'eng.1', 'pulselive')
         db.session.commit()
+        _refresh_dirty_standings()
         
         return make_response({
             'message': 'Fixtures synced successfully',
@@ -2152,13 +2646,23 @@ def sync_fixtures():
         # Return JSON error response
         return make_response({'error': str(e), 'type': type(e).__name__, 'details': error_details.split('\n')[-5:]}, 500)
 
-def _fixture_for_game(game, competition_slug=None, fixtures_list=None):
+def _fixture_for_game(game, competition_slug=None, fixtures_list=None, fixture_index=None):
     """Find the fixture matching a game's home/away teams. If competition_slug is given (e.g. from
     league context), prefer the fixture in that competition so Championship/Bundesliga etc.
     fixtures are resolved correctly. Uses normalized name matching (e.g. FC Bayern München vs
     Bayern Munich) for leagues like Bundesliga.
-    Pass fixtures_list (e.g. Fixture.query.filter(...).all()) to avoid repeated DB scans when
-    resolving many games in a loop."""
+    Pass fixture_index (FixtureIndex built once from the preloaded fixtures) when resolving many
+    games in a loop: same result as scanning fixtures_list, without per-fixture string work.
+    Games linked by fixture_id resolve directly (identity-map hit when the fixture is already loaded)."""
+    linked_id = getattr(game, 'fixture_id', None)
+    if linked_id is not None:
+        linked = fixture_index.get(linked_id) if fixture_index is not None else None
+        if linked is None:
+            linked = db.session.get(Fixture, linked_id)
+        if linked is not None:
+            return linked
+    if fixture_index is not None:
+        return fixture_index.find(game.home_team, game.away_team, competition_slug)
     # If we have a pre-loaded list, use it for all fallbacks (no DB hits in loop).
     if fixtures_list is not None:
         for f in fixtures_list:
@@ -2234,11 +2738,150 @@ def _fixture_for_game(game, competition_slug=None, fixtures_list=None):
     return fixture
 
 
+def _link_game_fixtures(dry_run=False, batch_size=500):
+    """One-time backfill: set Game.fixture_id for unlinked predictions using the current name-matching rules.
+
+    Dated games link to the name-matching fixture with the closest kickoff within the usual alignment
+    window (so last season's pick is not linked to this season's rematch). Undated games link only when
+    exactly one fixture matches by name. Returns (linked, unmatched, ambiguous)."""
+    fixtures = Fixture.query.filter(Fixture.fixture_date.isnot(None)).order_by(Fixture.fixture_date).all()
+    undated_fixtures = Fixture.query.filter(Fixture.fixture_date.is_(None)).all()
+    fixture_dates = [_normalize_datetime_for_compare(f.fixture_date) for f in fixtures]
+    window = timedelta(seconds=604800)
+    linked = unmatched = ambiguous = 0
+    games = Game.query.filter(Game.fixture_id.is_(None)).order_by(Game.id).all()
+    for i, game in enumerate(games, start=1):
+        if not game.home_team or not game.away_team:
+            unmatched += 1
+            continue
+        match = None
+        if game.game_week is not None:
+            g_dt = _normalize_datetime_for_compare(game.game_week)
+            lo = bisect.bisect_left(fixture_dates, g_dt - window)
+            hi = bisect.bisect_right(fixture_dates, g_dt + window)
+            candidates = [
+                (abs((fixture_dates[j] - g_dt).total_seconds()), fixtures[j])
+                for j in range(lo, hi)
+                if _fixture_matches_game(fixtures[j], game.home_team, game.away_team)
+            ]
+            if candidates:
+                match = min(candidates, key=lambda c: (c[0], c[1].id))[1]
+        else:
+            candidates = [
+                f for f in fixtures + undated_fixtures
+                if _fixture_matches_game(f, game.home_team, game.away_team)
+            ]
+            if len(candidates) == 1:
+                match = candidates[0]
+            elif candidates:
+                ambiguous += 1
+                continue
+        if match is None:
+            unmatched += 1
+            continue
+        game.fixture_id = match.id
+        linked += 1
+        if not dry_run and i % batch_size == 0:
+            db.session.commit()
+    if dry_run:
+        db.session.rollback()
+    else:
+        db.session.commit()
+    return linked, unmatched, ambiguous
+
+
+def _reconcile_game_results(fix=False, batch_size=1000):
+    """Compare every stored games.game_result with the result computed from its fixture (linked by id, else by
+    team names like check-results). Returns {'checked', 'drift', 'samples'}; with fix=True, writes the computed
+    results and refreshes standings for affected competitions."""
+    fixtures = Fixture.query.all()
+    fixture_index = FixtureIndex(fixtures)
+    checked = drift = 0
+    samples = []
+    last_id = 0
+    while True:
+        games = Game.query.filter(Game.id > last_id).order_by(Game.id).limit(batch_size).all()
+        if not games:
+            break
+        last_id = games[-1].id
+        for game in games:
+            checked += 1
+            fixture = _fixture_for_game(game, None, fixture_index=fixture_index)
+            expected = _compute_game_result(game, fixture) if fixture else None
+            if fixture is None or game.game_result == expected:
+                continue
+            drift += 1
+            if len(samples) < 20:
+                samples.append({'game_id': game.id, 'fixture_id': fixture.id, 'stored': game.game_result, 'expected': expected})
+            if fix:
+                game.game_result = expected
+                _mark_standings_dirty(getattr(fixture, 'competition_slug', None))
+        if fix:
+            db.session.commit()
+    if fix and drift:
+        _refresh_dirty_standings()
+    return {'checked': checked, 'drift': drift, 'samples': samples}
+
+
+PREDICTIONS_PAGE_SIZE = 500
+PREDICTIONS_MAX_PAGE_SIZE = 1000
+_SERIALIZER_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'  # SerializerMixin's format, so clients see the same strings
+
+
+def _serializer_datetime(value):
+    return value.strftime(_SERIALIZER_DATETIME_FORMAT) if value is not None else None
+
+
+def _prediction_payload(game, fixture):
+    """Compact dict for one prediction: the same keys as Game.to_dict() plus the resolved fixture, without
+    SerializerMixin's per-row reflection."""
+    return {
+        'id': game.id,
+        'user_id': game.user_id,
+        'fixture_id': game.fixture_id,
+        'game_week_name': game.game_week_name,
+        'game_week': _serializer_datetime(game.game_week),
+        'home_team': game.home_team,
+        'home_team_score': game.home_team_score,
+        'away_team': game.away_team,
+        'away_team_score': game.away_team_score,
+        'game_result': game.game_result,
+        'created_at': _serializer_datetime(game.created_at),
+        'updated_at': _serializer_datetime(game.updated_at),
+        # For World Cup, round = Day 1/2/3 (calendar day index from sync)
+        'fixture': {
+            'id': fixture.id,
+            'round': fixture.fixture_round,
+            'competition_slug': fixture.competition_slug,
+            'date': fixture.fixture_date.isoformat() if fixture.fixture_date else None,
+            'is_completed': fixture.is_completed,
+            'actual_home_score': fixture.actual_home_score,
+            'actual_away_score': fixture.actual_away_score,
+        } if fixture is not None else None,
+    }
+
+
+def _season_bounds(season, comp_filter):
+    """(start, end) naive UTC for ?season=: 'current' (season of the latest fixture) or a start year (Aug 1 - Aug 1)."""
+    if season == 'current':
+        start = _current_season_start_for_competition(comp_filter)
+        return (start, None) if start is not None else (None, None)
+    year = int(season)
+    return datetime(year, 8, 1), datetime(year + 1, 8, 1)
+
+
 class PredictionsResource(Resource):
     def get(self):
-        """Get all predictions for the current user with their results.
-        Optional query: ?league_id= to resolve fixtures in that league's competition (fixes
-        Championship etc. so completed predictions show for the correct competition)."""
+        """Get the current user's predictions with their fixture and result, oldest first (by id).
+        Optional query:
+          ?league_id=  only fixtures in that league's competition (legacy unlinked picks are matched by
+                       team names within it, fixing Championship etc.)
+          ?round=      one round (for fifa.world, Day 1/2/3); defaults to the current season
+          ?season=     'current' or a start year (2025 = Aug 2025 - Jul 2026)
+          ?since=      ISO datetime; only predictions created or changed since then
+          ?limit= / ?cursor=  page size (default 500) and the next_cursor from the previous page
+        Fixture data comes from one join on Game.fixture_id. Read-only: game_result is written when scores
+        or picks change (_rescore_fixtures, prediction save), see flask reconcile-game-results."""
         try:
             user_id = get_current_user_id()
             
@@ -2251,63 +2894,69 @@ class PredictionsResource(Resource):
                 league = db.session.get(League, league_id)
                 if league and getattr(league, 'competition_slug', None):
                     competition_slug = league.competition_slug
-            
-            # Get all user's predictions, sorted by date (oldest first)
-            user_games = Game.query.filter_by(user_id=user_id).order_by(Game.game_week.asc()).all()
-            
-            # Preload fixtures once to avoid N+1: each _fixture_for_game would otherwise do Fixture.query.all()
             comp_filter = _fixture_query_competition(competition_slug) if competition_slug else None
-            all_fixtures = Fixture.query.filter(comp_filter).all() if comp_filter is not None else Fixture.query.all()
+
+            try:
+                round_number = request.args.get('round', type=int)
+                season = (request.args.get('season') or '').strip() or ('current' if round_number is not None else None)
+                season_start, season_end = _season_bounds(season, comp_filter) if season else (None, None)
+                since = (request.args.get('since') or '').strip()
+                since = _normalize_datetime_for_compare(datetime.fromisoformat(since.replace('Z', '+00:00'))) if since else None
+                cursor = int(request.args.get('cursor') or 0)
+                limit = min(max(int(request.args.get('limit') or PREDICTIONS_PAGE_SIZE), 1), PREDICTIONS_MAX_PAGE_SIZE)
+            except ValueError:
+                return make_response({'error': 'Invalid round, season, since, cursor or limit'}, 400)
+
+            # Linked picks are filtered on the joined fixture; legacy unlinked picks on their own columns.
+            linked = Game.fixture_id.isnot(None)
+            unlinked = Game.fixture_id.is_(None)
+            q = db.session.query(Game, Fixture).outerjoin(Fixture, Game.fixture_id == Fixture.id).filter(Game.user_id == user_id)
+            if comp_filter is not None:
+                q = q.filter(or_(unlinked, comp_filter))
+            if round_number is not None:
+                q = q.filter(or_(
+                    linked & (Fixture.fixture_round == round_number),
+                    unlinked & (Game.game_week_name == f"Week {round_number}"),
+                ))
+            if season_start is not None:
+                q = q.filter(or_(linked & (Fixture.fixture_date >= season_start), unlinked & (Game.game_week >= season_start)))
+            if season_end is not None:
+                q = q.filter(or_(linked & (Fixture.fixture_date < season_end), unlinked & (Game.game_week < season_end)))
+            if since is not None:
+                q = q.filter(Game.updated_at >= since.astimezone(timezone.utc).replace(tzinfo=None))
+            if cursor:
+                q = q.filter(Game.id > cursor)
+            rows = q.order_by(Game.id.asc()).limit(limit + 1).all()
+            next_cursor = rows[limit - 1][0].id if len(rows) > limit else None
+            rows = rows[:limit]
+
+            # Legacy picks without fixture_id: one fixture load for the page, only when there are any.
+            fixture_index = None
+            if any(fixture is None for _game, fixture in rows):
+                fq = Fixture.query
+                if comp_filter is not None:
+                    fq = fq.filter(comp_filter)
+                if season_start is not None:
+                    fq = fq.filter(Fixture.fixture_date >= season_start)
+                fixture_index = FixtureIndex(fq.all())
             
             predictions = []
             fixtures_found = 0
             fixtures_completed = 0
             
-            for game in user_games:
-                fixture = _fixture_for_game(game, competition_slug, fixtures_list=all_fixtures)
+            for game, fixture in rows:
+                if fixture is None and fixture_index is not None and game.home_team and game.away_team:
+                    fixture = fixture_index.find(game.home_team, game.away_team, competition_slug)
                 
-                prediction_data = game.to_dict()
-                
-                # Add fixture and actual score info
                 if fixture:
                     fixtures_found += 1
                     if fixture.is_completed:
                         fixtures_completed += 1
-                    # For World Cup, round = Day 1/2/3 (calendar day index from sync)
-                    display_round = fixture.fixture_round
-                    prediction_data['fixture'] = {
-                        'id': fixture.id,
-                        'round': display_round,
-                        'competition_slug': getattr(fixture, 'competition_slug', None),
-                        'date': fixture.fixture_date.isoformat() if fixture.fixture_date else None,
-                        'is_completed': fixture.is_completed,
-                        'actual_home_score': fixture.actual_home_score,
-                        'actual_away_score': fixture.actual_away_score
-                    }
-                    # When fixture is scoreable, ensure game_result is set (for Results table and display)
-                    computed = _compute_game_result(game, fixture)
-                    if computed:
-                        if game.game_result != computed:
-                            game.game_result = computed
-                            db.session.add(game)
-                        prediction_data['game_result'] = computed
-                    elif game.game_result:
-                        game.game_result = None
-                        db.session.add(game)
-                else:
-                    prediction_data['fixture'] = None
-                    # Debug: print first few unmatched
-                    if len(predictions) < 3:
-                        print(f"DEBUG GET predictions: No fixture found for prediction: {game.home_team} vs {game.away_team}")
-                
-                predictions.append(prediction_data)
-            
-            db.session.commit()
-            
-            print(f"DEBUG GET predictions: Total predictions: {len(predictions)}, Fixtures found: {fixtures_found}, Completed: {fixtures_completed}")
+                predictions.append(_prediction_payload(game, fixture))
             
             return make_response({
                 'predictions': predictions,
+                'next_cursor': next_cursor,
                 'debug': {
                     'total_predictions': len(predictions),
                     'fixtures_found': fixtures_found,
@@ -2338,66 +2987,24 @@ class PredictionsResource(Resource):
             if not fixture_id or home_team_score is None or away_team_score is None:
                 return make_response({'error': 'Missing required fields: fixture_id, home_team_score, away_team_score'}, 400)
             
-            # Get the fixture
-            fixture = db.session.get(Fixture, fixture_id)
-            if not fixture:
+            try:
+                pick = (int(fixture_id), int(home_team_score), int(away_team_score))
+            except (TypeError, ValueError):
+                return make_response({'error': 'fixture_id, home_team_score and away_team_score must be whole numbers'}, 400)
+            if pick[1] < 0 or pick[2] < 0:
+                return make_response({'error': 'Scores cannot be negative'}, 400)
+
+            saved = _save_predictions(user_id, [pick])[0]
+            if saved['status'] == 'not_found':
                 return make_response({'error': 'Fixture not found'}, 404)
-            
             # Lock predictions after kickoff: do not allow create or update once the game has started
-            if fixture.fixture_date:
-                now_utc = datetime.now(timezone.utc)
-                kickoff = fixture.fixture_date
-                if getattr(kickoff, 'tzinfo', None) is None:
-                    kickoff = kickoff.replace(tzinfo=timezone.utc)
-                if now_utc >= kickoff:
-                    return make_response({'error': 'Cannot create or update prediction after kickoff'}, 403)
-            
-            # Check if user already has a prediction for this fixture
-            existing_game = Game.query.filter_by(
-                user_id=user_id,
-                home_team=fixture.fixture_home_team,
-                away_team=fixture.fixture_away_team
-            ).first()
-            
-            if existing_game:
-                # Update existing prediction
-                existing_game.home_team_score = int(home_team_score)
-                existing_game.away_team_score = int(away_team_score)
-                existing_game.game_week_name = f"Week {fixture.fixture_round}" if fixture.fixture_round else "Unknown Week"
-                game = existing_game
-            else:
-                # Create new game/prediction
-                game = Game(
-                    user_id=user_id,
-                    home_team=fixture.fixture_home_team,
-                    away_team=fixture.fixture_away_team,
-                    home_team_score=int(home_team_score),
-                    away_team_score=int(away_team_score),
-                    game_week_name=f"Week {fixture.fixture_round}" if fixture.fixture_round else "Unknown Week",
-                    game_week=fixture.fixture_date
-                )
-                db.session.add(game)
-            
+            if saved['status'] == 'locked':
+                return make_response({'error': 'Cannot create or update prediction after kickoff'}, 403)
             db.session.commit()
+
+            _refresh_member_standings(user_id)
             
-            # After saving, update result if fixture is scoreable (kickoff passed)
-            result = _compute_game_result(game, fixture)
-            if result:
-                game.game_result = result
-                db.session.commit()
-            
-            # Create or update prediction record linking user to game
-            prediction = Prediction.query.filter_by(
-                user_id=user_id,
-                game_id=game.id
-            ).first()
-            
-            if not prediction:
-                prediction = Prediction(user_id=user_id, game_id=game.id)
-                db.session.add(prediction)
-                db.session.commit()
-            
-            return make_response({'message': 'Prediction saved successfully', 'prediction': prediction.to_dict()}, 201)
+            return make_response({'message': 'Prediction saved successfully', 'prediction': saved['prediction'].to_dict()}, 201)
             
         except Exception as e:
             db.session.rollback()
@@ -2406,27 +3013,260 @@ class PredictionsResource(Resource):
             print(traceback.format_exc())
             return make_response({'error': str(e)}, 500)
 
+
+def _save_predictions(user_id, picks, now=None):
+    """Upsert a user's picks [(fixture_id, home_score, away_score), ...] without committing.
+
+    Fixtures, the user's existing games (linked row first, then a legacy unlinked row with the fixture's team
+    names) and their Prediction rows are each loaded with one query for the whole list. Picks for fixtures
+    that have kicked off are refused. Returns one dict per pick, in order: {'fixture_id', 'status'
+    (created | updated | unchanged | locked | not_found), 'game', 'prediction'}."""
+    now = now or datetime.now(timezone.utc)
+    fixture_ids = {fixture_id for fixture_id, _home, _away in picks}
+    fixtures = {f.id: f for f in Fixture.query.filter(Fixture.id.in_(fixture_ids)).all()} if fixture_ids else {}
+    games_by_fixture = {}
+    for game in Game.query.filter(Game.user_id == user_id, Game.fixture_id.in_(list(fixtures))).order_by(Game.id).all() if fixtures else ():
+        games_by_fixture.setdefault(game.fixture_id, game)
+    unlinked_homes = {f.fixture_home_team for fid, f in fixtures.items() if fid not in games_by_fixture}
+    legacy_games = {}
+    if unlinked_homes:
+        for game in Game.query.filter(Game.user_id == user_id, Game.fixture_id.is_(None),
+                                      Game.home_team.in_(unlinked_homes)).order_by(Game.id).all():
+            legacy_games.setdefault((game.home_team, game.away_team), game)
+
+    results = []
+    for fixture_id, home_score, away_score in picks:
+        fixture = fixtures.get(fixture_id)
+        if fixture is None:
+            results.append({'fixture_id': fixture_id, 'status': 'not_found', 'game': None, 'prediction': None})
+            continue
+        if fixture.fixture_date and now >= _normalize_datetime_for_compare(fixture.fixture_date):
+            results.append({'fixture_id': fixture_id, 'status': 'locked', 'game': None, 'prediction': None})
+            continue
+        week_name = f"Week {fixture.fixture_round}" if fixture.fixture_round else "Unknown Week"
+        game = games_by_fixture.get(fixture.id) or legacy_games.pop((fixture.fixture_home_team, fixture.fixture_away_team), None)
+        if game is None:
+            game = Game(
+                user_id=user_id,
+                home_team=fixture.fixture_home_team,
+                away_team=fixture.fixture_away_team,
+                home_team_score=home_score,
+                away_team_score=away_score,
+                game_week_name=week_name,
+                game_week=fixture.fixture_date,
+                fixture_id=fixture.id,
+            )
+            db.session.add(game)
+            status = 'created'
+        else:
+            unchanged = (game.home_team_score, game.away_team_score, game.game_week_name, game.fixture_id) == (
+                home_score, away_score, week_name, fixture.id)
+            game.home_team_score = home_score
+            game.away_team_score = away_score
+            game.game_week_name = week_name
+            game.fixture_id = fixture.id
+            status = 'unchanged' if unchanged else 'updated'
+        games_by_fixture[fixture.id] = game
+        # Update result if fixture is scoreable (kickoff passed)
+        result = _compute_game_result(game, fixture)
+        if result:
+            game.game_result = result
+        results.append({'fixture_id': fixture_id, 'status': status, 'game': game, 'prediction': None})
+
+    saved = [r for r in results if r['game'] is not None]
+    if saved:
+        db.session.flush()
+        game_ids = {r['game'].id for r in saved}
+        predictions = {}
+        for prediction in Prediction.query.filter(Prediction.user_id == user_id, Prediction.game_id.in_(game_ids)).all():
+            predictions.setdefault(prediction.game_id, prediction)
+        for r in saved:
+            prediction = predictions.get(r['game'].id)
+            if prediction is None:
+                # Prediction record linking user to game
+                prediction = predictions[r['game'].id] = Prediction(user_id=user_id, game_id=r['game'].id)
+                db.session.add(prediction)
+            r['prediction'] = prediction
+        db.session.flush()
+    return results
+
+
 api.add_resource(PredictionsResource, '/api/v1/predictions')
 
 
+PREDICTIONS_BATCH_MAX = 100
+
+
+@app.route('/api/v1/predictions/batch', methods=['POST'])
+def save_predictions_batch():
+    """Save all picks for a round in one transaction.
+    Body: {"predictions": [{"fixture_id": 1, "home_team_score": 2, "away_team_score": 1}, ...]} (up to 100).
+    Returns 200 with a status per pick: created | updated | unchanged | locked (kicked off) | not_found |
+    invalid. Valid picks are saved even when others are refused."""
+    user_id = get_current_user_id()
+    if not user_id:
+        return make_response({'error': 'User not authenticated'}, 401)
+    data = request.get_json(silent=True) or {}
+    entries = data.get('predictions')
+    if not isinstance(entries, list) or not entries:
+        return make_response({'error': 'predictions must be a non-empty list'}, 400)
+    if len(entries) > PREDICTIONS_BATCH_MAX:
+        return make_response({'error': f'At most {PREDICTIONS_BATCH_MAX} predictions per request'}, 400)
+
+    picks = []
+    statuses = [None] * len(entries)
+    for i, entry in enumerate(entries):
+        try:
+            pick = (int(entry['fixture_id']), int(entry['home_team_score']), int(entry['away_team_score']))
+        except (KeyError, TypeError, ValueError):
+            statuses[i] = {'fixture_id': entry.get('fixture_id') if isinstance(entry, dict) else None, 'status': 'invalid',
+                           'error': 'fixture_id, home_team_score and away_team_score must be whole numbers'}
+            continue
+        if pick[1] < 0 or pick[2] < 0:
+            statuses[i] = {'fixture_id': pick[0], 'status': 'invalid', 'error': 'Scores cannot be negative'}
+            continue
+        picks.append((i, pick))
+
+    try:
+        saved = _save_predictions(user_id, [pick for _i, pick in picks])
+        for (i, _pick), r in zip(picks, saved):
+            statuses[i] = {'fixture_id': r['fixture_id'], 'status': r['status']}
+            if r['game'] is not None:
+                statuses[i]['game_id'] = r['game'].id
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error saving prediction batch: {str(e)}")
+        return make_response({'error': str(e)}, 500)
+    saved_count = sum(1 for r in saved if r['game'] is not None)
+    if saved_count:
+        _refresh_member_standings(user_id)
+    return make_response({'results': statuses, 'saved': saved_count}, 200)
+
+
+def _ai_round_fixtures(fixture, now=None):
+    """The fixture plus the rest of its round (same competition) that has not kicked off: one Ask AI batch."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    if fixture.fixture_round is None:
+        return [fixture]
+    q = Fixture.query.filter(
+        Fixture.fixture_round == fixture.fixture_round,
+        Fixture.fixture_date > now,
+        Fixture.id != fixture.id,
+        _fixture_not_completed_filter(),
+    )
+    comp_filter = _fixture_query_competition(fixture.competition_slug or 'eng.1')
+    if comp_filter is not None:
+        q = q.filter(comp_filter)
+    return [fixture] + q.order_by(Fixture.fixture_date.asc(), Fixture.id.asc()).all()
+
+
+def _ai_competition_table(competition_slug):
+    """(standings rows or None, competition name) for the Ask AI prompt. Premier League uses the Pulselive table;
+    other football-data.org competitions their own; the rest have no table."""
+    slug = competition_slug or 'eng.1'
+    comp = next((c for c in SUPPORTED_COMPETITIONS if c.get('slug') == slug), None)
+    if slug == 'eng.1':
+        payload = _cached_standings()
+    elif comp and comp.get('source') == 'football_data':
+        payload = _cached_standings(slug)
+    else:
+        payload = None
+    return (payload or {}).get('standings'), (comp or {}).get('name', 'League')
+
+
+def _fresh_ai_suggestion(fixture_id, now=None):
+    """Stored suggestion for the fixture if generated within AI_SUGGESTION_FRESH_MINUTES, else None."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    row = db.session.get(FixtureAISuggestion, fixture_id)
+    if row is None or row.generated_at < now - timedelta(minutes=app.config['AI_SUGGESTION_FRESH_MINUTES']):
+        return None
+    return row
+
+
+AI_ROUND_LOCK_SECONDS = 120  # outlives one model call; a crashed worker's claim expires after this
+AI_ROUND_WAIT_SECONDS = 30
+_ai_round_locks = scheduler.RowLocks('ai-round:')
+
+
+def _generate_round_ai_suggestions(backend, fixture, now=None):
+    """One backend call for the fixture's round; upserts fixture_ai_suggestions and commits.
+    Returns {fixture_id: FixtureAISuggestion} for the fixtures the backend scored. The call runs under a
+    job_locks claim per (competition, round), so concurrent first askers (any worker) make one model call: the
+    others wait up to AI_ROUND_WAIT_SECONDS for its rows, and get None if they are still not there."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    slug = fixture.competition_slug or 'eng.1'
+    lock_key = f'{slug}:{fixture.fixture_round}' if fixture.fixture_round is not None else f'{slug}:fixture-{fixture.id}'
+    if not _ai_round_locks.acquire(lock_key, AI_ROUND_LOCK_SECONDS):
+        deadline = time_module.monotonic() + AI_ROUND_WAIT_SECONDS
+        while True:
+            time_module.sleep(0.25)
+            db.session.get(FixtureAISuggestion, fixture.id, populate_existing=True)
+            suggestion = _fresh_ai_suggestion(fixture.id, now)
+            if suggestion is not None:
+                return {fixture.id: suggestion}
+            if _ai_round_locks.acquire(lock_key, AI_ROUND_LOCK_SECONDS):
+                break
+            if time_module.monotonic() >= deadline:
+                return None
+    try:
+        batch = _ai_round_fixtures(fixture, now)
+        standings, competition_name = _ai_competition_table(fixture.competition_slug)
+        predicted = backend.predict_round(
+            [{'fixture_id': f.id, 'home_team': f.fixture_home_team, 'away_team': f.fixture_away_team, 'round': f.fixture_round}
+             for f in batch],
+            standings,
+            competition_name=competition_name,
+        )
+        existing = {
+            r.fixture_id: r
+            for r in FixtureAISuggestion.query.filter(FixtureAISuggestion.fixture_id.in_(list(predicted))).all()
+        } if predicted else {}
+        rows = {}
+        for fixture_id, p in predicted.items():
+            row = existing.get(fixture_id) or FixtureAISuggestion(fixture_id=fixture_id)
+            row.home_team_score = p['home_team_score']
+            row.away_team_score = p['away_team_score']
+            row.rationale = p.get('rationale') or ''
+            row.model = backend.name
+            row.generated_at = now
+            db.session.add(row)
+            rows[fixture_id] = row
+        try:
+            db.session.commit()
+        except IntegrityError:  # another request stored the same round first; use its rows
+            db.session.rollback()
+            stored = FixtureAISuggestion.query.filter(FixtureAISuggestion.fixture_id.in_(list(predicted))).all()
+            return {r.fixture_id: r for r in stored}
+        return rows
+    finally:
+        _ai_round_locks.release(lock_key)
+
+
+def _ai_suggestion_payload(row):
+    return {
+        'home_team_score': row.home_team_score,
+        'away_team_score': row.away_team_score,
+        'rationale': (row.rationale or '').strip(),
+        'generated_at': row.generated_at.isoformat() if row.generated_at else None,
+    }
+
+
 @app.route('/api/v1/predictions/ask-ai', methods=['POST'])
 def ask_ai_prediction():
     """
-    Get an AI-generated score prediction for a fixture. No caching; each request
-    returns a fresh prediction (e.g. to reflect latest form, injuries, etc.).
-    Requires OPENAI_API_KEY and the openai package.
+    Get an AI-generated score prediction for a fixture. Suggestions are generated for the fixture's whole round
+    in one model call and stored in fixture_ai_suggestions; members asking within AI_SUGGESTION_FRESH_MINUTES
+    get the stored one. Requires the configured ai_suggestions backend (OpenAI: OPENAI_API_KEY and the openai package).
     """
     try:
         user_id = get_current_user_id()
         if not user_id:
             return make_response({'error': 'Authentication required'}, 401)
 
-        if not OPENAI_AVAILABLE or OpenAI is None:
-            return make_response({'error': 'Ask AI is not available (openai package not installed)'}, 503)
-
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key or not api_key.strip():
-            return make_response({'error': 'Ask AI is not configured (OPENAI_API_KEY not set)'}, 503)
+        backend, unavailable = ai_suggestions.get_backend()
+        if backend is None:
+            return make_response({'error': unavailable}, 503)
 
         data = request.get_json() or {}
         fixture_id = data.get('fixture_id')
@@ -2455,54 +3295,15 @@ def ask_ai_prediction():
             if now_utc >= kickoff:
                 return make_response({'error': 'Cannot get AI prediction for a fixture that has already started'}, 403)
 
-        standings_list, matchweek = _fetch_standings_data()
-        standings_text = ''
-        if standings_list:
-            lines = [f"{e['position']}. {e['team']} – P{e['played']} W{e['won']} D{e['drawn']} L{e['lost']} GF{e['goalsFor']} GA{e['goalsAgainst']} GD{e['goalDifference']} Pts{e['points']}" for e in standings_list]
-            standings_text = 'Current Premier League table (after latest matchweek):\n' + '\n'.join(lines)
-        else:
-            standings_text = 'Current Premier League standings could not be loaded; base your prediction on general knowledge of the teams.'
-
-        round_info = f" (Round {fixture.fixture_round})" if fixture.fixture_round else ""
-        prompt = f"""Fixture{round_info}: {fixture.fixture_home_team} (home) vs {fixture.fixture_away_team} (away).
-
-{standings_text}
-
-Predict the full-time score. Consider table position, form, and home advantage. Reply with valid JSON only, no other text:
-{{"home_team_score": <integer 0-20>, "away_team_score": <integer 0-20>, "rationale": "<one short sentence explaining the prediction>"}}"""
-
-        client = OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-            messages=[
-                {'role': 'system', 'content': 'You are a Premier League expert. Reply only with valid JSON in the exact format requested.'},
-                {'role': 'user', 'content': prompt},
-            ],
-            response_format={'type': 'json_object'},
-            max_tokens=150,
-        )
-        content = (response.choices[0].message.content or '').strip()
-        if not content:
-            return make_response({'error': 'AI returned no prediction'}, 502)
-
-        parsed = json.loads(content)
-        home = parsed.get('home_team_score')
-        away = parsed.get('away_team_score')
-        rationale = parsed.get('rationale') or ''
-
-        try:
-            home = int(home) if home is not None else None
-            away = int(away) if away is not None else None
-        except (TypeError, ValueError):
-            home = away = None
-        if home is None or away is None or not (0 <= home <= 20 and 0 <= away <= 20):
+        suggestion = _fresh_ai_suggestion(fixture.id)
+        if suggestion is None:
+            generated = _generate_round_ai_suggestions(backend, fixture)
+            if generated is None:
+                return make_response({'error': 'AI suggestions for this round are being generated. Please try again in a moment.'}, 503)
+            suggestion = generated.get(fixture.id)
+        if suggestion is None:
             return make_response({'error': 'AI returned invalid score format'}, 502)
-
-        return make_response({
-            'home_team_score': home,
-            'away_team_score': away,
-            'rationale': rationale.strip(),
-        }, 200)
+        return make_response(_ai_suggestion_payload(suggestion), 200)
     except json.JSONDecodeError as e:
         return make_response({'error': f'Invalid AI response: {str(e)}'}, 502)
     except Exception as e:
@@ -2536,6 +3337,7 @@ def sync_fixture_scores():
     Sync completed fixtures with actual scores.
     - Premier League: use api_url (pulselive API) in body/query or EXTERNAL_FIXTURES_API_URL.
     - Other leagues: pass competition=slug (e.g. ger.1, eng.2); uses football-data.org or ESPN to refresh scores.
+    - mode=live (with competition): only fixtures kicking off around now or started and not completed.
     GET: use query params competition= and optionally api_url= (for PL).
     """
     print("DEBUG sync-scores: Function called")
@@ -2548,15 +3350,34 @@ def sync_fixture_scores():
             competition_slug = (request.args.get('competition') or request.args.get('league_slug') or '').strip()
             api_url = request.args.get('api_url') or os.getenv('EXTERNAL_FIXTURES_API_URL')
             scores_only = _parse_bool_param(request.args.get('scores_only'))
+            mode = (request.args.get('mode') or '').strip().lower()
         else:
             data = request.get_json() or {}
             competition_slug = (data.get('competition') or data.get('league_slug') or '').strip()
             api_url = data.get('api_url') or os.getenv('EXTERNAL_FIXTURES_API_URL')
             scores_only = _parse_bool_param(data.get('scores_only'))
+            mode = (data.get('mode') or '').strip().lower()
         
         # All leagues (including Premier League eng.1) use competition=slug; football-data.org or ESPN.
         if competition_slug:
             comp = next((c for c in SUPPORTED_COMPETITIONS if c.get('slug') == competition_slug), None)
+            if comp and mode == 'live':
+                # Poll only fixtures in the live window (cheap enough to run every minute on match days)
+                added, updated, seen, err = _sync_scores_live(comp)
+                if err:
+                    return make_response({'error': err}, 500)
+                db.session.commit()
+                _mark_provider_feeds_processed()
+                _refresh_dirty_standings()
+                return make_response({
+                    'message': f'Live scores synced for {competition_slug}',
+                    'mode': 'live',
+                    'added': added,
+                    'updated': updated,
+                    'fixtures_seen': seen,
+                    'fixtures_updated': updated,
+                    'scores_only': True,
+                }, 200)
             if comp and comp.get('source') == 'football_data':
                 added, updated, seen, err = _sync_fixtures_football_data(
                     comp.get('football_data_code') or 'BL1',
@@ -2566,6 +3387,8 @@ def sync_fixture_scores():
                 if err:
                     return make_response({'error': err}, 500)
                 db.session.commit()
+                _mark_provider_feeds_processed()
+                _refresh_dirty_standings()
                 return make_response({
                     'message': f'Scores synced for {competition_slug} (football-data.org)',
                     'added': added,
@@ -2582,6 +3405,8 @@ def sync_fixture_scores():
                 if err:
                     return make_response({'error': err}, 500)
                 db.session.commit()
+                _mark_provider_feeds_processed()
+                _refresh_dirty_standings()
                 return make_response({
                     'message': f'Scores synced for {competition_slug} (ESPN)',
                     'added': added,
@@ -2634,7 +3459,7 @@ def sync_fixture_scores():
                 qs_page["_next"] = [next_token]
                 page_url = urlunparse(parsed_page._replace(query=urlencode(qs_page, doseq=True)))
             
-            resp = requests.get(page_url, headers=headers, timeout=30)
+            resp = provider_client.get(page_url, headers=headers, timeout=30)
             resp.raise_for_status()
             external_data = resp.json()
             
@@ -2914,9 +3739,7 @@ def sync_fixture_scores():
                 has_both_scores = actual_home_score is not None and actual_away_score is not None
                 if has_both_scores:
                     # We have final scores - update fixture (treat as completed; API may not set period/status)
-                    fixture.actual_home_score = int(actual_home_score)
-                    fixture.actual_away_score = int(actual_away_score)
-                    fixture.is_completed = True
+                    _set_fixture_result(fixture, int(actual_home_score), int(actual_away_score), True)
                     fixtures_updated += 1
                     fixtures_with_scores += 1
                     if fixtures_updated <= 3:
@@ -2924,9 +3747,7 @@ def sync_fixture_scores():
                 elif is_completed and not has_both_scores and fixture.is_completed:
                     # API says completed but we have no scores - clear if we had scores before (e.g. data glitch)
                     if fixture.actual_home_score is not None or fixture.actual_away_score is not None:
-                        fixture.is_completed = False
-                        fixture.actual_home_score = None
-                        fixture.actual_away_score = None
+                        _set_fixture_result(fixture, None, None, False)
                         fixtures_updated += 1
                 elif idx < 5:
                     print(f"DEBUG sync-scores: Match {idx} - No scores yet (is_completed={is_completed}, scores={actual_home_score}-{actual_away_score})")
@@ -2943,6 +3764,7 @@ def sync_fixture_scores():
                             print(f"  - {f.fixture_home_team} vs {f.fixture_away_team} (id={f.id}, completed={f.is_completed}, scores={f.actual_home_score}-{f.actual_away_score})")
         
         db.session.commit()
+        _refresh_dirty_standings()
         
         print(f"DEBUG sync-scores SUMMARY: Updated {fixtures_updated} fixtures, {matches_with_scores} matches had scores, {fixtures_not_found} fixtures not found, {pages_fetched} pages fetched")
         
@@ -2985,13 +3807,18 @@ def check_prediction_results():
         fixtures_not_found = 0
         fixtures_not_completed = 0
         fixtures_no_scores = 0
+        names_synced = 0
         
         print(f"DEBUG check-results: Checking {len(user_games)} predictions for user {user_id}")
         
-        all_fixtures = Fixture.query.all()
+        # Linked picks: one query for their fixtures. Name matching (exact, case-insensitive, normalized) only
+        # needs the full fixture list when the user still has legacy unlinked picks.
+        linked_ids = {g.fixture_id for g in user_games if g.fixture_id is not None}
+        linked_fixtures = Fixture.query.filter(Fixture.id.in_(linked_ids)).all() if linked_ids else []
+        has_unlinked = any(g.fixture_id is None for g in user_games)
+        fixture_index = FixtureIndex(Fixture.query.all() if has_unlinked else linked_fixtures)
         for game in user_games:
-            # Find matching fixture - exact, then case-insensitive, then normalized (& vs and, etc.)
-            fixture = _fixture_for_game(game, None, fixtures_list=all_fixtures)
+            fixture = _fixture_for_game(game, None, fixture_index=fixture_index)
             if not fixture:
                 fixtures_not_found += 1
                 if fixtures_not_found <= 3:
@@ -3002,6 +3829,7 @@ def check_prediction_results():
             if game.home_team != fixture.fixture_home_team or game.away_team != fixture.fixture_away_team:
                 game.home_team = fixture.fixture_home_team
                 game.away_team = fixture.fixture_away_team
+                names_synced += 1
             
             result = _compute_game_result(game, fixture)
             if result is None:
@@ -3026,6 +3854,8 @@ def check_prediction_results():
                 results_updated += 1
         
         db.session.commit()
+        if results_updated or names_synced:
+            _refresh_member_standings(user_id)
         
         return make_response({
             'message': 'Prediction results checked successfully',
@@ -3221,7 +4051,7 @@ def login():
 
 @app.route('/api/v1/forgot-password', methods=['POST'])
 def forgot_password():
-    """Request a password reset link. Sends email if MAIL_* is configured; else returns link in response."""
+    """Request a password reset link. Queues the email if MAIL_* is configured (see email_outbox)."""
     data = request.get_json() or {}
     email = (data.get('email') or '').strip()
     if not email:
@@ -3231,25 +4061,21 @@ def forgot_password():
     if user:
         user.reset_token = secrets.token_urlsafe(32)
         user.reset_token_expires = datetime.now(timezone.utc) + timedelta(hours=1)
-        db.session.commit()
         # Use history API route instead of hash route so the client lands on the reset form.
         reset_link = f"{frontend_url.rstrip('/')}/reset-password?token={user.reset_token}" if frontend_url else None
-        to_email = str(user.email)
-        # Send email in request; 502 was from Gunicorn worker timeout, not Render proxy. Use gunicorn --timeout 120.
-        email_sent = False
+        # The email is queued with the token in one commit; the outbox sender delivers it off the request thread,
+        # so the response can only say it was queued (delivery failures are in email_outbox.last_error).
+        email_queued = False
         if app.config.get('MAIL_SERVER') and reset_link and not app.config.get('SKIP_PASSWORD_RESET_EMAIL'):
-            try:
-                email_sent = send_password_reset_email(to_email, reset_link)
-                if email_sent:
-                    print(f"Password reset email sent to {to_email}")
-                else:
-                    print(f"Password reset email not sent for {to_email}")
-            except Exception as e:
-                print(f"send_password_reset_email failed: {e}")
-                email_sent = False
+            queue_password_reset_email(str(user.email), reset_link)
+            email_queued = True
+        db.session.commit()
+        if email_queued:
+            email_outbox.notify()
+            print(f"Password reset email queued for {user.email}")
         payload = {
             'message': "If an account exists with that email, we've sent a reset link.",
-            'email_sent': email_sent,
+            'email_queued': email_queued,
         }
         return make_response(payload, 200)
     return make_response({
@@ -3302,28 +4128,66 @@ def reset_password():
 def index():
     return '<h1>Project Server</h1>'
 
+OPEN_LEAGUES_PAGE_SIZE = 100
+OPEN_LEAGUES_MAX_PAGE_SIZE = 500
+
+
+def _encode_league_cursor(name, league_id):
+    """Opaque keyset cursor for the open-league list (ordered by name, id)."""
+    return base64.urlsafe_b64encode(json.dumps([name, league_id]).encode('utf-8')).decode('ascii')
+
+
+def _decode_league_cursor(cursor):
+    """(name, id) from _encode_league_cursor; ValueError if it was not produced by it."""
+    try:
+        name, league_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception as e:
+        raise ValueError('invalid cursor') from e
+    if not isinstance(name, str) or not isinstance(league_id, int):
+        raise ValueError('invalid cursor')
+    return name, league_id
+
+
 @app.route('/api/v1/leagues/open', methods=['GET'])
 def get_open_leagues():
-    """List leagues that are open to anyone. Optional query param q= for search by league name. Auth required."""
+    """List leagues that are open to anyone, by name. Auth required.
+    Optional query:
+      ?q=                 search by league name (substring, case-insensitive)
+      ?limit= / ?cursor=  page size (default 100) and the next_cursor from the previous page
+    One query: a keyset page of open leagues (partial index on (name, id); trigram index for ?q= on Postgres)
+    joined to memberships and grouped for member_count and the caller's is_member."""
     try:
         user_id = get_current_user_id()
         if not user_id:
             return make_response({'error': 'User not authenticated'}, 401)
         q = (request.args.get('q') or '').strip()
-        query = League.query.filter_by(is_open=True)
+        try:
+            cursor = (request.args.get('cursor') or '').strip()
+            after = _decode_league_cursor(cursor) if cursor else None
+            limit = min(max(int(request.args.get('limit') or OPEN_LEAGUES_PAGE_SIZE), 1), OPEN_LEAGUES_MAX_PAGE_SIZE)
+        except ValueError:
+            return make_response({'error': 'Invalid cursor or limit'}, 400)
+
+        page = db.session.query(League.id, League.name).filter_by(is_open=True)
         if q:
-            query = query.filter(League.name.ilike(f'%{q}%'))
-        leagues = query.order_by(League.name.asc()).limit(100).all()
-        out = []
-        for league in leagues:
-            out.append({
-                'id': league.id,
-                'name': league.name,
-                'is_open': getattr(league, 'is_open', False),
-                'is_member': bool(get_league_membership(user_id, league.id)),
-                'member_count': len(league.league_memberships),
-            })
-        return make_response({'leagues': out}, 200)
+            page = page.filter(League.name.ilike(f'%{q}%'))
+        if after:
+            page = page.filter(or_(League.name > after[0], and_(League.name == after[0], League.id > after[1])))
+        page = page.order_by(League.name.asc(), League.id.asc()).limit(limit + 1).subquery()
+        is_member = func.max(case((LeagueMembership.user_id == user_id, 1), else_=0))
+        rows = (
+            db.session.query(page.c.id, page.c.name, func.count(LeagueMembership.user_id), is_member)
+            .outerjoin(LeagueMembership, LeagueMembership.league_id == page.c.id)
+            .group_by(page.c.id, page.c.name)
+            .order_by(page.c.name.asc(), page.c.id.asc())
+            .all()
+        )
+        next_cursor = _encode_league_cursor(rows[limit - 1][1], rows[limit - 1][0]) if len(rows) > limit else None
+        out = [
+            {'id': league_id, 'name': name, 'is_open': True, 'is_member': bool(member), 'member_count': count}
+            for league_id, name, count, member in rows[:limit]
+        ]
+        return make_response({'leagues': out, 'next_cursor': next_cursor}, 200)
     except Exception as e:
         print(f"Error fetching open leagues: {str(e)}")
         import traceback
@@ -3331,9 +4195,56 @@ def get_open_leagues():
         return make_response({'error': str(e)}, 500)
 
 
+LEAGUE_MEMBERS_MODES = ('none', 'summary', 'full')
+
+
+def _league_members_mode(default='full'):
+    """?members=none|summary|full for the league list/detail payloads; anything else falls back to default."""
+    mode = (request.args.get('members') or '').strip().lower()
+    return mode if mode in LEAGUE_MEMBERS_MODES else default
+
+
+def _leagues_for_member(user_id, members='full', league_id=None):
+    """(league, caller's membership) pairs for the leagues user_id belongs to, in one query.
+    Memberships (and their users, for 'full') are selectin-loaded so to_dict and the admin flag do not query per league;
+    with members='none' nothing is eager-loaded and member_count comes from one grouped count."""
+    query = (
+        db.session.query(League, LeagueMembership)
+        .join(LeagueMembership, LeagueMembership.league_id == League.id)
+        .filter(LeagueMembership.user_id == user_id)
+    )
+    if league_id is not None:
+        query = query.filter(League.id == league_id)
+    if members == 'full':
+        query = query.options(selectinload(League.league_memberships).selectinload(LeagueMembership.user))
+    elif members == 'summary':
+        query = query.options(selectinload(League.league_memberships))
+    return query.order_by(League.id.asc()).all()
+
+
+def _league_payloads(rows, members='full'):
+    """to_dict for each (league, membership) row plus is_admin from the caller's membership."""
+    counts = {}
+    if members == 'none' and rows:
+        counts = dict(
+            db.session.query(LeagueMembership.league_id, func.count())
+            .filter(LeagueMembership.league_id.in_([league.id for league, _ in rows]))
+            .group_by(LeagueMembership.league_id)
+            .all()
+        )
+    out = []
+    for league, membership in rows:
+        d = league.to_dict(members=members)
+        if members == 'none':
+            d['member_count'] = counts.get(league.id, 0)
+        d['is_admin'] = membership.role == 'admin'
+        out.append(d)
+    return out
+
+
 @app.route('/api/v1/leagues', methods=['GET'])
 def get_user_leagues():
-    """Get all leagues the current user is a member of"""
+    """Get all leagues the current user is a member of. Optional ?members=none|summary|full (default full)."""
     try:
         user_id = get_current_user_id()
         if not user_id:
@@ -3343,11 +4254,8 @@ def get_user_leagues():
         if not user:
             return make_response({'error': 'User not authenticated'}, 401)
         
-        leagues = []
-        for league in user.leagues:
-            d = league.to_dict()
-            d['is_admin'] = is_league_admin(user_id, league.id)
-            leagues.append(d)
+        members = _league_members_mode()
+        leagues = _league_payloads(_leagues_for_member(user_id, members), members)
         return make_response({'leagues': leagues}, 200)
     except Exception as e:
         print(f"Error fetching user leagues: {str(e)}")
@@ -3358,23 +4266,25 @@ def get_user_leagues():
 
 @app.route('/api/v1/leagues/<int:league_id>', methods=['GET'])
 def get_league(league_id):
-    """Get one league the current user belongs to (for bookmarks / league page without full list)."""
+    """Get one league the current user belongs to (for bookmarks / league page without full list).
+    Optional ?members=none|summary|full (default full)."""
     try:
         user_id = get_current_user_id()
         if not user_id:
             return make_response({'error': 'User not authenticated'}, 401)
 
-        league = db.session.get(League, league_id)
-        if not league:
-            return make_response({'error': 'League not found'}, 404)
-
         user = get_active_user_by_id(user_id)
-        if not user or user not in league.members:
+        if not user:
             return make_response({'error': 'User is not a member of this league'}, 403)
 
-        d = league.to_dict()
-        d['is_admin'] = is_league_admin(user_id, league_id)
-        return make_response({'league': d}, 200)
+        members = _league_members_mode()
+        rows = _leagues_for_member(user_id, members, league_id=league_id)
+        if not rows:
+            if db.session.get(League, league_id) is None:
+                return make_response({'error': 'League not found'}, 404)
+            return make_response({'error': 'User is not a member of this league'}, 403)
+
+        return make_response({'league': _league_payloads(rows, members)[0]}, 200)
     except Exception as e:
         print(f"Error fetching league {league_id}: {str(e)}")
         import traceback
@@ -3592,6 +4502,7 @@ def remove_league_member(league_id, member_user_id):
         if not membership:
             return make_response({'error': 'Member not in this league'}, 404)
         db.session.delete(membership)
+        LeagueStanding.query.filter_by(league_id=league_id, user_id=member_user_id).delete(synchronize_session=False)
         db.session.commit()
         return make_response({'message': 'Member removed from league'}, 200)
     except Exception as e:
@@ -3615,6 +4526,9 @@ def delete_league(league_id):
             return make_response({'error': 'League not found'}, 404)
         # Bulk deletes avoid ORM cascade on stale in-memory memberships (faster, no hang).
         LeagueWeekWinner.query.filter_by(league_id=league_id).delete(synchronize_session=False)
+        LeagueRoundClose.query.filter_by(league_id=league_id).delete(synchronize_session=False)
+        LeagueRoundStanding.query.filter_by(league_id=league_id).delete(synchronize_session=False)
+        LeagueStanding.query.filter_by(league_id=league_id).delete(synchronize_session=False)
         LeagueMembership.query.filter_by(league_id=league_id).delete(synchronize_session=False)
         deleted = League.query.filter_by(id=league_id).delete(synchronize_session=False)
         if not deleted:
@@ -3656,10 +4570,12 @@ def admin_update_prediction(league_id, game_id):
         if away_team_score is not None:
             game.away_team_score = int(away_team_score)
         # Recompute game_result if fixture is completed
-        fixture = Fixture.query.filter_by(
-            fixture_home_team=game.home_team,
-            fixture_away_team=game.away_team
-        ).first()
+        fixture = db.session.get(Fixture, game.fixture_id) if game.fixture_id else None
+        if not fixture:
+            fixture = Fixture.query.filter_by(
+                fixture_home_team=game.home_team,
+                fixture_away_team=game.away_team
+            ).first()
         if not fixture and game.home_team and game.away_team:
             for f in Fixture.query.all():
                 if (f.fixture_home_team or '').lower().strip() == (game.home_team or '').lower().strip() and (f.fixture_away_team or '').lower().strip() == (game.away_team or '').lower().strip():
@@ -3669,6 +4585,9 @@ def admin_update_prediction(league_id, game_id):
             result = _compute_game_result(game, fixture)
             game.game_result = result
         db.session.commit()
+        _refresh_member_standings(game.user_id)
+        if fixture:
+            _resnapshot_closed_rounds(fixture.competition_slug, fixture.fixture_round, user_id=game.user_id)
         return make_response({'message': 'Prediction updated', 'game': game.to_dict()}, 200)
     except Exception as e:
         db.session.rollback()
@@ -3736,8 +4655,11 @@ def admin_update_fixture_round(league_id, fixture_id):
             g.game_week_name = f"Week {new_round}"
             if fixture.fixture_date:
                 g.game_week = fixture.fixture_date
+        if old_round != new_round or affected_games:
+            _mark_standings_dirty(getattr(fixture, 'competition_slug', None))
 
         db.session.commit()
+        _refresh_dirty_standings()
         return make_response({
             'message': 'Fixture game week updated',
             'fixture': fixture.to_dict(),
@@ -3769,10 +4691,11 @@ def get_member_predictions_for_admin(league_id, member_user_id):
         league_comp = getattr(league, 'competition_slug', None) or 'eng.1'
         comp_filter = _fixture_query_competition(league_comp)
         all_fixtures = Fixture.query.filter(comp_filter).all() if comp_filter is not None else Fixture.query.all()
+        fixture_index = FixtureIndex(all_fixtures)
         user_games = Game.query.filter_by(user_id=member_user_id).order_by(Game.game_week.asc()).all()
         predictions = []
         for game in user_games:
-            fixture = _fixture_for_game(game, league_comp, fixtures_list=all_fixtures)
+            fixture = _fixture_for_game(game, league_comp, fixture_index=fixture_index)
             prediction_data = game.to_dict()
             if fixture:
                 prediction_data['fixture'] = {
@@ -3834,7 +4757,10 @@ def admin_create_member_prediction(league_id, member_user_id):
             return make_response({'error': f'Fixture not found for {home_team} vs {away_team}'}, 404)
         # Use fixture's exact names for the Game
         f_home, f_away = fixture.fixture_home_team, fixture.fixture_away_team
-        existing = Game.query.filter_by(user_id=member_user_id, home_team=f_home, away_team=f_away).first()
+        existing = (
+            Game.query.filter_by(user_id=member_user_id, fixture_id=fixture.id).first()
+            or Game.query.filter_by(user_id=member_user_id, home_team=f_home, away_team=f_away, fixture_id=None).first()
+        )
         if existing:
             return make_response({'error': 'Member already has a prediction for this fixture; use PATCH to update', 'game_id': existing.id}, 400)
         game = Game(
@@ -3844,7 +4770,8 @@ def admin_create_member_prediction(league_id, member_user_id):
             home_team_score=home_team_score,
             away_team_score=away_team_score,
             game_week_name=f"Week {fixture.fixture_round}" if fixture.fixture_round else "Unknown Week",
-            game_week=fixture.fixture_date
+            game_week=fixture.fixture_date,
+            fixture_id=fixture.id,
         )
         result = _compute_game_result(game, fixture)
         if result:
@@ -3855,6 +4782,8 @@ def admin_create_member_prediction(league_id, member_user_id):
         if not pred:
             db.session.add(Prediction(user_id=member_user_id, game_id=game.id))
         db.session.commit()
+        _refresh_member_standings(member_user_id)
+        _resnapshot_closed_rounds(fixture.competition_slug, fixture.fixture_round, user_id=member_user_id)
         return make_response({'message': 'Prediction created', 'game': game.to_dict(), 'game_id': game.id}, 201)
     except Exception as e:
         db.session.rollback()
@@ -3929,6 +4858,643 @@ def _fixture_matches_league_competition(fixture, league):
     return comp == slug
 
 
+def _leaderboard_sort_key(row):
+    """Points (desc), then fewest losses, then wins, then draws."""
+    return (row['points'], -row['losses'], row['wins'], row['draws'])
+
+
+def _leagues_for_competition(competition_slug):
+    """Leagues predicting a competition (eng.1 includes legacy leagues with no competition set)."""
+    if not competition_slug or competition_slug == 'eng.1':
+        return League.query.filter(or_(League.competition_slug == 'eng.1', League.competition_slug.is_(None))).all()
+    return League.query.filter(League.competition_slug == competition_slug).all()
+
+
+def _league_standings_season_key(league_created_at):
+    """Key for league_standings rows: the leaderboard cutoff as naive-UTC ISO string ('all' when there is none)."""
+    if league_created_at is None:
+        return 'all'
+    cutoff = _normalize_datetime_for_compare(league_created_at)
+    try:
+        return cutoff.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+    except (AttributeError, TypeError, ValueError):
+        return str(league_created_at)
+
+
+def _league_completed_fixtures(league, league_created_at):
+    """Scoreable fixtures in the league's competition on or after the leaderboard cutoff."""
+    comp_filter = _fixture_query_competition(getattr(league, 'competition_slug', None) or 'eng.1')
+    q = Fixture.query.filter(
+        Fixture.actual_home_score.isnot(None),
+        Fixture.actual_away_score.isnot(None)
+    )
+    if comp_filter is not None:
+        q = q.filter(comp_filter)
+    return [
+        f for f in q.all()
+        if _fixture_date_on_or_after_league(f, None, league_created_at, strict_missing_date=True)
+        and _fixture_scoreable(f)
+    ]
+
+
+def _full_season_standings(memberships, games_by_user, completed_fixtures, league_created_at):
+    """Full-season rows for members (in memberships order): backfill + fixture-first scoring. A missed pick
+    counts as a Loss only in rounds where the member predicted at least one fixture."""
+    rows = []
+    for lm in memberships:
+        games = games_by_user.get(lm.user_id, [])
+        counts = {'Win': 0, 'Draw': 0, 'Loss': 0}
+        missed_rounds = []
+        rounds_with_pick = set()
+        for f in completed_fixtures:
+            game = _game_for_fixture(f, games, league_created_at=league_created_at)
+            if game is not None:
+                result = _compute_game_result(game, f)
+                if result in counts:
+                    counts[result] += 1
+                if f.fixture_round is not None:
+                    rounds_with_pick.add(f.fixture_round)
+            elif f.fixture_round is not None:
+                missed_rounds.append(f.fixture_round)
+        w = (lm.backfill_wins or 0) + counts['Win']
+        d = (lm.backfill_draws or 0) + counts['Draw']
+        l = (lm.backfill_losses or 0) + counts['Loss'] + sum(1 for r in missed_rounds if r in rounds_with_pick)
+        # Fallback: if no completed fixtures in DB (e.g. sync didn't match) but games have game_result from check-results, count those so leaderboard isn't stuck at 0
+        if not completed_fixtures:
+            for g in games_by_user.get(lm.user_id, []):
+                if not _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True):
+                    continue
+                gr = getattr(g, 'game_result', None)
+                if gr == 'Win':
+                    w += 1
+                elif gr == 'Draw':
+                    d += 1
+                elif gr == 'Loss':
+                    l += 1
+        rows.append({
+            'user_id': lm.user.id,
+            'display_name': lm.display_name,
+            'wins': w,
+            'draws': d,
+            'losses': l,
+            'points': (w * scoring.POINTS[scoring.WIN]) + (d * scoring.POINTS[scoring.DRAW]),
+            'total_games': w + d + l,
+        })
+    return rows
+
+
+def _compute_full_season_leaderboard(league, league_created_at, user_ids=None):
+    """Live full-season standings for a league (the source of truth for league_standings rows).
+    Pass user_ids to compute only those members."""
+    completed_fixtures = _league_completed_fixtures(league, league_created_at)
+    memberships = [
+        lm for lm in league.league_memberships
+        if not lm.user.deleted_at and (user_ids is None or lm.user_id in user_ids)
+    ]
+    member_ids = [lm.user_id for lm in memberships]
+    games_by_user = {}
+    for g in (Game.query.filter(Game.user_id.in_(member_ids)).all() if member_ids else []):
+        games_by_user.setdefault(g.user_id, []).append(g)
+    leaderboard = _full_season_standings(memberships, games_by_user, completed_fixtures, league_created_at)
+    leaderboard.sort(key=_leaderboard_sort_key, reverse=True)
+    return leaderboard
+
+
+def refresh_league_standings(league, user_ids=None):
+    """Recompute and store league_standings rows for a league (all members, or only user_ids). Caller commits.
+    Returns the number of rows written."""
+    if getattr(league, 'format', None) == 'knockout_bracket':
+        return 0
+    league_created_at = _league_leaderboard_cutoff(league)
+    season_key = _league_standings_season_key(league_created_at)
+    rows = _compute_full_season_leaderboard(league, league_created_at, user_ids=user_ids)
+    existing_q = LeagueStanding.query.filter_by(league_id=league.id, season_key=season_key)
+    if user_ids is not None:
+        existing_q = existing_q.filter(LeagueStanding.user_id.in_(list(user_ids)))
+    existing = {r.user_id: r for r in existing_q.all()}
+    computed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    for row in rows:
+        standing = existing.pop(row['user_id'], None)
+        if standing is None:
+            standing = LeagueStanding(league_id=league.id, season_key=season_key, user_id=row['user_id'])
+            db.session.add(standing)
+        standing.wins = row['wins']
+        standing.draws = row['draws']
+        standing.losses = row['losses']
+        standing.points = row['points']
+        standing.total_games = row['total_games']
+        standing.computed_at = computed_at
+    # Rows left over belong to members who left or were soft-deleted
+    for standing in existing.values():
+        db.session.delete(standing)
+    return len(rows)
+
+
+def _refresh_dirty_standings():
+    """Rescore fixtures whose results changed in this session (_set_fixture_result), then refresh league_standings:
+    every league of a competition marked by _mark_standings_dirty, and only the marked members elsewhere.
+    Call after committing a sync; failures are logged so the sync response is unaffected."""
+    dirty_fixtures = db.session.info.pop('results_dirty_fixtures', None)
+    dirty_rounds = db.session.info.pop('results_dirty_rounds', None) or {}
+    if dirty_fixtures:
+        try:
+            # identity, not f.id: the fixtures were expired by the commit and reading id would reload each one
+            _rescore_fixtures({sa_inspect(f).identity[0] for f in dirty_fixtures if sa_inspect(f).identity})
+        except Exception as e:
+            db.session.rollback()
+            print(f"Rescoring failed for {len(dirty_fixtures)} fixture(s) (left for the rescore-results job): {e}")
+    dirty = db.session.info.pop('standings_dirty_competitions', None) or set()
+    dirty_members = db.session.info.pop('standings_dirty_members', None) or {}
+    # Before closing: a round completed by this change is snapshotted by its close, not twice
+    for comp_slug, from_round in sorted(dirty_rounds.items()):
+        _resnapshot_closed_rounds(comp_slug, from_round)
+    if not dirty and not dirty_members:
+        return 0
+    refreshed = 0
+    try:
+        for comp_slug in sorted(dirty):
+            for league in _leagues_for_competition(comp_slug):
+                refresh_league_standings(league)
+                refreshed += 1
+        for comp_slug, user_ids in sorted(dirty_members.items()):
+            if comp_slug in dirty or not user_ids:
+                continue
+            for league in _leagues_for_competition(comp_slug):
+                refresh_league_standings(league, user_ids=user_ids)
+                refreshed += 1
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Standings refresh failed for {sorted(dirty | set(dirty_members))}: {e}")
+    try:
+        # Results changed: the last open fixture of a round may just have become scoreable
+        _close_completed_rounds(dirty | set(dirty_members))
+    except Exception as e:
+        db.session.rollback()
+        print(f"Round close failed for {sorted(dirty | set(dirty_members))} (left for the round-close job): {e}")
+    return refreshed
+
+
+def _refresh_member_standings(user_id):
+    """Refresh one member's league_standings row in every league they belong to (after a prediction change)."""
+    if not user_id:
+        return 0
+    try:
+        leagues = League.query.join(LeagueMembership).filter(LeagueMembership.user_id == user_id).all()
+        for league in leagues:
+            refresh_league_standings(league, user_ids={user_id})
+        db.session.commit()
+        return len(leagues)
+    except Exception as e:
+        db.session.rollback()
+        print(f"Standings refresh failed for user {user_id}: {e}")
+        return 0
+
+
+def _league_standings_stale(league, computed_at):
+    """True if a fixture with scores kicked off after computed_at (ESPN 0-0 placeholders become scoreable
+    at kickoff without any row changing, so time alone can invalidate stored standings)."""
+    if computed_at is None:
+        return True
+    now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
+    q = Fixture.query.filter(
+        Fixture.actual_home_score.isnot(None),
+        Fixture.actual_away_score.isnot(None),
+        Fixture.fixture_date > computed_at,
+        Fixture.fixture_date <= now_naive,
+    )
+    comp_filter = _fixture_query_competition(getattr(league, 'competition_slug', None) or 'eng.1')
+    if comp_filter is not None:
+        q = q.filter(comp_filter)
+    return db.session.query(q.exists()).scalar()
+
+
+def _read_league_standings(league):
+    """Full-season leaderboard from league_standings (one indexed read). GETs never write: when rows are stale
+    the leaderboard is computed in memory, and members without a row yet are computed in memory and merged. The
+    rows themselves are stored by the sync (_refresh_dirty_standings) and close-rounds (_refresh_stale_standings)
+    paths."""
+    league_created_at = _league_leaderboard_cutoff(league)
+    season_key = _league_standings_season_key(league_created_at)
+    rows = {
+        r.user_id: r
+        for r in LeagueStanding.query.filter_by(league_id=league.id, season_key=season_key).all()
+    }
+    if not rows or _league_standings_stale(league, min((r.computed_at for r in rows.values() if r.computed_at), default=None)):
+        return _compute_full_season_leaderboard(league, league_created_at)
+    active = [lm for lm in league.league_memberships if not lm.user.deleted_at]
+    missing = {lm.user_id for lm in active if lm.user_id not in rows}
+    computed = {
+        row['user_id']: row for row in _compute_full_season_leaderboard(league, league_created_at, user_ids=missing)
+    } if missing else {}
+    leaderboard = []
+    for lm in active:
+        r = rows.get(lm.user_id)
+        if r is None:
+            leaderboard.append(computed[lm.user_id])
+            continue
+        leaderboard.append({
+            'user_id': lm.user_id,
+            'display_name': lm.display_name,
+            'wins': r.wins,
+            'draws': r.draws,
+            'losses': r.losses,
+            'points': r.points,
+            'total_games': r.total_games,
+        })
+    leaderboard.sort(key=_leaderboard_sort_key, reverse=True)
+    return leaderboard
+
+
+def _refresh_stale_standings():
+    """Store league_standings for full-season leagues whose rows are missing members or stale (a fixture became
+    scoreable at kickoff, which no sync sees as a change). Run by the close-rounds job. Returns leagues refreshed."""
+    refreshed = 0
+    for league in League.query.filter(or_(League.format.is_(None), League.format != 'knockout_bracket')).all():
+        season_key = _league_standings_season_key(_league_leaderboard_cutoff(league))
+        computed_at = dict(db.session.query(LeagueStanding.user_id, LeagueStanding.computed_at).filter_by(
+            league_id=league.id, season_key=season_key).all())
+        active = {lm.user_id for lm in league.league_memberships if not lm.user.deleted_at}
+        if not active or (active <= computed_at.keys() and not _league_standings_stale(
+                league, min((c for c in computed_at.values() if c), default=None))):
+            continue
+        try:
+            refresh_league_standings(league)
+            db.session.commit()
+            refreshed += 1
+        except Exception as e:
+            db.session.rollback()
+            print(f"Standings refresh failed for league {league.id}: {e}")
+    return refreshed
+
+
+def _rebuild_league_standings(league_id=None, check_only=False):
+    """Recompute league_standings from scratch with the live leaderboard logic.
+    Returns (leagues_checked, mismatches) where mismatches lists stored rows that differed from the live result."""
+    q = League.query.filter(or_(League.format.is_(None), League.format != 'knockout_bracket'))
+    if league_id is not None:
+        q = q.filter(League.id == league_id)
+    leagues = q.order_by(League.id).all()
+    mismatches = []
+    for league in leagues:
+        league_created_at = _league_leaderboard_cutoff(league)
+        season_key = _league_standings_season_key(league_created_at)
+        stored = {
+            r.user_id: r
+            for r in LeagueStanding.query.filter_by(league_id=league.id, season_key=season_key).all()
+        }
+        for row in _compute_full_season_leaderboard(league, league_created_at):
+            r = stored.get(row['user_id'])
+            got = (r.wins, r.draws, r.losses, r.points, r.total_games) if r else None
+            want = (row['wins'], row['draws'], row['losses'], row['points'], row['total_games'])
+            if got != want:
+                mismatches.append({'league_id': league.id, 'user_id': row['user_id'], 'stored': got, 'live': want})
+        if not check_only:
+            refresh_league_standings(league)
+    if not check_only:
+        db.session.commit()
+    return len(leagues), mismatches
+
+
+def _weekly_rounds(fixtures, league_created_at):
+    """Fixtures by round (on or after the leaderboard cutoff) and the set of complete rounds: a round is complete
+    when every fixture is scoreable or marked is_completed (e.g. rescheduled match)."""
+    by_round = {}
+    for f in fixtures:
+        if f.fixture_round is not None and _fixture_date_on_or_after_league(f, None, league_created_at, strict_missing_date=True):
+            by_round.setdefault(f.fixture_round, []).append(f)
+    completed = {
+        r for r, flist in by_round.items()
+        if all(getattr(f, 'is_completed', False) or _fixture_scoreable(f) for f in flist)
+    }
+    return by_round, completed
+
+
+def _as_round(value):
+    """fixture_round as int (None if missing or not a number)."""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _round_results_by_member(league, league_created_at, games_by_user, fixture_index, rounds, scoreable_fixtures):
+    """{round: {user_id: (wins, draws, losses)}} for the league's active members in each of rounds. Each pick is
+    resolved to its fixture once and scored with _compute_game_result; a scoreable fixture without a pick is a Loss
+    when the member predicted something in that round."""
+    rounds = {_as_round(r) for r in rounds} - {None}
+    league_competition_slug = getattr(league, 'competition_slug', None) or 'eng.1'
+    members = [lm for lm in league.league_memberships if not lm.user.deleted_at]
+    ordered = sorted(rounds)
+    counts = {(r, i): {'Win': 0, 'Draw': 0, 'Loss': 0} for r in ordered for i in range(len(members))}
+    rounds_with_pick = [set() for _ in members]
+    for i, lm in enumerate(members):
+        for g in games_by_user.get(lm.user_id, []):
+            fixture = _fixture_for_game(g, league_competition_slug, fixture_index=fixture_index)
+            fixture_round = _as_round(fixture.fixture_round) if fixture else None
+            if (
+                fixture_round not in rounds
+                or not _fixture_date_on_or_after_league(fixture, g, league_created_at, strict_missing_date=True)
+                or not _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True)
+                or not _game_fixture_dates_align(g, fixture)
+                or not _fixture_matches_league_competition(fixture, league)
+            ):
+                continue
+            result = _compute_game_result(g, fixture)
+            if result in counts[(fixture_round, i)]:
+                counts[(fixture_round, i)][result] += 1
+            rounds_with_pick[i].add(fixture_round)
+    fixtures_by_round = {}
+    for f in scoreable_fixtures:
+        if _as_round(f.fixture_round) in rounds:
+            fixtures_by_round.setdefault(_as_round(f.fixture_round), []).append(f)
+    out = {}
+    for r in ordered:
+        per_member = out[r] = {}
+        for i, lm in enumerate(members):
+            c = counts[(r, i)]
+            missed = 0
+            if r in rounds_with_pick[i]:
+                games = games_by_user.get(lm.user_id, [])
+                missed = sum(
+                    1 for f in fixtures_by_round.get(r, [])
+                    if _game_for_fixture(f, games, league_created_at=league_created_at) is None
+                )
+            per_member[lm.user_id] = (c['Win'], c['Draw'], c['Loss'] + missed)
+    return out
+
+
+def _rank(rows, key):
+    """{id(row): rank} with rows ordered by key (desc); equal keys share a rank (1, 2, 2, 4)."""
+    ordered = sorted(rows, key=key, reverse=True)
+    ranks = {}
+    for pos, row in enumerate(ordered):
+        prev = ordered[pos - 1] if pos else None
+        ranks[id(row)] = ranks[id(prev)] if prev is not None and key(prev) == key(row) else pos + 1
+    return ranks
+
+
+def _round_standings_snapshots(league, results_by_round, snapshot_rounds):
+    """League_round_standings rows for each round in snapshot_rounds: the round's W/D/L and points, season totals
+    through that round (plus backfill for full-season leagues) and ranks. Returns {round: [row dict]}."""
+    members = [lm for lm in league.league_memberships if not lm.user.deleted_at]
+    with_backfill = getattr(league, 'leaderboard_scope', 'full_season') != 'weekly'
+    totals = {
+        lm.user_id: [lm.backfill_wins or 0, lm.backfill_draws or 0, lm.backfill_losses or 0] if with_backfill else [0, 0, 0]
+        for lm in members
+    }
+    snapshots = {}
+    for r in sorted(results_by_round):
+        rows = []
+        for lm in members:
+            w, d, l = results_by_round[r].get(lm.user_id, (0, 0, 0))
+            t = totals[lm.user_id]
+            t[0], t[1], t[2] = t[0] + w, t[1] + d, t[2] + l
+            if r in snapshot_rounds:
+                rows.append({
+                    'user_id': lm.user_id, 'wins': w, 'draws': d, 'losses': l, 'points': (w * 3) + (d * 1),
+                    'total_wins': t[0], 'total_draws': t[1], 'total_losses': t[2], 'total_points': (t[0] * 3) + (t[1] * 1),
+                })
+        if r not in snapshot_rounds:
+            continue
+        round_ranks = _rank(rows, lambda x: (x['points'], -x['losses'], x['wins'], x['draws']))
+        season_ranks = _rank(rows, lambda x: (x['total_points'], -x['total_losses'], x['total_wins'], x['total_draws']))
+        for row in rows:
+            row['round_rank'] = round_ranks[id(row)]
+            row['rank'] = season_ranks[id(row)]
+        snapshots[r] = rows
+    return snapshots
+
+
+def _write_round_standings(league_id, season_key, snapshots, computed_at):
+    """Replace league_round_standings for the snapshot rounds with the given rows. Caller commits."""
+    if not snapshots:
+        return
+    LeagueRoundStanding.query.filter(
+        LeagueRoundStanding.league_id == league_id,
+        LeagueRoundStanding.season_key == season_key,
+        LeagueRoundStanding.fixture_round.in_(list(snapshots)),
+    ).delete(synchronize_session=False)
+    db.session.bulk_insert_mappings(LeagueRoundStanding, [
+        dict(row, league_id=league_id, season_key=season_key, fixture_round=r, computed_at=computed_at)
+        for r, rows in snapshots.items() for row in rows
+    ])
+
+
+def _round_close_plan(league, fixtures, closed=None, rebuild=False, from_round=None):
+    """(league_created_at, rounds to close or snapshot, scoreable fixtures) for a league: complete rounds not in
+    closed (every complete round when rebuild=True; rounds in closed from from_round on when from_round is given)
+    that have at least one scoreable fixture."""
+    league_created_at = _league_leaderboard_cutoff(league)
+    _by_round, completed = _weekly_rounds(fixtures, league_created_at)
+    scoreable = [
+        f for f in fixtures
+        if _fixture_scoreable(f) and _fixture_date_on_or_after_league(f, None, league_created_at, strict_missing_date=True)
+    ]
+    # Complete but unscored rounds (e.g. postponed and marked completed) close once scores arrive
+    scored_rounds = {_as_round(f.fixture_round) for f in scoreable}
+    if from_round is not None:
+        to_close = sorted(
+            r for r in completed
+            if _as_round(r) in scored_rounds and _as_round(r) >= from_round and (league.id, r) in (closed or ())
+        )
+    else:
+        to_close = sorted(
+            r for r in completed
+            if _as_round(r) in scored_rounds and (rebuild or (league.id, r) not in (closed or ()))
+        )
+    return league_created_at, to_close, scoreable
+
+
+def _close_competition_rounds(comp_slug, leagues, now, rebuild=False, from_round=None):
+    """Close (or with rebuild=True, re-snapshot) complete rounds for leagues of one competition; with from_round,
+    re-snapshot the closed rounds from that round on and re-award their weekly winners. Fixtures, closed rounds and
+    member games are loaded once for all of them. Returns rounds closed or snapshotted; caller commits."""
+    comp_filter = _fixture_query_competition(comp_slug)
+    fixtures = Fixture.query.filter(comp_filter).all() if comp_filter is not None else Fixture.query.all()
+    closed = set() if rebuild and from_round is None else set(
+        db.session.query(LeagueRoundClose.league_id, LeagueRoundClose.fixture_round)
+        .filter(LeagueRoundClose.league_id.in_([l.id for l in leagues])).all()
+    )
+    pending = []
+    for league in leagues:
+        league_created_at, to_close, scoreable = _round_close_plan(
+            league, fixtures, closed, rebuild=rebuild, from_round=from_round)
+        if to_close:
+            pending.append((league, league_created_at, to_close, scoreable))
+    if not pending:
+        return 0
+    fixture_index = FixtureIndex(fixtures)
+    member_ids = {lm.user_id for league, _, _, _ in pending for lm in league.league_memberships}
+    games_by_user = {}
+    for g in (Game.query.filter(Game.user_id.in_(member_ids)).all() if member_ids else []):
+        games_by_user.setdefault(g.user_id, []).append(g)
+    count = 0
+    for league, league_created_at, to_close, scoreable in pending:
+        # Season totals need every scored round up to the last one being closed
+        through = max(to_close)
+        rounds = {_as_round(f.fixture_round) for f in scoreable} - {None}
+        results = _round_results_by_member(
+            league, league_created_at, games_by_user, fixture_index, {r for r in rounds if r <= through}, scoreable)
+        snapshots = _round_standings_snapshots(league, results, set(to_close))
+        _write_round_standings(league.id, _league_standings_season_key(league_created_at), snapshots, now)
+        if rebuild:
+            count += len(snapshots)
+            continue
+        if from_round is not None:
+            # Bulk writes above bypass _leaderboard_changes_in_flush
+            _mark_leaderboard_changed(db.session, league_ids={league.id})
+            if getattr(league, 'leaderboard_scope', None) == 'weekly':
+                LeagueWeekWinner.query.filter(
+                    LeagueWeekWinner.league_id == league.id, LeagueWeekWinner.fixture_round.in_(to_close),
+                ).delete(synchronize_session=False)
+        for round_num in to_close:
+            if from_round is None:
+                db.session.add(LeagueRoundClose(league_id=league.id, fixture_round=round_num, closed_at=now))
+            rows = snapshots.get(round_num)
+            if getattr(league, 'leaderboard_scope', None) == 'weekly' and rows:
+                # Most points wins the week; ties = several winners
+                max_pts = max(row['points'] for row in rows)
+                for row in rows:
+                    if row['points'] == max_pts:
+                        db.session.add(LeagueWeekWinner(league_id=league.id, fixture_round=round_num, user_id=row['user_id']))
+            count += 1
+    return count
+
+
+def _round_close_leagues(competition_slugs=None, league_id=None):
+    """{competition_slug: [league]} for leagues with round closes (every format but knockout brackets)."""
+    q = League.query.filter(or_(League.format.is_(None), League.format != 'knockout_bracket'))
+    if league_id is not None:
+        q = q.filter(League.id == league_id)
+    leagues_by_comp = {}
+    for league in q.order_by(League.id).all():
+        comp_slug = league.competition_slug or 'eng.1'
+        if competition_slugs is None or comp_slug in competition_slugs:
+            leagues_by_comp.setdefault(comp_slug, []).append(league)
+    return leagues_by_comp
+
+
+def _close_completed_rounds(competition_slugs=None, now=None):
+    """Round-close pipeline: for every league (of competition_slugs, or all), close each complete round that has
+    no league_round_closes row yet: snapshot the standings (league_round_standings) and, in weekly leagues, record
+    the round's winners. A competition's closes commit together; a concurrent close of the same round hits the
+    primary key and that competition is left to the winner of the race. Returns rounds closed."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    closed_total = 0
+    for comp_slug, leagues in sorted(_round_close_leagues(competition_slugs).items()):
+        closed_here = _close_competition_rounds(comp_slug, leagues, now)
+        if not closed_here:
+            continue
+        try:
+            db.session.commit()
+            closed_total += closed_here
+        except IntegrityError:
+            db.session.rollback()
+            print(f"Round close for {comp_slug} lost a race with another worker; left to it")
+    return closed_total
+
+
+def _resnapshot_closed_rounds(competition_slug, from_round, user_id=None):
+    """Re-snapshot closed rounds of competition_slug from from_round on after a late change (a score corrected after
+    close, an admin editing or adding a pick), in every league of the competition or only user_id's leagues. The
+    weekly leaderboard reads closed rounds from these snapshots. Failures are logged; backfill-round-standings
+    repairs what is left. Returns rounds re-snapshotted."""
+    from_round = _as_round(from_round)
+    if from_round is None:
+        return 0
+    comp_slug = competition_slug or 'eng.1'
+    leagues = _round_close_leagues({comp_slug}).get(comp_slug, [])
+    if user_id is not None:
+        league_ids = {
+            lid for (lid,) in db.session.query(LeagueMembership.league_id).filter(LeagueMembership.user_id == user_id)
+        }
+        leagues = [l for l in leagues if l.id in league_ids]
+    if not leagues:
+        return 0
+    try:
+        count = _close_competition_rounds(
+            comp_slug, leagues, datetime.now(timezone.utc).replace(tzinfo=None), from_round=from_round)
+        db.session.commit()
+        return count
+    except Exception as e:
+        db.session.rollback()
+        print(f"Re-snapshot of closed {comp_slug} rounds from {from_round} failed: {e}")
+        return 0
+
+
+def _backfill_round_standings(league_id=None):
+    """Recompute league_round_standings for every complete round of each league's current season with the current
+    scoring logic (closes and weekly winners are left as they are). Returns snapshots written."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    written = 0
+    for comp_slug, leagues in sorted(_round_close_leagues(league_id=league_id).items()):
+        written += _close_competition_rounds(comp_slug, leagues, now, rebuild=True)
+        db.session.commit()
+    return written
+
+
+def _round_standings_payload(league, fixture_round, season_key=None):
+    """Stored snapshot for one round with display names and rank_change against the previous snapshot
+    (positive = moved up; None when the member has no earlier snapshot). None if the round has none."""
+    season_key = season_key or _league_standings_season_key(_league_leaderboard_cutoff(league))
+    rows = LeagueRoundStanding.query.filter_by(
+        league_id=league.id, season_key=season_key, fixture_round=fixture_round).all()
+    if not rows:
+        return None
+    prev_round = db.session.query(func.max(LeagueRoundStanding.fixture_round)).filter(
+        LeagueRoundStanding.league_id == league.id,
+        LeagueRoundStanding.season_key == season_key,
+        LeagueRoundStanding.fixture_round < fixture_round,
+    ).scalar()
+    prev_rank = {}
+    if prev_round is not None:
+        prev_rank = dict(db.session.query(LeagueRoundStanding.user_id, LeagueRoundStanding.rank).filter_by(
+            league_id=league.id, season_key=season_key, fixture_round=prev_round).all())
+    names = {lm.user_id: lm.display_name for lm in league.league_memberships}
+    standings = [{
+        'user_id': r.user_id,
+        'display_name': names.get(r.user_id),
+        'wins': r.wins, 'draws': r.draws, 'losses': r.losses, 'points': r.points, 'round_rank': r.round_rank,
+        'total_wins': r.total_wins, 'total_draws': r.total_draws, 'total_losses': r.total_losses,
+        'total_points': r.total_points, 'rank': r.rank,
+        'rank_change': (prev_rank[r.user_id] - r.rank) if r.user_id in prev_rank else None,
+    } for r in rows]
+    standings.sort(key=lambda x: (x['rank'], x['round_rank'], x['user_id']))
+    return {'round': fixture_round, 'previous_round': prev_round, 'standings': standings}
+
+
+def _leaderboard_cache_key(league, league_created_at, requested_round):
+    """Leaderboard cache key: league, its leaderboard_version, scope/format, ?round= and season, plus the latest
+    kickoff that has passed in the competition (placeholder 0-0 scores become scoreable at kickoff without any
+    row changing, so time alone can change the output)."""
+    comp_filter = _fixture_query_competition(getattr(league, 'competition_slug', None) or 'eng.1')
+    q = db.session.query(func.max(Fixture.fixture_date)).filter(
+        Fixture.fixture_date <= datetime.now(timezone.utc).replace(tzinfo=None))
+    if comp_filter is not None:
+        q = q.filter(comp_filter)
+    return leaderboard_cache.make_key(
+        'leaderboard', league.id, league.leaderboard_version or 0, getattr(league, 'leaderboard_scope', None),
+        getattr(league, 'format', None), requested_round, _league_standings_season_key(league_created_at), q.scalar(),
+    )
+
+
+def _etag_response(body, etag):
+    """200 with body, or 304 when If-None-Match already has etag; both carry the strong ETag."""
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = make_response(body, 200)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def _leaderboard_response(body, cache_key):
+    """Store a computed leaderboard under cache_key (None = not cacheable, e.g. ?debug=1) and respond with its ETag."""
+    return _etag_response(body, leaderboard_cache.put(cache_key, body))
+
+
 @app.route('/api/v1/leagues/<int:league_id>/leaderboard', methods=['GET'])
 def get_league_leaderboard(league_id):
     """Get leaderboard for a league - players ordered by points.
@@ -3945,24 +5511,28 @@ def get_league_leaderboard(league_id):
         league_created_at = _league_leaderboard_cutoff(league)
         
         # Check if user is a member (and not soft-deleted)
-        user = get_active_user_by_id(user_id)
-        if not user or user not in league.members:
+        if not is_active_league_member(user_id, league_id):
             return make_response({'error': 'User is not a member of this league'}, 403)
-        
-        def _result_for_game(game, fixture):
-            return _compute_game_result(game, fixture)
 
+        scope = getattr(league, 'leaderboard_scope', 'full_season')
+        cache_key = None
+        if not request.args.get('debug'):
+            cache_key = _leaderboard_cache_key(league, league_created_at, request.args.get('round', type=int))
+            cached = leaderboard_cache.get(cache_key)
+            if cached is not None:
+                return _etag_response(*cached)
+        _load_league_members(league)
+        if scope != 'weekly' and not request.args.get('debug') and getattr(league, 'format', None) != 'knockout_bracket':
+            # Full season is served from league_standings (kept current by syncs and prediction writes)
+            return _leaderboard_response({'leaderboard': _read_league_standings(league), 'scope': 'full_season'}, cache_key)
+        
         # Scoreable fixtures = have both scores and kickoff has passed (missed pick counts as Loss).
         # Only consider fixtures for this league's competition and on or after league creation.
         league_competition_slug = getattr(league, 'competition_slug', None) or 'eng.1'
 
-        def _member_has_game_for_fixture(member_id, fixture, games_list=None):
-            """True if member has a Game (prediction) for this fixture (using league competition for matching)."""
-            games = games_list if games_list is not None else Game.query.filter_by(user_id=member_id).all()
-            return _game_for_fixture(fixture, games, league_created_at=league_created_at) is not None
-
         comp_filter = _fixture_query_competition(league_competition_slug)
         all_fixtures = (Fixture.query.filter(comp_filter).all() if comp_filter is not None else Fixture.query.all())
+        fixture_index = FixtureIndex(all_fixtures)
         completed_fixtures = Fixture.query.filter(
             Fixture.actual_home_score.isnot(None),
             Fixture.actual_away_score.isnot(None)
@@ -4001,83 +5571,9 @@ def get_league_leaderboard(league_id):
                 'backfill_sample': [{'user_id': lm.user.id, 'wins': lm.backfill_wins, 'draws': lm.backfill_draws, 'losses': lm.backfill_losses} for lm in league.league_memberships[:5] if not getattr(lm.user, 'deleted_at', None)],
             }
 
-        scope = getattr(league, 'leaderboard_scope', 'full_season')
         if scope == 'weekly':
-            # --- Weekly leaderboard: backfill week winners, then return current week standings + weeks_won ---
-            all_fixtures_by_round = {}
-            q_rounds = Fixture.query.filter(Fixture.fixture_round.isnot(None))
-            if comp_filter is not None:
-                q_rounds = q_rounds.filter(comp_filter)
-            for f in q_rounds.all():
-                if _fixture_date_on_or_after_league(f, None, league_created_at, strict_missing_date=True):
-                    all_fixtures_by_round.setdefault(f.fixture_round, []).append(f)
-            # Round is complete when every fixture is scoreable or marked is_completed (e.g. rescheduled match)
-            completed_rounds = []
-            for r, flist in all_fixtures_by_round.items():
-                if all(
-                    getattr(f, 'is_completed', False) or _fixture_scoreable(f)
-                    for f in flist
-                ):
-                    completed_rounds.append(r)
-            # Backfill: award week winner(s) for any completed round we haven't recorded yet
-            for round_num in completed_rounds:
-                existing = LeagueWeekWinner.query.filter_by(league_id=league_id, fixture_round=round_num).first()
-                if existing:
-                    continue
-                round_fixtures = [f for f in completed_fixtures if f.fixture_round == round_num]
-                if not round_fixtures:
-                    continue
-                # Points per member for this round only
-                round_points = {}
-                for lm in league.league_memberships:
-                    if lm.user.deleted_at:
-                        continue
-                    wins, draws, losses = 0, 0, 0
-                    games = games_by_user.get(lm.user.id, [])
-                    for g in games:
-                        fixture = _fixture_for_game(g, league_competition_slug, fixtures_list=all_fixtures)
-                        if (
-                            not fixture
-                            or fixture.fixture_round != round_num
-                            or not _fixture_date_on_or_after_league(fixture, g, league_created_at, strict_missing_date=True)
-                            or not _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True)
-                            or not _game_fixture_dates_align(g, fixture)
-                            or not _fixture_matches_league_competition(fixture, league)
-                        ):
-                            continue
-                        res = _result_for_game(g, fixture)
-                        if res == 'Win':
-                            wins += 1
-                        elif res == 'Draw':
-                            draws += 1
-                        elif res == 'Loss':
-                            losses += 1
-                    rounds_with_pick = set()
-                    for g in games:
-                        fx = _fixture_for_game(g, league_competition_slug, fixtures_list=all_fixtures)
-                        if (
-                            fx
-                            and fx.fixture_round == round_num
-                            and _fixture_date_on_or_after_league(fx, g, league_created_at, strict_missing_date=True)
-                            and _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True)
-                            and _game_fixture_dates_align(g, fx)
-                            and _fixture_matches_league_competition(fx, league)
-                        ):
-                            rounds_with_pick.add(fx.fixture_round)
-                    for f in round_fixtures:
-                        if f.fixture_round not in rounds_with_pick:
-                            continue
-                        if not _member_has_game_for_fixture(lm.user.id, f, games_list=games_by_user.get(lm.user.id, [])):
-                            losses += 1
-                    pts = (wins * 3) + (draws * 1)
-                    round_points[lm.user_id] = (pts, wins, draws, losses)
-                if not round_points:
-                    continue
-                max_pts = max(p[0] for p in round_points.values())
-                for uid, (pts, _, _, _) in round_points.items():
-                    if pts == max_pts:
-                        db.session.add(LeagueWeekWinner(league_id=league_id, fixture_round=round_num, user_id=uid))
-            db.session.commit()
+            # --- Weekly leaderboard: current week standings + weeks_won (winners are written by the round-close job) ---
+            all_fixtures_by_round, completed_rounds = _weekly_rounds(all_fixtures, league_created_at)
             # Current round = lowest round that is not fully completed (the in-progress week); if all complete, use last round
             incomplete_rounds = [r for r in all_fixtures_by_round.keys() if r not in completed_rounds]
             if incomplete_rounds:
@@ -4111,48 +5607,20 @@ def get_league_leaderboard(league_id):
                         return int(f) == int(r)
                     except (TypeError, ValueError):
                         return False
-                round_fixtures = [f for f in completed_fixtures if _round_eq(f.fixture_round, display_round)]
+                # Closed rounds are read from their snapshot; the open round is computed live
+                snapshot = _round_standings_payload(league, display_round) if display_round in completed_rounds else None
+                if snapshot and {lm.user_id for lm in league.league_memberships if not lm.user.deleted_at} <= {
+                        r['user_id'] for r in snapshot['standings']}:
+                    round_results = {r['user_id']: (r['wins'], r['draws'], r['losses']) for r in snapshot['standings']}
+                else:
+                    round_fixtures = [f for f in completed_fixtures if _round_eq(f.fixture_round, display_round)]
+                    round_results = _round_results_by_member(league, league_created_at, games_by_user, fixture_index,
+                                                             {display_round}, round_fixtures)[display_round]
                 leaderboard = []
                 for lm in league.league_memberships:
                     if lm.user.deleted_at:
                         continue
-                    wins, draws, losses = 0, 0, 0
-                    games = games_by_user.get(lm.user.id, [])
-                    for g in games:
-                        fixture = _fixture_for_game(g, league_competition_slug, fixtures_list=all_fixtures)
-                        if (
-                            not fixture
-                            or not _round_eq(fixture.fixture_round, display_round)
-                            or not _fixture_date_on_or_after_league(fixture, g, league_created_at, strict_missing_date=True)
-                            or not _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True)
-                            or not _game_fixture_dates_align(g, fixture)
-                            or not _fixture_matches_league_competition(fixture, league)
-                        ):
-                            continue
-                        res = _result_for_game(g, fixture)
-                        if res == 'Win':
-                            wins += 1
-                        elif res == 'Draw':
-                            draws += 1
-                        elif res == 'Loss':
-                            losses += 1
-                    rounds_with_pick = set()
-                    for g in games:
-                        fx = _fixture_for_game(g, league_competition_slug, fixtures_list=all_fixtures)
-                        if (
-                            fx
-                            and _round_eq(fx.fixture_round, display_round)
-                            and _fixture_date_on_or_after_league(fx, g, league_created_at, strict_missing_date=True)
-                            and _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True)
-                            and _game_fixture_dates_align(g, fx)
-                            and _fixture_matches_league_competition(fx, league)
-                        ):
-                            rounds_with_pick.add(fx.fixture_round)
-                    for f in round_fixtures:
-                        if f.fixture_round not in rounds_with_pick:
-                            continue
-                        if not _member_has_game_for_fixture(lm.user.id, f, games_list=games_by_user.get(lm.user.id, [])):
-                            losses += 1
+                    wins, draws, losses = round_results[lm.user_id]
                     points = (wins * 3) + (draws * 1)
                     total_games = wins + draws + losses
                     leaderboard.append({
@@ -4166,63 +5634,14 @@ def get_league_leaderboard(league_id):
             resp = {'leaderboard': leaderboard, 'scope': 'weekly', 'current_round': display_round}
             if debug_data is not None:
                 resp['debug'] = debug_data
-            return make_response(resp, 200)
+            return _leaderboard_response(resp, cache_key)
 
-        # Full season: backfill + fixture-first scoring. Iterate completed fixtures and match each member's game by team names (same logic as _fixture_matches_game) so leaderboard works after API/team-name changes.
-        leaderboard = []
-        for lm in league.league_memberships:
-            member = lm.user
-            if member.deleted_at:
-                continue
-            wins = lm.backfill_wins or 0
-            draws = lm.backfill_draws or 0
-            losses = lm.backfill_losses or 0
-            games = games_by_user.get(member.id, [])
-            # Which rounds does this member have at least one prediction for? (so we can count missed picks as Loss)
-            rounds_with_pick = set()
-            for f in completed_fixtures:
-                if f.fixture_round is not None and _game_for_fixture(f, games, league_created_at=league_created_at) is not None:
-                    rounds_with_pick.add(f.fixture_round)
-            # Fixture-first: for each completed fixture, find this member's game and score it
-            for f in completed_fixtures:
-                game = _game_for_fixture(f, games, league_created_at=league_created_at)
-                if game is not None:
-                    res = _result_for_game(game, f)
-                    if res == 'Win':
-                        wins += 1
-                    elif res == 'Draw':
-                        draws += 1
-                    elif res == 'Loss':
-                        losses += 1
-                else:
-                    if f.fixture_round is not None and f.fixture_round in rounds_with_pick:
-                        losses += 1
-            # Fallback: if no completed fixtures in DB (e.g. sync didn't match) but games have game_result from check-results, count those so leaderboard isn't stuck at 0
-            if (wins, draws, losses) == (lm.backfill_wins or 0, lm.backfill_draws or 0, lm.backfill_losses or 0) and not completed_fixtures:
-                for g in games:
-                    if not _game_date_on_or_after_league(g, league_created_at, strict_missing_date=True):
-                        continue
-                    gr = getattr(g, 'game_result', None)
-                    if gr == 'Win':
-                        wins += 1
-                    elif gr == 'Draw':
-                        draws += 1
-                    elif gr == 'Loss':
-                        losses += 1
-            points = (wins * 3) + (draws * 1) + (losses * 0)
-            total_games = wins + draws + losses
-            leaderboard.append({
-                'user_id': member.id,
-                'display_name': lm.display_name,
-                'wins': wins,
-                'draws': draws,
-                'losses': losses,
-                'points': points,
-                'total_games': total_games,
-            })
-        
-        # Sort by points (descending), then by fewest losses first, then wins, then draws
-        leaderboard.sort(key=lambda x: (x['points'], -x['losses'], x['wins'], x['draws']), reverse=True)
+        # Full season (debug only; normal requests read league_standings above): backfill + fixture-first scoring, live.
+        leaderboard = _full_season_standings(
+            [lm for lm in league.league_memberships if not lm.user.deleted_at],
+            games_by_user, completed_fixtures, league_created_at,
+        )
+        leaderboard.sort(key=_leaderboard_sort_key, reverse=True)
 
         if debug_data and completed_fixtures and member_ids:
             first_member_id = member_ids[0]
@@ -4240,7 +5659,7 @@ def get_league_leaderboard(league_id):
         resp = {'leaderboard': leaderboard, 'scope': 'full_season'}
         if debug_data is not None:
             resp['debug'] = debug_data
-        return make_response(resp, 200)
+        return _leaderboard_response(resp, cache_key)
     except Exception as e:
         print(f"Error fetching leaderboard: {str(e)}")
         import traceback
@@ -4248,6 +5667,73 @@ def get_league_leaderboard(league_id):
         return make_response({'error': str(e)}, 500)
 
 
+@app.route('/api/v1/leagues/<int:league_id>/round-standings', methods=['GET'])
+def get_league_round_standings(league_id):
+    """Standings snapshot taken when a round closed: round and season-to-date W/D/L, points, ranks and rank_change
+    (positions gained since the previous closed round). Query: ?round=N (default: latest closed round).
+    Read from league_round_standings only, so past weeks cost the same as the latest one."""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return make_response({'error': 'User not authenticated'}, 401)
+        league = db.session.get(League, league_id)
+        if not league:
+            return make_response({'error': 'League not found'}, 404)
+        if not is_active_league_member(user_id, league_id):
+            return make_response({'error': 'User is not a member of this league'}, 403)
+        _load_league_members(league)
+        season_key = _league_standings_season_key(_league_leaderboard_cutoff(league))
+        rounds = [r for (r,) in db.session.query(LeagueRoundStanding.fixture_round).filter_by(
+            league_id=league_id, season_key=season_key).distinct().order_by(LeagueRoundStanding.fixture_round)]
+        fixture_round = request.args.get('round', type=int)
+        if fixture_round is None:
+            fixture_round = rounds[-1] if rounds else None
+        payload = _round_standings_payload(league, fixture_round, season_key=season_key) if fixture_round is not None else None
+        if payload is None:
+            return make_response({'error': 'No standings snapshot for that round yet', 'rounds': rounds}, 404)
+        payload['rounds'] = rounds
+        return make_response(payload, 200)
+    except Exception as e:
+        print(f"Error fetching round standings: {str(e)}")
+        return make_response({'error': str(e)}, 500)
+
+
+@app.route('/api/v1/leagues/<int:league_id>/round-standings/history', methods=['GET'])
+def get_league_round_standings_history(league_id):
+    """Points-over-time series from the round snapshots: per member, season total_points and rank after each
+    closed round of the current season."""
+    try:
+        user_id = get_current_user_id()
+        if not user_id:
+            return make_response({'error': 'User not authenticated'}, 401)
+        league = db.session.get(League, league_id)
+        if not league:
+            return make_response({'error': 'League not found'}, 404)
+        if not is_active_league_member(user_id, league_id):
+            return make_response({'error': 'User is not a member of this league'}, 403)
+        _load_league_members(league)
+        season_key = _league_standings_season_key(_league_leaderboard_cutoff(league))
+        rows = db.session.query(
+            LeagueRoundStanding.user_id, LeagueRoundStanding.fixture_round,
+            LeagueRoundStanding.points, LeagueRoundStanding.total_points, LeagueRoundStanding.rank,
+        ).filter_by(league_id=league_id, season_key=season_key).order_by(
+            LeagueRoundStanding.user_id, LeagueRoundStanding.fixture_round).all()
+        names = {lm.user_id: lm.display_name for lm in league.league_memberships if not lm.user.deleted_at}
+        series = {}
+        for uid, fixture_round, points, total_points, rank in rows:
+            if uid not in names:
+                continue
+            series.setdefault(uid, {'user_id': uid, 'display_name': names[uid], 'points': []})['points'].append(
+                {'round': fixture_round, 'points': points, 'total_points': total_points, 'rank': rank})
+        return make_response({
+            'rounds': sorted({r[1] for r in rows}),
+            'series': sorted(series.values(), key=lambda x: x['user_id']),
+        }, 200)
+    except Exception as e:
+        print(f"Error fetching round standings history: {str(e)}")
+        return make_response({'error': str(e)}, 500)
+
+
 @app.route('/api/v1/leagues/<int:league_id>/start-new-season', methods=['POST'])
 def start_new_league_season(league_id):
     """Admin only: reset league standings for a new season in the same league.
@@ -4294,12 +5780,16 @@ def start_new_league_season(league_id):
             lm.last_missing_predictions_round = None
             members_reset += 1
         week_winners_deleted = LeagueWeekWinner.query.filter_by(league_id=league_id).delete()
+        LeagueRoundClose.query.filter_by(league_id=league_id).delete()
+        LeagueStanding.query.filter_by(league_id=league_id).delete()
 
         sync_result = None
         if data.get('sync_fixtures'):
             sync_result = _sync_fixtures_for_competition_slug(comp_slug)
 
         db.session.commit()
+        refresh_league_standings(league)
+        db.session.commit()
 
         resp = {
             'message': 'New season started. Standings reset to 0W/0D/0L for all members.',
@@ -4390,6 +5880,7 @@ def backfill_league_standings(league_id):
             lm.backfill_losses = losses
             lm.backfill_points = points
             updated += 1
+        refresh_league_standings(league)
         db.session.commit()
         return make_response({'message': f'Backfilled standings for {updated} member(s)'}, 200)
     except Exception as e:
@@ -4422,10 +5913,8 @@ def _dedupe_fixtures():
     Prefer keeping the row with external_id set (football-data/ESPN id); else keep smallest id.
     Returns number of duplicate rows removed.
 
-    Predictions are preserved: Prediction -> game_id -> Game. Games do not store fixture_id; they store
-    home_team/away_team. Fixtures are matched to games by team names (with normalization) in _fixture_for_game.
-    Dedupe only deletes Fixture rows; Game and Prediction are never touched. The remaining fixture per match
-    still matches all existing games by team names."""
+    Predictions are preserved: Prediction -> game_id -> Game. Games linked to a removed duplicate are
+    re-pointed at the kept fixture (Game.fixture_id); unlinked games still match it by team names."""
     fixtures = Fixture.query.all()
     groups = {}
     for f in fixtures:
@@ -4446,6 +5935,9 @@ def _dedupe_fixtures():
         if len(group) <= 1:
             continue
         group.sort(key=lambda x: (0 if (getattr(x, 'external_id', None) or '').strip() else 1, x.id))
+        Game.query.filter(Game.fixture_id.in_([dup.id for dup in group[1:]])).update(
+            {Game.fixture_id: group[0].id}, synchronize_session=False
+        )
         for dup in group[1:]:
             db.session.delete(dup)
             deleted += 1
@@ -4473,6 +5965,225 @@ def dedupe_fixtures_cmd():
             print("No duplicate fixtures found.")
 
 
+@app.cli.command('link-game-fixtures')
+@click.option('--dry-run', is_flag=True, help='Report what would be linked without writing.')
+def link_game_fixtures_cmd(dry_run):
+    """Set games.fixture_id for predictions saved before the column existed. Run from server dir: flask link-game-fixtures."""
+    with app.app_context():
+        linked, unmatched, ambiguous = _link_game_fixtures(dry_run=dry_run)
+        verb = 'Would link' if dry_run else 'Linked'
+        print(f"{verb} {linked} prediction(s); {unmatched} without a matching fixture, {ambiguous} ambiguous (left on name matching).")
+        if linked and not dry_run:
+            _rebuild_league_standings()
+
+
+@app.cli.command('reconcile-game-results')
+@click.option('--fix', is_flag=True, help='Write the computed results instead of only reporting drift.')
+def reconcile_game_results_cmd(fix):
+    """Report predictions whose stored game_result differs from their fixture's score. Run from server dir: flask reconcile-game-results [--fix]."""
+    with app.app_context():
+        report = _reconcile_game_results(fix=fix)
+        for sample in report['samples']:
+            print(f"  game {sample['game_id']} (fixture {sample['fixture_id']}): stored {sample['stored']}, expected {sample['expected']}")
+        verb = 'Fixed' if fix else 'Found'
+        print(f"Checked {report['checked']} prediction(s). {verb} {report['drift']} with drifted game_result.")
+
+
+@app.cli.command('rebuild-league-standings')
+@click.option('--league-id', type=int, default=None, help='Only rebuild this league.')
+@click.option('--check', is_flag=True, help='Report rows that differ from the live computation without writing.')
+def rebuild_league_standings_cmd(league_id, check):
+    """Recompute league_standings from predictions + fixtures. Run from server dir: flask rebuild-league-standings [--check]."""
+    with app.app_context():
+        checked, mismatches = _rebuild_league_standings(league_id=league_id, check_only=check)
+        for m in mismatches:
+            print(f"League {m['league_id']} user {m['user_id']}: stored {m['stored']} != live {m['live']}")
+        verb = 'Checked' if check else 'Rebuilt'
+        print(f"{verb} {checked} league(s); {len(mismatches)} row(s) differed from the live leaderboard.")
+
+
+@app.cli.command('backfill-round-standings')
+@click.option('--league-id', type=int, default=None, help='Only this league.')
+def backfill_round_standings_cmd(league_id):
+    """Write league_round_standings snapshots for every complete round of the current season (replacing stored ones).
+    Run from server dir: flask backfill-round-standings [--league-id N]."""
+    with app.app_context():
+        written = _backfill_round_standings(league_id=league_id)
+        print(f"Wrote standings snapshots for {written} league round(s).")
+
+
+@app.cli.command('generate-ai-suggestions')
+@click.option('--competition', default='eng.1', help='Competition slug (default eng.1).')
+@click.option('--round', 'fixture_round', type=int, required=True, help='Round to generate suggestions for.')
+def generate_ai_suggestions_cmd(competition, fixture_round):
+    """Generate Ask AI suggestions for every upcoming fixture of a round in one model call (replacing stored ones).
+    Run from server dir: flask generate-ai-suggestions --round N [--competition slug]."""
+    with app.app_context():
+        backend, unavailable = ai_suggestions.get_backend()
+        if backend is None:
+            print(unavailable)
+            return
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        q = Fixture.query.filter(Fixture.fixture_round == fixture_round, Fixture.fixture_date > now, _fixture_not_completed_filter())
+        comp_filter = _fixture_query_competition(competition)
+        if comp_filter is not None:
+            q = q.filter(comp_filter)
+        first = q.order_by(Fixture.fixture_date.asc(), Fixture.id.asc()).first()
+        if first is None:
+            print(f"No upcoming fixtures in {competition} round {fixture_round}.")
+            return
+        rows = _generate_round_ai_suggestions(backend, first, now=now)
+        if rows is None:
+            print(f"Suggestions for {competition} round {fixture_round} are being generated elsewhere; try again later.")
+            return
+        print(f"Stored {len(rows)} suggestion(s) from {backend.name}.")
+
+
+@app.cli.command('clear-provider-cache')
+def clear_provider_cache_cmd():
+    """Drop cached provider feeds so the next sync re-downloads and re-applies everything (e.g. after wiping fixtures)."""
+    removed = provider_cache.clear() if REQUESTS_AVAILABLE else 0
+    print(f"Removed {removed} cached provider response(s).")
+
+
+def _scheduled_competitions():
+    """Competitions some league plays (legacy NULL slug = eng.1) that a provider can sync."""
+    slugs = {slug or 'eng.1' for (slug,) in db.session.query(League.competition_slug).distinct().all()}
+    has_football_data_key = bool((os.getenv('FOOTBALL_DATA_ORG_API_KEY') or '').strip())
+    return [
+        c for c in SUPPORTED_COMPETITIONS
+        if c['slug'] in slugs and (c.get('source') == 'espn' or (c.get('source') == 'football_data' and has_football_data_key))
+    ]
+
+
+def _job_nightly_fixture_sync():
+    """Full fixture sync for every scheduled competition. Returns (fixtures written, errors)."""
+    written, errors = 0, []
+    for comp in _scheduled_competitions():
+        result = _sync_fixtures_for_competition_slug(comp['slug'])
+        if result.get('error'):
+            errors.append(f"{comp['slug']}: {result['error']}")
+        else:
+            written += result.get('total_written', 0)
+    return written, errors
+
+
+def _job_live_score_sync():
+    """mode=live score sync for every scheduled competition (no provider request when nothing is live)."""
+    updated, errors = 0, []
+    for comp in _scheduled_competitions():
+        try:
+            _added, comp_updated, _seen, err = _sync_scores_live(comp)
+            if err:
+                db.session.rollback()
+                errors.append(f"{comp['slug']}: {err}")
+                continue
+            db.session.commit()
+            _mark_provider_feeds_processed()
+            _refresh_dirty_standings()
+            updated += comp_updated
+        except Exception as e:
+            db.session.rollback()
+            errors.append(f"{comp['slug']}: {e}")
+    return updated, errors
+
+
+def _job_rescore_results():
+    """Rescore fixtures still flagged results_pending (e.g. a worker died between a sync's commit and its rescore)."""
+    _fixtures, updated = _rescore_fixtures()
+    _refresh_dirty_standings()
+    return updated, []
+
+
+def _job_close_rounds():
+    """Close complete rounds of weekly leagues and store missing or stale full-season standings (fixtures that
+    became scoreable at kickoff, without a score change, are only picked up here)."""
+    return _close_completed_rounds() + _refresh_stale_standings(), []
+
+
+def _job_missing_prediction_reminders():
+    sent, err, stats = _send_missing_predictions_notifications()
+    errors = [err] if err else []
+    if stats.get('failed'):
+        errors.append(f"{stats['failed']} reminder email(s) not queued (MAIL_SERVER is not set)")
+    return sent, errors
+
+
+def _job_email_outbox():
+    """Deliver queued emails (retries included; the per-process sender thread usually gets there first) and purge
+    finished rows past EMAIL_OUTBOX_RETENTION_DAYS."""
+    totals = email_outbox.drain()
+    errors = [f"{totals['failed']} email(s) failed permanently"] if totals['failed'] else []
+    email_outbox.purge()
+    return totals['sent'], errors
+
+
+scheduler.register_job('nightly-fixture-sync', _job_nightly_fixture_sync,
+                       daily_at_hour=app.config['SCHEDULER_NIGHTLY_SYNC_HOUR_UTC'], lock_ttl=timedelta(hours=1))
+scheduler.register_job('live-score-sync', _job_live_score_sync,
+                       interval=timedelta(seconds=app.config['SCHEDULER_LIVE_SCORES_INTERVAL_SECONDS']),
+                       lock_ttl=timedelta(minutes=10))
+scheduler.register_job('missing-prediction-reminders', _job_missing_prediction_reminders,
+                       interval=timedelta(minutes=app.config['SCHEDULER_REMINDERS_INTERVAL_MINUTES']),
+                       lock_ttl=timedelta(minutes=30))
+scheduler.register_job('rescore-results', _job_rescore_results,
+                       interval=timedelta(minutes=app.config['SCHEDULER_RESCORE_INTERVAL_MINUTES']),
+                       lock_ttl=timedelta(minutes=10))
+scheduler.register_job('close-rounds', _job_close_rounds,
+                       interval=timedelta(minutes=app.config['SCHEDULER_ROUND_CLOSE_INTERVAL_MINUTES']),
+                       lock_ttl=timedelta(minutes=10))
+scheduler.register_job('email-outbox', _job_email_outbox,
+                       interval=timedelta(seconds=app.config['EMAIL_OUTBOX_POLL_SECONDS']),
+                       lock_ttl=timedelta(minutes=10))
+
+
+@app.route('/api/v1/admin/job-runs', methods=['GET'])
+def get_job_runs():
+    """Recent background job runs and lock state. Query: ?job=name&limit=50. Require X-Cron-Secret header."""
+    secret = (request.headers.get('X-Cron-Secret') or '').strip()
+    if not secret or secret != app.config.get('NOTIFICATION_CRON_SECRET'):
+        return make_response({'error': 'Unauthorized'}, 401)
+    try:
+        limit = min(max(int(request.args.get('limit', 50)), 1), 500)
+    except (TypeError, ValueError):
+        limit = 50
+    q = JobRun.query
+    job_name = (request.args.get('job') or '').strip()
+    if job_name:
+        q = q.filter(JobRun.job_name == job_name)
+    runs = q.order_by(JobRun.started_at.desc(), JobRun.id.desc()).limit(limit).all()
+    locks = {lock.name: lock for lock in JobLock.query.all()}
+    jobs = []
+    for name, job in sorted(scheduler.registered_jobs().items()):
+        lock = locks.get(name)
+        jobs.append({
+            'name': name,
+            'interval_seconds': int(job.interval.total_seconds()) if job.interval else None,
+            'daily_at_hour_utc': job.daily_at_hour,
+            'last_started_at': lock.last_started_at.isoformat() if lock and lock.last_started_at else None,
+            'locked_by': lock.owner if lock and lock.expires_at and lock.expires_at > datetime.now(timezone.utc).replace(tzinfo=None) else None,
+        })
+    return make_response({
+        'scheduler_enabled': bool(app.config.get('SCHEDULER_ENABLED')),
+        'jobs': jobs,
+        'runs': [r.to_dict() for r in runs],
+    }, 200)
+
+
+@app.cli.command('run-job')
+@click.argument('name')
+def run_job_cmd(name):
+    """Run one scheduled job now (ignores its schedule, still takes the DB lock). Run from server dir: flask run-job nightly-fixture-sync."""
+    if name not in scheduler.registered_jobs():
+        raise click.BadParameter(f"Unknown job {name}; one of: {', '.join(sorted(scheduler.registered_jobs()))}")
+    with app.app_context():
+        run = scheduler.run_job(name, force=True)
+        if run is None:
+            print(f"{name} is running in another worker; try again later.")
+        else:
+            print(f"{name}: {run.status} in {run.duration_ms} ms, {run.items_processed} item(s)" + (f"\n{run.error}" if run.error else ''))
+
+
 from bracket_routes import register_bracket_routes
 register_bracket_routes(app, get_current_user_id=get_current_user_id)
 
@@ -4491,6 +6202,40 @@ def _bootstrap_bracket_editions_on_startup():
 _bootstrap_bracket_editions_on_startup()
 
 
+def _load_team_registry_on_startup():
+    if app.config.get('TESTING'):
+        return
+    try:
+        with app.app_context():
+            loaded = _load_team_registry()
+            db.session.remove()
+        if loaded:
+            print(f'Team registry loaded: {loaded} alias(es)')
+    except Exception as e:
+        print(f'Team registry startup load skipped: {e}')
+
+
+_load_team_registry_on_startup()
+
+
+def _start_scheduler_on_startup():
+    if app.config.get('TESTING') or not app.config.get('SCHEDULER_ENABLED'):
+        return
+    if scheduler.start():
+        print(f'Scheduler started ({scheduler.OWNER}): {", ".join(sorted(scheduler.registered_jobs()))}')
+
+
+_start_scheduler_on_startup()
+
+
+@app.cli.command('drain-email-outbox')
+def drain_email_outbox_cmd():
+    """Send every due email in the outbox now. Run from server dir: flask drain-email-outbox."""
+    with app.app_context():
+        totals = email_outbox.drain(max_batches=1000)
+        print(f"Sent {totals['sent']}, retrying {totals['retrying']}, failed {totals['failed']}.")
+
+
 # SPA fallback: serve React app's index.html for non-API GET requests (fixes refresh 404)
 _CLIENT_BUILD = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'client', 'build')
 
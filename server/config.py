@@ -106,8 +106,73 @@ app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_DEFAULT_SENDER', '')  # e.g.
 app.config['RESET_PASSWORD_BASE_URL'] = os.getenv('RESET_PASSWORD_BASE_URL', '')
 # Set to 1/true to never attempt sending (avoids 502 if gateway timeout is very short). Reset link still returned.
 app.config['SKIP_PASSWORD_RESET_EMAIL'] = os.getenv('SKIP_PASSWORD_RESET_EMAIL', '').lower() in ('1', 'true', 'yes')
+# Email outbox (email_outbox.py): emails are queued in the email_outbox table and sent by a per-process sender
+# thread (woken on enqueue, polls for retries) on at most EMAIL_OUTBOX_CONCURRENCY reused connections. Failed sends
+# retry after BACKOFF * 2^(attempt-1) seconds, up to MAX_ATTEMPTS. Per-provider send rates are messages/second.
+app.config['EMAIL_OUTBOX_SENDER_ENABLED'] = os.getenv('EMAIL_OUTBOX_SENDER_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+app.config['EMAIL_OUTBOX_POLL_SECONDS'] = int(os.getenv('EMAIL_OUTBOX_POLL_SECONDS', '30'))
+app.config['EMAIL_OUTBOX_BATCH_SIZE'] = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', '50'))
+app.config['EMAIL_OUTBOX_CONCURRENCY'] = int(os.getenv('EMAIL_OUTBOX_CONCURRENCY', '2'))
+app.config['EMAIL_OUTBOX_MAX_ATTEMPTS'] = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '5'))
+app.config['EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS'] = int(os.getenv('EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS', '30'))
+# Sent and failed rows are deleted by the email-outbox job after this many days (reset bodies are blanked at once)
+app.config['EMAIL_OUTBOX_RETENTION_DAYS'] = int(os.getenv('EMAIL_OUTBOX_RETENTION_DAYS', '30'))
+app.config['EMAIL_SMTP_RATE_PER_SECOND'] = float(os.getenv('EMAIL_SMTP_RATE_PER_SECOND', '5'))
+app.config['EMAIL_SENDGRID_RATE_PER_SECOND'] = float(os.getenv('EMAIL_SENDGRID_RATE_PER_SECOND', '10'))
 # Secret for cron to trigger missing-predictions emails. Set NOTIFICATION_CRON_SECRET and call GET /api/v1/notifications/send-missing-predictions with header X-Cron-Secret: <secret>
 app.config['NOTIFICATION_CRON_SECRET'] = os.getenv('NOTIFICATION_CRON_SECRET', '')
+# ESPN scoreboard sync: base URL (override for a local stand-in), parallel per-date requests, and minimum
+# spacing in seconds between request starts to the host (politeness).
+app.config['ESPN_API_BASE_URL'] = os.getenv('ESPN_API_BASE_URL', 'https://site.api.espn.com/apis/site/v2/sports/soccer').rstrip('/')
+app.config['ESPN_FETCH_CONCURRENCY'] = int(os.getenv('ESPN_FETCH_CONCURRENCY', '8'))
+app.config['ESPN_FETCH_DELAY_SECONDS'] = float(os.getenv('ESPN_FETCH_DELAY_SECONDS', '0.02'))
+# Score sync mode=live: only fixtures kicking off within [now - BEFORE, now + AFTER] minutes, plus fixtures that
+# started in the last LOOKBACK hours and are not completed yet.
+app.config['SCORES_LIVE_WINDOW_BEFORE_MINUTES'] = int(os.getenv('SCORES_LIVE_WINDOW_BEFORE_MINUTES', '180'))
+app.config['SCORES_LIVE_WINDOW_AFTER_MINUTES'] = int(os.getenv('SCORES_LIVE_WINDOW_AFTER_MINUTES', '30'))
+app.config['SCORES_LIVE_LOOKBACK_HOURS'] = int(os.getenv('SCORES_LIVE_LOOKBACK_HOURS', '48'))
+# Background scheduler (scheduler.py): off unless SCHEDULER_ENABLED=1. Every worker runs the loop; a DB lock per
+# job lets only one of them execute it. Nightly full fixture sync at SCHEDULER_NIGHTLY_SYNC_HOUR_UTC, live score
+# polls, missing-prediction reminder sweeps, the rescore-results sweep (leftover results_pending fixtures) and the
+# close-rounds sweep (weekly-league round winners) at the given intervals.
+app.config['SCHEDULER_ENABLED'] = os.getenv('SCHEDULER_ENABLED', '').lower() in ('1', 'true', 'yes')
+app.config['SCHEDULER_TICK_SECONDS'] = int(os.getenv('SCHEDULER_TICK_SECONDS', '15'))
+app.config['SCHEDULER_NIGHTLY_SYNC_HOUR_UTC'] = int(os.getenv('SCHEDULER_NIGHTLY_SYNC_HOUR_UTC', '4'))
+app.config['SCHEDULER_LIVE_SCORES_INTERVAL_SECONDS'] = int(os.getenv('SCHEDULER_LIVE_SCORES_INTERVAL_SECONDS', '60'))
+app.config['SCHEDULER_REMINDERS_INTERVAL_MINUTES'] = int(os.getenv('SCHEDULER_REMINDERS_INTERVAL_MINUTES', '60'))
+app.config['SCHEDULER_RESCORE_INTERVAL_MINUTES'] = int(os.getenv('SCHEDULER_RESCORE_INTERVAL_MINUTES', '5'))
+app.config['SCHEDULER_ROUND_CLOSE_INTERVAL_MINUTES'] = int(os.getenv('SCHEDULER_ROUND_CLOSE_INTERVAL_MINUTES', '15'))
+# Outbound provider HTTP (provider_client): connections kept per host, retries with backoff on 429/5xx.
+app.config['PROVIDER_HTTP_POOL_SIZE'] = int(os.getenv('PROVIDER_HTTP_POOL_SIZE', '16'))
+app.config['PROVIDER_HTTP_RETRIES'] = int(os.getenv('PROVIDER_HTTP_RETRIES', '3'))
+app.config['PROVIDER_HTTP_BACKOFF'] = float(os.getenv('PROVIDER_HTTP_BACKOFF', '0.5'))
+app.config['PROVIDER_HTTP_CONNECT_TIMEOUT'] = float(os.getenv('PROVIDER_HTTP_CONNECT_TIMEOUT', '5'))
+# Provider feed cache (provider_cache): bodies on disk, revalidated with ETag/Last-Modified, LRU-evicted
+# above PROVIDER_CACHE_MAX_BYTES. Set PROVIDER_CACHE_DIR to an empty string to disable it.
+app.config['PROVIDER_CACHE_DIR'] = os.getenv(
+    'PROVIDER_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'providers'))
+app.config['PROVIDER_CACHE_MAX_BYTES'] = int(os.getenv('PROVIDER_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+# Leaderboard response cache (leaderboard_cache): 'memory' (per-process LRU, default), 'redis' (shared by all
+# workers; LEADERBOARD_CACHE_URL or REDIS_URL, needs the redis package) or 'none'. Entries are keyed by the league's
+# leaderboard_version, so a change is never served stale; the TTL only bounds how long unused entries live.
+app.config['LEADERBOARD_CACHE_BACKEND'] = os.getenv('LEADERBOARD_CACHE_BACKEND', 'memory').strip().lower()
+app.config['LEADERBOARD_CACHE_URL'] = os.getenv('LEADERBOARD_CACHE_URL') or os.getenv('REDIS_URL', '')
+app.config['LEADERBOARD_CACHE_MAX_ENTRIES'] = int(os.getenv('LEADERBOARD_CACHE_MAX_ENTRIES', '512'))
+app.config['LEADERBOARD_CACHE_TTL_SECONDS'] = int(os.getenv('LEADERBOARD_CACHE_TTL_SECONDS', '3600'))
+# External standings cache (standings_cache): tables younger than STANDINGS_CACHE_TTL_SECONDS are served as is; older
+# ones are served while one background refresh runs; the last good table is kept STANDINGS_CACHE_STALE_SECONDS for
+# provider outages. Backend 'memory' (default), 'redis' (shared, one refresh across workers; STANDINGS_CACHE_URL or
+# REDIS_URL) or 'none'. STANDINGS_CACHE_LOCK: the memory backend's refresh lock, 'database' (a job_locks row, one
+# refresh at a time across workers; default) or 'local' (per process).
+app.config['STANDINGS_CACHE_BACKEND'] = os.getenv('STANDINGS_CACHE_BACKEND', 'memory').strip().lower()
+app.config['STANDINGS_CACHE_LOCK'] = os.getenv('STANDINGS_CACHE_LOCK', 'database').strip().lower()
+app.config['STANDINGS_CACHE_URL'] = os.getenv('STANDINGS_CACHE_URL') or os.getenv('REDIS_URL', '')
+app.config['STANDINGS_CACHE_TTL_SECONDS'] = int(os.getenv('STANDINGS_CACHE_TTL_SECONDS', '600'))
+app.config['STANDINGS_CACHE_STALE_SECONDS'] = int(os.getenv('STANDINGS_CACHE_STALE_SECONDS', str(7 * 24 * 3600)))
+# Ask AI (ai_suggestions): 'openai' (needs the openai package and OPENAI_API_KEY) or 'local' (deterministic stand-in,
+# no network). A round's suggestions are generated in one call and reused for AI_SUGGESTION_FRESH_MINUTES.
+app.config['AI_SUGGESTIONS_BACKEND'] = os.getenv('AI_SUGGESTIONS_BACKEND', 'openai').strip().lower()
+app.config['AI_SUGGESTION_FRESH_MINUTES'] = int(os.getenv('AI_SUGGESTION_FRESH_MINUTES', '360'))
 # League that new signups are auto-joined to (e.g. "Predictor Community"). Set SIGNUP_LEAGUE_ID=11 or leave unset to add to no leagues.
 try:
     app.config['SIGNUP_LEAGUE_ID'] = int(os.getenv('SIGNUP_LEAGUE_ID', '11'))
@@ -0,0 +1,332 @@
+"""Transactional email outbox: callers enqueue rows in their own transaction, a sender drains them.
+
+enqueue() only adds an email_outbox row to the session, so a password reset token or a reminder's
+"already notified" marker commits together with its email. drain() claims due rows with a single
+conditional UPDATE (safe with several workers / the scheduler job running at once) and sends them on
+at most EMAIL_OUTBOX_CONCURRENCY threads, each reusing one SMTP connection for its share of the batch
+(SendGrid goes through provider_client's pooled session). Sends are spaced per provider
+(EMAIL_SMTP_RATE_PER_SECOND / EMAIL_SENDGRID_RATE_PER_SECOND). A failed send is retried with exponential
+backoff up to EMAIL_OUTBOX_MAX_ATTEMPTS; permanent (5xx) refusals fail immediately. A password reset's body (it
+holds the reset token) is blanked once the row is sent or fails; purge() deletes finished rows after
+EMAIL_OUTBOX_RETENTION_DAYS.
+
+The background sender thread (start_sender / notify) drains right after a commit that enqueued mail and
+polls every EMAIL_OUTBOX_POLL_SECONDS for retries. Run from server dir: flask drain-email-outbox.
+"""
+import os
+import smtplib
+import socket
+import threading
+import time as time_module
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import parseaddr
+
+from sqlalchemy import or_
+
+from config import app, db
+from models import EmailOutbox
+
+try:
+    import provider_client
+except ImportError:  # requests not installed: SMTP only
+    provider_client = None
+
+OWNER = f'{socket.gethostname()}:{os.getpid()}'
+SENDGRID_URL = 'https://api.sendgrid.com/v3/mail/send'
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+_thread = [None]
+_wake = threading.Event()
+_stop = threading.Event()
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def enabled():
+    return bool((app.config.get('MAIL_SERVER') or '').strip())
+
+
+def enqueue(to_email, subject, body, kind='notification'):
+    """Add an email to the outbox in the current transaction (the caller commits, then calls notify())."""
+    now = _utcnow()
+    row = EmailOutbox(kind=kind, to_email=to_email, subject=subject, body=body, status='pending',
+                      attempts=0, next_attempt_at=now, created_at=now)
+    db.session.add(row)
+    return row
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads (rate <= 0: no limit)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self, rate):
+        if not rate or rate <= 0:
+            return
+        with self._lock:
+            now = time_module.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + 1.0 / rate
+        if slot > now:
+            time_module.sleep(slot - now)
+
+
+_limiters = {'smtp': _RateLimiter(), 'sendgrid': _RateLimiter()}
+
+
+def _settings():
+    """Snapshot of mail config for sender threads (they run without an app context)."""
+    server = (app.config.get('MAIL_SERVER') or '').strip()
+    sender = app.config.get('MAIL_DEFAULT_SENDER') or app.config.get('MAIL_USERNAME') or 'noreply@localhost'
+    from_name, from_email = parseaddr(sender)
+    if not from_email:
+        from_email = sender if '@' in sender else 'noreply@localhost'
+    password = app.config.get('MAIL_PASSWORD')
+    return {
+        'server': server,
+        'port': app.config.get('MAIL_PORT', 587),
+        'use_tls': app.config.get('MAIL_USE_TLS', True),
+        'username': app.config.get('MAIL_USERNAME'),
+        'password': password,
+        'sender': sender,
+        'from_email': from_email,
+        'from_name': from_name or 'Fantasy Predictor',
+        'sendgrid_key': password if 'sendgrid' in server.lower() and password and provider_client else None,
+        'smtp_rate': app.config.get('EMAIL_SMTP_RATE_PER_SECOND', 5),
+        'sendgrid_rate': app.config.get('EMAIL_SENDGRID_RATE_PER_SECOND', 10),
+    }
+
+
+def _make_plain_email_message(sender, to_email, subject, body):
+    """Build a simple RFC-style message for SMTP."""
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = sender
+    msg['To'] = to_email
+    msg.attach(MIMEText(body, 'plain'))
+    return msg.as_string()
+
+
+def _send_via_sendgrid_api(settings, to_email, subject, body):
+    """Send via SendGrid v3 HTTP API. Returns True on 202, False otherwise (caller falls back to SMTP)."""
+    payload = {
+        'personalizations': [{'to': [{'email': to_email}]}],
+        'from': {'email': settings['from_email'], 'name': settings['from_name']},
+        'subject': subject,
+        'content': [{'type': 'text/plain', 'value': body}],
+    }
+    headers = {'Authorization': f"Bearer {settings['sendgrid_key']}", 'Content-Type': 'application/json'}
+    try:
+        r = provider_client.post(SENDGRID_URL, json=payload, headers=headers, timeout=15)
+        if r.status_code == 202:
+            return True
+        print(f"SendGrid API returned {r.status_code}: {r.text[:500]}")
+        return False
+    except Exception as e:
+        print(f"SendGrid API request failed [{type(e).__name__}]: {e}")
+        return False
+
+
+class _SmtpConnection:
+    """One SMTP session reused for many messages; reconnects once if the server dropped it."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._smtp = None
+
+    def _connect(self):
+        s = self.settings
+        smtp = smtplib.SMTP(s['server'], s['port'], timeout=15)
+        try:
+            if s['use_tls']:
+                smtp.starttls()
+            if s['username'] and s['password']:
+                smtp.login(s['username'], s['password'])
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+
+    def send(self, to_email, subject, body):
+        message = _make_plain_email_message(self.settings['sender'], to_email, subject, body)
+        for attempt in range(2):
+            if self._smtp is None:
+                self._connect()
+            try:
+                self._smtp.sendmail(self.settings['from_email'], to_email, message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                if attempt:
+                    raise
+
+    def close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                self._smtp.close()
+            self._smtp = None
+
+
+def _is_permanent(error):
+    """5xx replies mean the server will never accept this message; everything else is worth a retry."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _msg in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500 and not isinstance(error, smtplib.SMTPAuthenticationError)
+    return False
+
+
+def _send_share(settings, messages):
+    """Send messages (id, to, subject, body) in order on one connection. Returns [(id, provider, error, permanent)]."""
+    results = []
+    smtp = _SmtpConnection(settings)
+    try:
+        for message_id, to_email, subject, body in messages:
+            if settings['sendgrid_key']:
+                _limiters['sendgrid'].wait(settings['sendgrid_rate'])
+                if _send_via_sendgrid_api(settings, to_email, subject, body):
+                    results.append((message_id, 'sendgrid', None, False))
+                    continue
+            _limiters['smtp'].wait(settings['smtp_rate'])
+            try:
+                smtp.send(to_email, subject, body)
+                results.append((message_id, 'smtp', None, False))
+            except Exception as e:
+                results.append((message_id, 'smtp', f'{type(e).__name__}: {e}', _is_permanent(e)))
+                if not isinstance(e, smtplib.SMTPRecipientsRefused):
+                    smtp.close()  # connection state unknown after other errors
+    finally:
+        smtp.close()
+    return results
+
+
+def _claim(batch_size, now):
+    """Claim up to batch_size due messages for this drain. Rows left 'sending' by a dead worker are reclaimed."""
+    claimable = or_(
+        (EmailOutbox.status == 'pending') & (EmailOutbox.next_attempt_at <= now),
+        (EmailOutbox.status == 'sending') & (EmailOutbox.claimed_until < now),
+    )
+    ids = [row.id for row in db.session.query(EmailOutbox.id).filter(claimable)
+           .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id).limit(batch_size)]
+    if not ids:
+        return []
+    token = f'{OWNER}:{uuid.uuid4().hex[:8]}'
+    EmailOutbox.query.filter(EmailOutbox.id.in_(ids), claimable).update(
+        {'status': 'sending', 'claimed_by': token, 'claimed_until': now + timedelta(minutes=10)},
+        synchronize_session=False)
+    db.session.commit()
+    return EmailOutbox.query.filter_by(claimed_by=token, status='sending').order_by(EmailOutbox.id).all()
+
+
+def drain(batch_size=None, concurrency=None, max_batches=20):
+    """Send due outbox messages until none are due (or max_batches). Returns {'sent', 'retrying', 'failed'}."""
+    batch_size = batch_size or app.config.get('EMAIL_OUTBOX_BATCH_SIZE', 50)
+    concurrency = max(1, concurrency or app.config.get('EMAIL_OUTBOX_CONCURRENCY', 2))
+    max_attempts = app.config.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
+    backoff = app.config.get('EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS', 30)
+    totals = {'sent': 0, 'retrying': 0, 'failed': 0}
+    if not enabled():
+        return totals
+    settings = _settings()
+    for _ in range(max_batches):
+        rows = _claim(batch_size, _utcnow())
+        if not rows:
+            break
+        messages = [(r.id, r.to_email, r.subject, r.body) for r in rows]
+        shares = [messages[i::concurrency] for i in range(min(concurrency, len(messages)))]
+        if len(shares) == 1:
+            results = _send_share(settings, shares[0])
+        else:
+            with ThreadPoolExecutor(max_workers=len(shares)) as executor:
+                results = [r for share in executor.map(lambda s: _send_share(settings, s), shares) for r in share]
+        by_id = {r.id: r for r in rows}
+        now = _utcnow()
+        for message_id, provider, error, permanent in results:
+            row = by_id[message_id]
+            row.attempts += 1
+            row.provider = provider
+            row.claimed_by = None
+            row.claimed_until = None
+            if error is None:
+                row.status = 'sent'
+                row.sent_at = now
+                row.last_error = None
+                totals['sent'] += 1
+            elif permanent or row.attempts >= max_attempts:
+                row.status = 'failed'
+                row.last_error = error[:2000]
+                totals['failed'] += 1
+                print(f"Email to {row.to_email} failed after {row.attempts} attempt(s): {error}")
+            else:
+                row.status = 'pending'
+                row.last_error = error[:2000]
+                row.next_attempt_at = now + min(timedelta(seconds=backoff * 2 ** (row.attempts - 1)), MAX_RETRY_DELAY)
+                totals['retrying'] += 1
+            if row.status != 'pending' and row.kind == 'password_reset':
+                row.body = ''  # sent or failed: the reset token is not kept in the table
+        db.session.commit()
+    return totals
+
+
+def purge(retention_days=None):
+    """Delete sent and failed rows finished more than retention_days (EMAIL_OUTBOX_RETENTION_DAYS) ago.
+    Returns rows deleted."""
+    retention_days = retention_days if retention_days is not None else app.config.get('EMAIL_OUTBOX_RETENTION_DAYS', 30)
+    cutoff = _utcnow() - timedelta(days=retention_days)
+    deleted = EmailOutbox.query.filter(
+        EmailOutbox.status.in_(('sent', 'failed')),
+        or_(EmailOutbox.sent_at < cutoff, EmailOutbox.sent_at.is_(None) & (EmailOutbox.created_at < cutoff)),
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
+
+
+def _loop(poll_seconds):
+    while not _stop.is_set():
+        _wake.wait(poll_seconds)
+        _wake.clear()
+        if _stop.is_set():
+            break
+        try:
+            with app.app_context():
+                totals = drain()
+                if totals['sent'] or totals['failed']:
+                    print(f'Email outbox: {totals}')
+                db.session.remove()
+        except Exception:
+            traceback.print_exc()
+
+
+def start_sender(poll_seconds=None):
+    """Start the sender thread once per process (daemon: dies with the worker)."""
+    if _thread[0] is not None and _thread[0].is_alive():
+        return False
+    _stop.clear()
+    poll = poll_seconds if poll_seconds is not None else app.config.get('EMAIL_OUTBOX_POLL_SECONDS', 30)
+    _thread[0] = threading.Thread(target=_loop, args=(poll,), name='email-outbox', daemon=True)
+    _thread[0].start()
+    return True
+
+
+def notify():
+    """Wake the sender after committing enqueued mail (starts it on first use; off in tests)."""
+    if app.config.get('TESTING') or not app.config.get('EMAIL_OUTBOX_SENDER_ENABLED', True) or not enabled():
+        return
+    start_sender()
+    _wake.set()
+
+
+def stop_sender():
+    _stop.set()
+    _wake.set()
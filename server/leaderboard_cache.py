@@ -0,0 +1,137 @@
+"""Leaderboard response cache.
+
+Many members open the same leaderboard right after full-time; the first request computes it and the rest are
+served the stored body. Keys are built by app._leaderboard_cache_key from (league_id, scope, round, season) plus the
+league's leaderboard_version, which is bumped in the same transaction as any change that alters the output (fixture
+scores in the competition, a member's predictions, membership, backfill, stored standings, round closes). A change
+therefore moves readers to a new key instead of deleting entries, and that works across workers even with the
+per-process backend. The TTL only bounds how long unused entries are kept.
+
+Each entry stores the JSON body with a strong ETag (sha256 of the canonical body), so a matching If-None-Match is
+answered 304 without recomputing or re-sending. Backends: MemoryBackend (per-process LRU, the default) and
+RedisBackend (shared by all workers; optional redis package).
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+
+class MemoryBackend:
+    """Per-process LRU of (expires_at, value), bounded by max_entries."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max(1, max_entries)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl_seconds):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Entries shared by all workers in Redis (JSON values, native expiry). Errors read as misses."""
+
+    def __init__(self, url, prefix='leaderboard:'):
+        self._client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+        self._prefix = prefix
+
+    def get(self, key):
+        try:
+            raw = self._client.get(self._prefix + key)
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl_seconds):
+        try:
+            self._client.set(self._prefix + key, json.dumps(value), ex=max(1, int(ttl_seconds)))
+        except redis.RedisError:
+            pass
+
+    def clear(self):
+        try:
+            keys = list(self._client.scan_iter(self._prefix + '*'))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+_settings = {'ttl_seconds': 3600}
+_backend = [MemoryBackend()]
+
+
+def configure(backend='memory', url='', max_entries=512, ttl_seconds=3600):
+    """Pick the backend ('memory', 'redis' or 'none'). 'redis' without the package or a URL falls back to memory."""
+    _settings['ttl_seconds'] = ttl_seconds
+    if backend == 'none':
+        _backend[0] = None
+    elif backend == 'redis' and REDIS_AVAILABLE and url:
+        _backend[0] = RedisBackend(url)
+    else:
+        if backend == 'redis':
+            print("WARNING: LEADERBOARD_CACHE_BACKEND=redis needs the redis package and a URL; using the in-process cache")
+        _backend[0] = MemoryBackend(max_entries)
+
+
+def make_key(*parts):
+    """Cache key from the identifying parts (league id, scope, round, season key, version, ...)."""
+    return hashlib.sha256(json.dumps(parts, default=str).encode('utf-8')).hexdigest()
+
+
+def etag_for(body):
+    """Strong ETag value (unquoted) for a JSON-serializable body."""
+    canonical = json.dumps(body, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+
+def get(key):
+    """(body, etag) stored for key, or None."""
+    backend = _backend[0]
+    if backend is None or key is None:
+        return None
+    entry = backend.get(key)
+    return (entry['body'], entry['etag']) if entry else None
+
+
+def put(key, body):
+    """Store body under key; returns its ETag (computed even when caching is off)."""
+    etag = etag_for(body)
+    backend = _backend[0]
+    if backend is not None and key is not None:
+        backend.set(key, {'body': body, 'etag': etag}, _settings['ttl_seconds'])
+    return etag
+
+
+def clear():
+    backend = _backend[0]
+    if backend is not None:
+        backend.clear()
@@ -0,0 +1,35 @@
+"""add league_round_closes for the round-close job
+
+Revision ID: a4b5c6d7e8f9
+Revises: z3a4b5c6d7e8
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'a4b5c6d7e8f9'
+down_revision = 'z3a4b5c6d7e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'league_round_closes',
+        sa.Column('league_id', sa.Integer(), nullable=False),
+        sa.Column('fixture_round', sa.Integer(), nullable=False),
+        sa.Column('closed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['league_id'], ['leagues.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('league_id', 'fixture_round'),
+    )
+    # Rounds the leaderboard GET already awarded are closed
+    op.execute(
+        'INSERT INTO league_round_closes (league_id, fixture_round, closed_at) '
+        'SELECT DISTINCT league_id, fixture_round, CURRENT_TIMESTAMP FROM league_week_winners'
+    )
+
+
+def downgrade():
+    op.drop_table('league_round_closes')
@@ -0,0 +1,43 @@
+"""add league_round_standings snapshots written at round close
+
+Revision ID: b5c6d7e8f9a0
+Revises: a4b5c6d7e8f9
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'b5c6d7e8f9a0'
+down_revision = 'a4b5c6d7e8f9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'league_round_standings',
+        sa.Column('league_id', sa.Integer(), nullable=False),
+        sa.Column('season_key', sa.String(), nullable=False),
+        sa.Column('fixture_round', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('draws', sa.Integer(), nullable=False),
+        sa.Column('losses', sa.Integer(), nullable=False),
+        sa.Column('points', sa.Integer(), nullable=False),
+        sa.Column('round_rank', sa.Integer(), nullable=False),
+        sa.Column('total_wins', sa.Integer(), nullable=False),
+        sa.Column('total_draws', sa.Integer(), nullable=False),
+        sa.Column('total_losses', sa.Integer(), nullable=False),
+        sa.Column('total_points', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['league_id'], ['leagues.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('league_id', 'season_key', 'fixture_round', 'user_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('league_round_standings')
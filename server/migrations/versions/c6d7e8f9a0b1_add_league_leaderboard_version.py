@@ -0,0 +1,25 @@
+"""add leagues.leaderboard_version for the leaderboard cache
+
+Revision ID: c6d7e8f9a0b1
+Revises: b5c6d7e8f9a0
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'c6d7e8f9a0b1'
+down_revision = 'b5c6d7e8f9a0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('leagues', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('leaderboard_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('leagues', schema=None) as batch_op:
+        batch_op.drop_column('leaderboard_version')
@@ -0,0 +1,36 @@
+"""add indexes for the open-league list and name search
+
+Revision ID: d7e8f9a0b1c2
+Revises: c6d7e8f9a0b1
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'd7e8f9a0b1c2'
+down_revision = 'c6d7e8f9a0b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+    op.create_index(
+        'ix_leagues_open_name', 'leagues', ['name', 'id'],
+        postgresql_where=sa.text('is_open = true'), sqlite_where=sa.text('is_open = 1'),
+    )
+    if connection.dialect.name != 'postgresql':
+        return
+    # Trigram index for ILIKE '%q%' search; skipped where the pg_trgm extension is not available
+    available = connection.execute(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")).scalar()
+    if available:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.execute('CREATE INDEX IF NOT EXISTS ix_leagues_name_trgm ON leagues USING gin (name gin_trgm_ops) WHERE is_open = true')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_leagues_name_trgm')
+    op.drop_index('ix_leagues_open_name', table_name='leagues')
@@ -0,0 +1,33 @@
+"""add fixture_ai_suggestions for round-level Ask AI batches
+
+Revision ID: e8f9a0b1c2d3
+Revises: d7e8f9a0b1c2
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'e8f9a0b1c2d3'
+down_revision = 'd7e8f9a0b1c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'fixture_ai_suggestions',
+        sa.Column('fixture_id', sa.Integer(), nullable=False),
+        sa.Column('home_team_score', sa.Integer(), nullable=False),
+        sa.Column('away_team_score', sa.Integer(), nullable=False),
+        sa.Column('rationale', sa.String(), nullable=True),
+        sa.Column('model', sa.String(), nullable=True),
+        sa.Column('generated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['fixture_id'], ['fixtures.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('fixture_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('fixture_ai_suggestions')
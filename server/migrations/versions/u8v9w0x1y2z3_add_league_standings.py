@@ -0,0 +1,37 @@
+"""add league_standings table (materialized full-season leaderboard)
+
+Revision ID: u8v9w0x1y2z3
+Revises: t7u8v9w0x1y2
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'u8v9w0x1y2z3'
+down_revision = 't7u8v9w0x1y2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'league_standings',
+        sa.Column('league_id', sa.Integer(), nullable=False),
+        sa.Column('season_key', sa.String(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('draws', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('losses', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('points', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('total_games', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['league_id'], ['leagues.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('league_id', 'season_key', 'user_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('league_standings')
@@ -0,0 +1,31 @@
+"""add fixture_id to games (direct link from prediction to fixture)
+
+Revision ID: v9w0x1y2z3a4
+Revises: u8v9w0x1y2z3
+Create Date: 2026-10-16
+
+Existing rows are linked afterwards with: flask link-game-fixtures
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'v9w0x1y2z3a4'
+down_revision = 'u8v9w0x1y2z3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('fixture_id', sa.Integer(), nullable=True))
+        batch_op.create_index('ix_games_fixture_id', ['fixture_id'], unique=False)
+        batch_op.create_foreign_key('fk_games_fixture_id_fixtures', 'fixtures', ['fixture_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_games_fixture_id_fixtures', type_='foreignkey')
+        batch_op.drop_index('ix_games_fixture_id')
+        batch_op.drop_column('fixture_id')
@@ -0,0 +1,75 @@
+"""add teams / team_aliases registry, seeded from the built-in alias list
+
+Revision ID: w0x1y2z3a4b5
+Revises: v9w0x1y2z3a4
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'w0x1y2z3a4b5'
+down_revision = 'v9w0x1y2z3a4'
+branch_labels = None
+depends_on = None
+
+# Snapshot of team_matching._TEAM_ALIASES at the time of this migration (normalized alias -> canonical).
+SEED_ALIASES = {
+    'wolves': 'wolverhampton wanderers',
+    'spurs': 'tottenham hotspur',
+    'tottenham': 'tottenham hotspur',
+    'man utd': 'manchester united',
+    'man united': 'manchester united',
+    'man utd.': 'manchester united',
+    'man u': 'manchester united',
+    'man city': 'manchester city',
+    'city': 'manchester city',
+    'west ham': 'west ham united',
+    'forest': 'nottingham forest',
+    'notts forest': 'nottingham forest',
+    'newcastle': 'newcastle united',
+    'brighton': 'brighton and hove albion',
+    'villa': 'aston villa',
+    'bournemouth': 'afc bournemouth',
+    'utd': 'manchester united',
+}
+
+
+def upgrade():
+    teams = op.create_table(
+        'teams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('competition_slug', sa.String(), nullable=True),
+        sa.Column('canonical_name', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    aliases = op.create_table(
+        'team_aliases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('alias', sa.String(), nullable=False),
+        sa.Column('source', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], name='fk_team_aliases_team_id_teams', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('alias', name='uq_team_aliases_alias'),
+    )
+
+    canonical_names = sorted(set(SEED_ALIASES.values()))
+    op.bulk_insert(teams, [
+        {'id': i, 'competition_slug': 'eng.1', 'canonical_name': name}
+        for i, name in enumerate(canonical_names, start=1)
+    ])
+    team_ids = {name: i for i, name in enumerate(canonical_names, start=1)}
+    rows = [{'team_id': team_ids[name], 'alias': name, 'source': 'seed'} for name in canonical_names]
+    rows += [{'team_id': team_ids[canonical], 'alias': alias, 'source': 'seed'} for alias, canonical in sorted(SEED_ALIASES.items())]
+    op.bulk_insert(aliases, rows)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("SELECT setval(pg_get_serial_sequence('teams', 'id'), (SELECT MAX(id) FROM teams))")
+
+
+def downgrade():
+    op.drop_table('team_aliases')
+    op.drop_table('teams')
@@ -0,0 +1,46 @@
+"""add job_locks / job_runs for the background scheduler
+
+Revision ID: x1y2z3a4b5c6
+Revises: w0x1y2z3a4b5
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'x1y2z3a4b5c6'
+down_revision = 'w0x1y2z3a4b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'job_locks',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('owner', sa.String(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.Column('last_started_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.create_table(
+        'job_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_name', sa.String(), nullable=False),
+        sa.Column('owner', sa.String(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False, server_default='running'),
+        sa.Column('items_processed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_job_runs_job_name', 'job_runs', ['job_name'])
+
+
+def downgrade():
+    op.drop_index('ix_job_runs_job_name', table_name='job_runs')
+    op.drop_table('job_runs')
+    op.drop_table('job_locks')
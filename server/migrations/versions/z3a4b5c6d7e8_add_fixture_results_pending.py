@@ -0,0 +1,27 @@
+"""add fixtures.results_pending for the rescoring job
+
+Revision ID: z3a4b5c6d7e8
+Revises: y2z3a4b5c6d7
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'z3a4b5c6d7e8'
+down_revision = 'y2z3a4b5c6d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('fixtures', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('results_pending', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.create_index(batch_op.f('ix_fixtures_results_pending'), ['results_pending'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('fixtures', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_fixtures_results_pending'))
+        batch_op.drop_column('results_pending')
@@ -107,9 +107,13 @@ class Game(db.Model, SerializerMixin):
     away_team_score = db.Column(db.Integer)
     game_result = db.Column(db.String)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'))
+    # Fixture this prediction is for. Null = legacy row not yet linked (readers fall back to team-name matching).
+    fixture_id = db.Column(db.Integer, db.ForeignKey('fixtures.id', ondelete='SET NULL'), nullable=True)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
+    __table_args__ = (db.Index('ix_games_fixture_id', 'fixture_id'),)
+
     # Relationships
     # predictions = db.relationship('Prediction', back_populates='game', cascade='all, delete-orphan')
     # users = association_proxy('predictions', 'user')
@@ -132,10 +136,43 @@ class Fixture(db.Model, SerializerMixin):
     is_completed = db.Column(db.Boolean, default=False)
     # When True, fixture sync will not overwrite fixture_round.
     manual_round_override = db.Column(db.Boolean, nullable=False, default=False)
+    # Set with a score change in the same transaction; cleared once predictions' game_result are rescored.
+    results_pending = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false(), index=True)
 
     def __repr__(self):
         return f'<Fixture {self.id}: {self.fixture_home_team} vs {self.fixture_away_team}>'
 
+class Team(db.Model, SerializerMixin):
+    """Canonical team in the name registry; every provider spelling is a TeamAlias pointing here."""
+    __tablename__ = 'teams'
+
+    id = db.Column(db.Integer, primary_key=True)
+    # Competition the team was first seen in (eng.1, ger.1, fifa.world, ...). New spellings attach within it.
+    competition_slug = db.Column(db.String, nullable=True)
+    canonical_name = db.Column(db.String, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+
+    aliases = db.relationship('TeamAlias', back_populates='team', cascade='all, delete-orphan')
+
+    serialize_rules = ('-aliases.team',)
+
+
+class TeamAlias(db.Model, SerializerMixin):
+    """Observed spelling of a team (normalized with _normalize_team_name), e.g. 'man utd' -> Manchester United."""
+    __tablename__ = 'team_aliases'
+
+    id = db.Column(db.Integer, primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', ondelete='CASCADE'), nullable=False)
+    alias = db.Column(db.String, nullable=False, unique=True)
+    # Where the spelling came from: seed | espn | football-data | pulselive
+    source = db.Column(db.String, nullable=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+
+    team = db.relationship('Team', back_populates='aliases')
+
+    serialize_rules = ('-team.aliases',)
+
+
 class LeagueWeekWinner(db.Model, SerializerMixin):
     """Records which member(s) won a given round in a league (for weekly leaderboard). Ties = multiple rows."""
     __tablename__ = 'league_week_winners'
@@ -148,6 +185,129 @@ class LeagueWeekWinner(db.Model, SerializerMixin):
     user = db.relationship('User', backref=db.backref('league_week_wins', lazy='dynamic'))
 
 
+class LeagueRoundClose(db.Model, SerializerMixin):
+    """A weekly league's round that has been closed: its winners are in league_week_winners. Written once, in the
+    same transaction as the winners, by the round-close job (the primary key makes a second close a no-op)."""
+    __tablename__ = 'league_round_closes'
+
+    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id', ondelete='CASCADE'), primary_key=True)
+    fixture_round = db.Column(db.Integer, primary_key=True)
+    closed_at = db.Column(db.DateTime, nullable=False)  # naive UTC
+
+
+class LeagueRoundStanding(db.Model, SerializerMixin):
+    """Snapshot of a league's standings when a round closed: the member's W/D/L and points in that round, season
+    totals through it, and ranks (for past-week leaderboards, rank movement and points-over-time charts)."""
+    __tablename__ = 'league_round_standings'
+
+    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id', ondelete='CASCADE'), primary_key=True)
+    season_key = db.Column(db.String, primary_key=True)  # same key as league_standings
+    fixture_round = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    draws = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    round_rank = db.Column(db.Integer, nullable=False)
+    total_wins = db.Column(db.Integer, nullable=False, default=0)
+    total_draws = db.Column(db.Integer, nullable=False, default=0)
+    total_losses = db.Column(db.Integer, nullable=False, default=0)
+    total_points = db.Column(db.Integer, nullable=False, default=0)
+    rank = db.Column(db.Integer, nullable=False)  # by season totals (_leaderboard_sort_key order, ties share a rank)
+    computed_at = db.Column(db.DateTime, nullable=False)  # naive UTC
+
+
+class LeagueStanding(db.Model, SerializerMixin):
+    """Materialized full-season W/D/L per league member and season (kept current on score and prediction changes)."""
+    __tablename__ = 'league_standings'
+
+    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id', ondelete='CASCADE'), primary_key=True)
+    # Leaderboard cutoff the row was computed for (ISO date of season start, or 'all'); new season = new rows
+    season_key = db.Column(db.String, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    draws = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    total_games = db.Column(db.Integer, nullable=False, default=0)
+    computed_at = db.Column(db.DateTime, nullable=True)  # naive UTC; pre-kickoff placeholders may become scoreable after this
+
+
+class FixtureAISuggestion(db.Model, SerializerMixin):
+    """Ask AI score suggestion for a fixture, generated for its whole round in one model call (ai_suggestions) and
+    served to every member who asks until it is older than AI_SUGGESTION_FRESH_MINUTES."""
+    __tablename__ = 'fixture_ai_suggestions'
+
+    fixture_id = db.Column(db.Integer, db.ForeignKey('fixtures.id', ondelete='CASCADE'), primary_key=True)
+    home_team_score = db.Column(db.Integer, nullable=False)
+    away_team_score = db.Column(db.Integer, nullable=False)
+    rationale = db.Column(db.String, nullable=True)
+    model = db.Column(db.String, nullable=True)  # backend/model that produced it, e.g. 'openai:gpt-4o-mini', 'local'
+    generated_at = db.Column(db.DateTime, nullable=False)  # naive UTC
+
+
+class JobLock(db.Model, SerializerMixin):
+    """One row per scheduled job: who holds it (until expires_at) and when it last started (for due checks across workers)."""
+    __tablename__ = 'job_locks'
+
+    name = db.Column(db.String, primary_key=True)
+    owner = db.Column(db.String, nullable=True)  # "<host>:<pid>" of the worker running it
+    expires_at = db.Column(db.DateTime, nullable=True)  # naive UTC; NULL or past = free
+    last_started_at = db.Column(db.DateTime, nullable=True)  # naive UTC
+
+
+class JobRun(db.Model, SerializerMixin):
+    """One execution of a scheduled (or manually triggered) background job."""
+    __tablename__ = 'job_runs'
+    __table_args__ = (db.Index('ix_job_runs_job_name', 'job_name'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_name = db.Column(db.String, nullable=False)
+    owner = db.Column(db.String, nullable=True)
+    started_at = db.Column(db.DateTime, nullable=False)  # naive UTC
+    finished_at = db.Column(db.DateTime, nullable=True)
+    duration_ms = db.Column(db.Integer, nullable=True)
+    status = db.Column(db.String, nullable=False, default='running')  # running | ok | error
+    items_processed = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text, nullable=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'job_name': self.job_name,
+            'owner': self.owner,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'items_processed': self.items_processed,
+            'error': self.error,
+        }
+
+
+class EmailOutbox(db.Model, SerializerMixin):
+    """A transactional email waiting to be delivered by email_outbox.drain() (enqueued in the caller's transaction)."""
+    __tablename__ = 'email_outbox'
+    __table_args__ = (
+        db.Index('ix_email_outbox_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String, nullable=False, default='notification')  # password_reset | notification
+    to_email = db.Column(db.String, nullable=False)
+    subject = db.Column(db.String, nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String, nullable=False, default='pending')  # pending | sending | sent | failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False)  # naive UTC
+    claimed_by = db.Column(db.String, nullable=True)
+    claimed_until = db.Column(db.DateTime, nullable=True)
+    provider = db.Column(db.String, nullable=True)  # smtp | sendgrid (last attempt)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+
 class TournamentEdition(db.Model, SerializerMixin):
     """A specific tournament instance (e.g. FIFA World Cup 2026) for bracket challenges."""
     __tablename__ = 'tournament_editions'
@@ -309,10 +469,20 @@ class League(db.Model, SerializerMixin):
     ai_predictions_enabled = db.Column(db.Boolean, nullable=False, default=False)
     # When set, leaderboard only counts fixtures/games on or after this time (new season in same league).
     season_started_at = db.Column(db.DateTime, nullable=True)
+    # Bumped in the same transaction as anything that changes the leaderboard (see app._bump_leaderboard_versions);
+    # part of the leaderboard cache key, so every worker sees a change at once
+    leaderboard_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
+    # Open-league list is keyset-paginated on (name, id). On Postgres the migration also adds a pg_trgm GIN index
+    # (ix_leagues_name_trgm) for ?q= substring search; SQLite scans this partial index instead.
+    __table_args__ = (
+        db.Index('ix_leagues_open_name', 'name', 'id',
+                 postgresql_where=db.text('is_open = true'), sqlite_where=db.text('is_open = 1')),
+    )
+
     edition = db.relationship('TournamentEdition', backref=db.backref('leagues', lazy='dynamic'))
 
     # Relationships: members via LeagueMembership (each has display_name per league)
@@ -324,8 +494,10 @@ class League(db.Model, SerializerMixin):
     )
     members = association_proxy('league_memberships', 'user')
 
-    def to_dict(self, rules=None):
-        """Custom to_dict: members include display_name from LeagueMembership"""
+    def to_dict(self, rules=None, members='full'):
+        """Custom to_dict: members include display_name from LeagueMembership.
+        members='full' lists every member with email; 'summary' lists id/display_name/role only; 'none' omits the list.
+        member_count is always set."""
         data = {
             'id': self.id,
             'name': self.name,
@@ -341,20 +513,27 @@ class League(db.Model, SerializerMixin):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
-        if hasattr(self, 'league_memberships') and self.league_memberships:
+        if members == 'none':
+            return data
+        memberships = self.league_memberships or []
+        data['member_count'] = len(memberships)
+        if members == 'summary':
             data['members'] = [
-                {
-                    'id': lm.user.id,
-                    'display_name': lm.display_name,
-                    'email': lm.user.email,
-                    'role': lm.role,
-                    'created_at': lm.user.created_at.isoformat() if lm.user.created_at else None,
-                    'notify_missing_predictions': getattr(lm, 'notify_missing_predictions', False),
-                }
-                for lm in self.league_memberships
+                {'id': lm.user_id, 'display_name': lm.display_name, 'role': lm.role}
+                for lm in memberships
             ]
-        else:
-            data['members'] = []
+            return data
+        data['members'] = [
+            {
+                'id': lm.user.id,
+                'display_name': lm.display_name,
+                'email': lm.user.email,
+                'role': lm.role,
+                'created_at': lm.user.created_at.isoformat() if lm.user.created_at else None,
+                'notify_missing_predictions': getattr(lm, 'notify_missing_predictions', False),
+            }
+            for lm in memberships
+        ]
         return data
 
     def __repr__(self):
@@ -0,0 +1,273 @@
+"""On-disk HTTP cache for provider feeds (ESPN scoreboards, football-data.org, Pulselive standings).
+
+Each URL is stored as <key>.body plus <key>.json metadata (ETag, Last-Modified, max-age, body sha256).
+Refreshes send If-None-Match / If-Modified-Since; a 304 is served from disk, and a body still within
+max-age is served without a request. The cache is bounded by size with LRU eviction (metadata mtime is
+the last-use time).
+
+Syncs skip parsing and DB writes when a feed is unchanged: every entry also remembers, per consumer
+(e.g. 'fixtures', 'scores'), the body hash that consumer last committed. mark_processed() records that
+hash only after the caller's DB commit, so a failed sync is retried in full.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+
+import provider_client
+
+_settings = {
+    'directory': '',
+    'max_bytes': 50 * 1024 * 1024,
+}
+_lock = threading.Lock()
+_total_bytes = [None]  # lazily scanned; kept up to date on store/evict
+_parsed = {}  # url -> (sha256, parsed value), see parsed()
+_PARSED_MAX_URLS = 64
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+def configure(directory=None, max_bytes=None):
+    """Set cache location and size limit (from app config). An empty directory disables the cache."""
+    with _lock:
+        if directory is not None:
+            _settings['directory'] = directory
+        if max_bytes is not None:
+            _settings['max_bytes'] = max_bytes
+        _total_bytes[0] = None
+        _parsed.clear()
+
+
+def enabled():
+    return bool(_settings['directory'])
+
+
+class FeedResponse:
+    """Provider response backed by the cache. `content` is always the full body, even after a 304."""
+
+    def __init__(self, url, status_code, content, headers, sha256, processed, from_cache):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.sha256 = sha256
+        self.processed = processed or {}
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error for url: {self.url}')
+
+    def unchanged_for(self, consumer):
+        """True if `consumer` already committed this exact body (so parsing and DB writes can be skipped)."""
+        return self.sha256 is not None and self.processed.get(consumer) == self.sha256
+
+
+def _paths(url):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    base = os.path.join(_settings['directory'], key)
+    return base + '.body', base + '.json'
+
+
+def _read_entry(url):
+    body_path, meta_path = _paths(url)
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    if meta.get('url') != url or hashlib.sha256(body).hexdigest() != meta.get('sha256'):
+        return None, None
+    return meta, body
+
+
+def _write_atomic(path, data):
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_meta(url, meta):
+    _write_atomic(_paths(url)[1], json.dumps(meta).encode('utf-8'))
+
+
+def _touch(url):
+    try:
+        os.utime(_paths(url)[1])
+    except OSError:
+        pass
+
+
+def _scan_locked():
+    entries = []
+    total = 0
+    try:
+        with os.scandir(_settings['directory']) as it:
+            for e in it:
+                if not e.name.endswith('.json'):
+                    continue
+                body_path = e.path[:-len('.json')] + '.body'
+                try:
+                    size = e.stat().st_size + os.path.getsize(body_path)
+                    entries.append((e.stat().st_mtime, e.path, body_path, size))
+                except OSError:
+                    continue
+                total += size
+    except OSError:
+        pass
+    return entries, total
+
+
+def _account_locked(delta):
+    if _total_bytes[0] is None:
+        _total_bytes[0] = _scan_locked()[1]
+    else:
+        _total_bytes[0] += delta
+    if _total_bytes[0] <= _settings['max_bytes']:
+        return
+    # Over the limit: rescan (other worker processes share the directory) and drop least recently used.
+    entries, total = _scan_locked()
+    entries.sort()
+    for _mtime, meta_path, body_path, size in entries:
+        if total <= _settings['max_bytes']:
+            break
+        for path in (meta_path, body_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+    _total_bytes[0] = total
+
+
+def _cache_directives(headers):
+    cache_control = (headers.get('Cache-Control') or '').lower()
+    if 'no-store' in cache_control:
+        return False, 0
+    if 'no-cache' in cache_control:
+        return True, 0
+    m = _MAX_AGE_RE.search(cache_control)
+    return True, int(m.group(1)) if m else 0
+
+
+def _is_stale(meta, now):
+    return now - meta.get('fetched_at', 0) >= meta.get('max_age', 0)
+
+
+def fetch(url, headers=None, timeout=None):
+    """GET a provider feed through the cache. Returns a FeedResponse (non-2xx responses are not cached)."""
+    if not enabled():
+        resp = provider_client.get(url, headers=headers, timeout=timeout)
+        return FeedResponse(url, resp.status_code, resp.content, resp.headers, None, None, False)
+
+    meta, body = _read_entry(url)
+    now = time.time()
+    if meta is not None and not _is_stale(meta, now):
+        _touch(url)
+        return FeedResponse(url, 200, body, meta.get('headers') or {}, meta['sha256'], meta.get('processed'), True)
+
+    request_headers = dict(headers or {})
+    if meta is not None:
+        if meta.get('etag'):
+            request_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            request_headers['If-Modified-Since'] = meta['last_modified']
+    resp = provider_client.get(url, headers=request_headers, timeout=timeout)
+
+    if resp.status_code == 304 and meta is not None:
+        cacheable, max_age = _cache_directives(resp.headers)
+        meta['fetched_at'] = now
+        meta['max_age'] = max_age if cacheable else 0
+        if resp.headers.get('ETag'):
+            meta['etag'] = resp.headers['ETag']
+        try:
+            _write_meta(url, meta)
+        except OSError:
+            pass
+        return FeedResponse(url, 200, body, meta.get('headers') or {}, meta['sha256'], meta.get('processed'), True)
+    if not 200 <= resp.status_code < 300:
+        return FeedResponse(url, resp.status_code, resp.content, resp.headers, None, None, False)
+
+    content = resp.content
+    sha256 = hashlib.sha256(content).hexdigest()
+    processed = (meta or {}).get('processed') or {}
+    cacheable, max_age = _cache_directives(resp.headers)
+    if cacheable:
+        new_meta = {
+            'url': url,
+            'sha256': sha256,
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'fetched_at': now,
+            'max_age': max_age,
+            'headers': {'Content-Type': resp.headers.get('Content-Type', '')},
+            # Processed markers survive a refetch; unchanged_for() compares them with the new hash.
+            'processed': processed,
+        }
+        body_path, _meta_path = _paths(url)
+        old_size = (len(body) + len(json.dumps(meta))) if meta is not None else 0
+        try:
+            os.makedirs(_settings['directory'], exist_ok=True)
+            _write_atomic(body_path, content)
+            _write_meta(url, new_meta)
+            with _lock:
+                _account_locked(len(content) + len(json.dumps(new_meta)) - old_size)
+        except OSError as e:
+            print(f"Provider cache: could not store {url}: {e}")
+    return FeedResponse(url, resp.status_code, content, resp.headers, sha256, processed, False)
+
+
+def mark_processed(feed, consumer):
+    """Record that `consumer` committed feed's body; call after the DB commit that applied it."""
+    if not enabled() or feed.sha256 is None:
+        return
+    meta, _body = _read_entry(feed.url)
+    if meta is None or meta.get('sha256') != feed.sha256:
+        return
+    meta.setdefault('processed', {})[consumer] = feed.sha256
+    try:
+        _write_meta(feed.url, meta)
+    except OSError:
+        pass
+
+
+def parsed(feed, parse):
+    """Return parse(feed.json()), reusing the last result for this URL while the body hash is the same."""
+    if feed.sha256 is None:
+        return parse(feed.json())
+    hit = _parsed.get(feed.url)
+    if hit is not None and hit[0] == feed.sha256:
+        return hit[1]
+    value = parse(feed.json())
+    if len(_parsed) >= _PARSED_MAX_URLS:
+        _parsed.clear()
+    _parsed[feed.url] = (feed.sha256, value)
+    return value
+
+
+def clear():
+    """Delete every cached entry. Returns the number of entries removed."""
+    removed = 0
+    with _lock:
+        entries, _total = _scan_locked()
+        for _mtime, meta_path, body_path, _size in entries:
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            removed += 1
+        _total_bytes[0] = 0
+        _parsed.clear()
+    return removed
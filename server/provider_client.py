@@ -0,0 +1,128 @@
+"""Pooled HTTP client for outbound provider calls (ESPN, football-data.org, Pulselive, SendGrid).
+
+One requests.Session per host keeps TCP/TLS connections alive across the hundreds of requests a
+sync makes. Idempotent requests (GET/HEAD) retry with exponential backoff on connection errors,
+429 and 5xx, honouring Retry-After up to MAX_RETRY_AFTER_SECONDS. POST is retried only on 429: SendGrid
+must not send twice.
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER_SECONDS = 30.0  # a provider asking for an hour would otherwise stall the sync (or request) that long
+
+_settings = {
+    'pool_size': 10,
+    'retries': 3,
+    'backoff_factor': 0.5,
+    'connect_timeout': 5.0,
+    'read_timeout': 15.0,
+}
+_sessions = {}
+_lock = threading.Lock()
+
+
+def configure(pool_size=None, retries=None, backoff_factor=None, connect_timeout=None, read_timeout=None):
+    """Update client settings (from app config). Existing sessions are closed so new settings apply."""
+    updates = {
+        'pool_size': pool_size,
+        'retries': retries,
+        'backoff_factor': backoff_factor,
+        'connect_timeout': connect_timeout,
+        'read_timeout': read_timeout,
+    }
+    with _lock:
+        _settings.update({k: v for k, v in updates.items() if v is not None})
+        _close_sessions_locked()
+
+
+def close_sessions():
+    with _lock:
+        _close_sessions_locked()
+
+
+def _close_sessions_locked():
+    for session in _sessions.values():
+        session.close()
+    _sessions.clear()
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but sleeps at most MAX_RETRY_AFTER_SECONDS."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
+
+def _build_session():
+    session = requests.Session()
+    idempotent_retry = _CappedRetry(
+        total=_settings['retries'],
+        connect=_settings['retries'],
+        read=_settings['retries'],
+        status=_settings['retries'],
+        backoff_factor=_settings['backoff_factor'],
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=_settings['pool_size'],
+        max_retries=idempotent_retry,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def session_for(url):
+    """Shared Session for the URL's scheme + host (thread-safe; requests.Session is safe for concurrent GETs)."""
+    parsed = urlparse(url)
+    key = f'{parsed.scheme}://{parsed.netloc}'
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _build_session()
+                _sessions[key] = session
+    return session
+
+
+def _timeout(timeout):
+    if timeout is None:
+        return (_settings['connect_timeout'], _settings['read_timeout'])
+    if isinstance(timeout, (int, float)):
+        # Callers pass a single read budget (e.g. timeout=30 for Pulselive pages); keep connect short.
+        return (min(_settings['connect_timeout'], timeout), timeout)
+    return timeout
+
+
+def get(url, timeout=None, **kwargs):
+    return session_for(url).get(url, timeout=_timeout(timeout), **kwargs)
+
+
+def post(url, timeout=None, **kwargs):
+    """POST without status retries except 429 (Retry-After), so non-idempotent calls are not repeated."""
+    session = session_for(url)
+    attempts = max(1, _settings['retries'] + 1)
+    for attempt in range(attempts):
+        resp = session.post(url, timeout=_timeout(timeout), **kwargs)
+        if resp.status_code != 429 or attempt == attempts - 1:
+            return resp
+        retry_after = resp.headers.get('Retry-After')
+        try:
+            delay = float(retry_after) if retry_after else _settings['backoff_factor'] * (2 ** attempt)
+        except ValueError:
+            delay = _settings['backoff_factor'] * (2 ** attempt)
+        resp.close()
+        time.sleep(min(delay, MAX_RETRY_AFTER_SECONDS))
+    return resp
@@ -0,0 +1,192 @@
+"""In-process background scheduler for syncs and reminder sweeps (enabled with SCHEDULER_ENABLED).
+
+Every gunicorn worker runs the same loop; a job_locks row per job makes sure only one worker (or node)
+runs it. Claiming a job is a single UPDATE that checks both the lock (free or expired) and that the job
+is due (last_started_at before the job's cutoff), so a nightly job runs once per night even when several
+workers wake up for it. Each execution is recorded in job_runs (duration, items processed, errors).
+
+Jobs are registered by app.py with register_job(); a job function returns (items_processed, errors).
+"""
+import os
+import socket
+import threading
+import time as time_module
+import traceback
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from config import app, db
+from models import JobLock, JobRun
+
+OWNER = f'{socket.gethostname()}:{os.getpid()}'
+
+_jobs = {}
+_thread = [None]
+_stop = threading.Event()
+
+
+class Job:
+    """A named job: runs every `interval` (timedelta), or daily at `daily_at_hour` UTC when given."""
+
+    def __init__(self, name, func, interval=None, daily_at_hour=None, lock_ttl=timedelta(minutes=30)):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.daily_at_hour = daily_at_hour
+        self.lock_ttl = lock_ttl
+
+    def cutoff(self, now):
+        """The job is due if it last started before this (naive UTC) time."""
+        if self.daily_at_hour is not None:
+            slot = now.replace(hour=self.daily_at_hour, minute=0, second=0, microsecond=0)
+            return slot if slot <= now else slot - timedelta(days=1)
+        return now - self.interval
+
+
+def register_job(name, func, interval=None, daily_at_hour=None, lock_ttl=timedelta(minutes=30)):
+    if interval is None and daily_at_hour is None:
+        raise ValueError(f'Job {name} needs an interval or daily_at_hour')
+    _jobs[name] = Job(name, func, interval=interval, daily_at_hour=daily_at_hour, lock_ttl=lock_ttl)
+    return _jobs[name]
+
+
+def registered_jobs():
+    return dict(_jobs)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def try_acquire(job, now=None, force=False):
+    """Claim job for OWNER if it is free and due (force: free is enough). Commits; returns True when claimed."""
+    now = now or _utcnow()
+    expires_at = now + job.lock_ttl
+    free = (JobLock.expires_at.is_(None)) | (JobLock.expires_at < now)
+    due = (JobLock.last_started_at.is_(None)) | (JobLock.last_started_at < job.cutoff(now))
+    claimed = JobLock.query.filter(JobLock.name == job.name, free, *(() if force else (due,))).update(
+        {'owner': OWNER, 'expires_at': expires_at, 'last_started_at': now}, synchronize_session=False)
+    if claimed:
+        db.session.commit()
+        return True
+    db.session.rollback()
+    if db.session.get(JobLock, job.name) is not None:
+        return False
+    try:
+        db.session.add(JobLock(name=job.name, owner=OWNER, expires_at=expires_at, last_started_at=now))
+        db.session.commit()
+        return True
+    except IntegrityError:  # another worker created it first
+        db.session.rollback()
+        return False
+
+
+def release(job):
+    JobLock.query.filter_by(name=job.name, owner=OWNER).update({'expires_at': None}, synchronize_session=False)
+    db.session.commit()
+
+
+class RowLocks:
+    """Short-lived named locks shared by every worker: one job_locks row per name ('<prefix><key>') held until
+    expires_at, claimed like a job (conditional UPDATE, else INSERT). Each call runs on its own connection and commits
+    there, so the caller's session is left alone; usable from request and background threads alike."""
+
+    def __init__(self, prefix):
+        self._prefix = prefix
+
+    def acquire(self, key, ttl_seconds):
+        name = self._prefix + key
+        now = _utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        table = JobLock.__table__
+        try:
+            with db.engine.begin() as conn:
+                claimed = conn.execute(table.update().where(
+                    table.c.name == name, or_(table.c.expires_at.is_(None), table.c.expires_at < now),
+                ).values(owner=OWNER, expires_at=expires_at)).rowcount
+                if claimed:
+                    return True
+                if conn.execute(select(table.c.name).where(table.c.name == name)).first() is not None:
+                    return False
+                conn.execute(table.insert().values(name=name, owner=OWNER, expires_at=expires_at))
+            return True
+        except IntegrityError:  # another worker created it first
+            return False
+        except SQLAlchemyError as e:
+            print(f"Row lock {name}: database unavailable ({e}); proceeding without it")
+            return True
+
+    def release(self, key):
+        table = JobLock.__table__
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(table.update().where(table.c.name == self._prefix + key, table.c.owner == OWNER)
+                             .values(expires_at=None))
+        except SQLAlchemyError as e:
+            print(f"Row lock {self._prefix + key}: release failed ({e}); it expires on its own")
+
+
+def run_job(name, force=False):
+    """Run one job under its lock and record a JobRun. Returns the JobRun, or None if not due / held elsewhere."""
+    job = _jobs[name]
+    if not try_acquire(job, force=force):
+        return None
+    started = _utcnow()
+    run = JobRun(job_name=name, owner=OWNER, started_at=started, status='running')
+    db.session.add(run)
+    db.session.commit()
+    run_id = run.id
+    t0 = time_module.perf_counter()
+    items, errors = 0, []
+    try:
+        items, errors = job.func()
+    except Exception as e:
+        db.session.rollback()
+        errors = [f'{type(e).__name__}: {e}']
+        traceback.print_exc()
+    try:
+        run = db.session.get(JobRun, run_id)
+        run.finished_at = _utcnow()
+        run.duration_ms = int((time_module.perf_counter() - t0) * 1000)
+        run.items_processed = items or 0
+        run.status = 'error' if errors else 'ok'
+        run.error = '\n'.join(errors)[:4000] if errors else None
+        db.session.commit()
+    finally:
+        release(job)
+    return run
+
+
+def run_due_jobs():
+    """One scheduler tick: run every registered job that is due and not held by another worker."""
+    for name in list(_jobs):
+        try:
+            with app.app_context():
+                run = run_job(name)
+                if run is not None:
+                    print(f'Scheduler: {name} {run.status} in {run.duration_ms} ms ({run.items_processed} items)')
+                db.session.remove()
+        except Exception as e:
+            print(f'Scheduler: {name} failed to run: {e}')
+
+
+def _loop(tick_seconds):
+    while not _stop.wait(tick_seconds):
+        run_due_jobs()
+
+
+def start(tick_seconds=None):
+    """Start the scheduler thread once per process (daemon: dies with the worker)."""
+    if _thread[0] is not None and _thread[0].is_alive():
+        return False
+    _stop.clear()
+    tick = tick_seconds if tick_seconds is not None else app.config.get('SCHEDULER_TICK_SECONDS', 15)
+    _thread[0] = threading.Thread(target=_loop, args=(tick,), name='scheduler', daemon=True)
+    _thread[0].start()
+    return True
+
+
+def stop():
+    _stop.set()
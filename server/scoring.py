@@ -0,0 +1,107 @@
+"""Columnar W/D/L scoring for predictions.
+
+The per-pick rule lives in app._pick_result: Win for the exact score, Draw for the right outcome
+(home win / away win / draw), Loss otherwise, and no result while a score is missing or the fixture
+has not kicked off. This module applies the same rule to whole columns at once (predicted home/away,
+actual home/away and a started flag per pick), so rescoring and the leaderboard score every pick in
+one call instead of a Python call per (game, fixture) pair.
+
+Results are small integer codes (NO_RESULT, WIN, DRAW, LOSS); RESULT_NAMES and POINTS map them back
+to games.game_result strings and leaderboard points. With NumPy installed the kernels are vectorized;
+without it the same functions run a plain loop, so callers never branch on NUMPY_AVAILABLE.
+"""
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+NO_RESULT, WIN, DRAW, LOSS = 0, 1, 2, 3
+RESULT_NAMES = (None, 'Win', 'Draw', 'Loss')
+RESULT_CODES = {'Win': WIN, 'Draw': DRAW, 'Loss': LOSS}
+POINTS = (0, 3, 1, 0)
+
+
+def _sign(x):
+    return (x > 0) - (x < 0)
+
+
+def _naive_utc(value):
+    """Kickoffs are stored naive UTC; aware values are converted so both compare on one clock."""
+    if value is None or getattr(value, 'tzinfo', None) is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def fixtures_started(kickoffs, completed, now=None):
+    """Started flag per fixture (app._fixture_has_started): completed, or kickoff at or before now.
+    A missing kickoff only counts when the fixture is completed."""
+    now = _naive_utc(now) if now is not None else datetime.now(timezone.utc).replace(tzinfo=None)
+    kickoffs = [_naive_utc(k) for k in kickoffs]
+    if not NUMPY_AVAILABLE:
+        return [bool(c) or (k is not None and k <= now) for k, c in zip(kickoffs, completed)]
+    kickoff_arr = np.array(kickoffs, dtype='datetime64[us]')  # None -> NaT, which compares False
+    return np.asarray(completed, dtype=bool) | (kickoff_arr <= np.datetime64(now, 'us'))
+
+
+def score_picks(pred_home, pred_away, actual_home, actual_away, started=None):
+    """Result code per pick. All arguments are equal-length columns; None scores give NO_RESULT, as does
+    a False started flag (pass started=None when every fixture is known to be scoreable)."""
+    if not NUMPY_AVAILABLE:
+        if started is None:
+            started = [True] * len(pred_home)
+        codes = []
+        for ph, pa, ah, aa, s in zip(pred_home, pred_away, actual_home, actual_away, started):
+            if not s or ph is None or pa is None or ah is None or aa is None:
+                codes.append(NO_RESULT)
+            elif ph == ah and pa == aa:
+                codes.append(WIN)
+            else:
+                codes.append(DRAW if _sign(ph - pa) == _sign(ah - aa) else LOSS)
+        return codes
+    # float columns so None becomes NaN; every comparison with NaN is False
+    ph, pa, ah, aa = (np.asarray(c, dtype=float) for c in (pred_home, pred_away, actual_home, actual_away))
+    codes = np.where(np.sign(ph - pa) == np.sign(ah - aa), DRAW, LOSS).astype(np.int8)
+    codes[(ph == ah) & (pa == aa)] = WIN
+    missing = np.isnan(ph) | np.isnan(pa) | np.isnan(ah) | np.isnan(aa)
+    if started is not None:
+        missing |= ~np.asarray(started, dtype=bool)
+    codes[missing] = NO_RESULT
+    return codes
+
+
+def take(values, index, dtype=float):
+    """values[i] for each i in index: broadcast per-fixture columns to per-pick columns (scores as float,
+    so None is NaN; pass dtype=bool for started flags)."""
+    if not NUMPY_AVAILABLE:
+        return [values[i] for i in index]
+    return np.asarray(values, dtype=dtype)[np.asarray(index, dtype=np.intp)]
+
+
+def result_names(codes):
+    """games.game_result value (None, 'Win', 'Draw', 'Loss') per code."""
+    return [RESULT_NAMES[c] for c in (np.asarray(codes).tolist() if NUMPY_AVAILABLE else codes)]
+
+
+def points(codes):
+    """Leaderboard points per code (Win 3, Draw 1, Loss and no result 0)."""
+    if not NUMPY_AVAILABLE:
+        return [POINTS[c] for c in codes]
+    return np.asarray(POINTS, dtype=np.int16)[np.asarray(codes, dtype=np.intp)]
+
+
+def tally(codes, groups, size):
+    """(wins, draws, losses) lists of length size, counting each pick's code under its group index
+    (e.g. the member's position in the leaderboard)."""
+    if not NUMPY_AVAILABLE:
+        counts = [[0] * size for _ in range(4)]
+        for code, group in zip(codes, groups):
+            counts[code][group] += 1
+        return counts[WIN], counts[DRAW], counts[LOSS]
+    codes = np.asarray(codes, dtype=np.intp)
+    groups = np.asarray(groups, dtype=np.intp)
+    counts = np.bincount(codes * size + groups, minlength=4 * size).reshape(4, size)
+    return counts[WIN].tolist(), counts[DRAW].tolist(), counts[LOSS].tolist()
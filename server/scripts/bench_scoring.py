@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark W/D/L scoring: per-row _compute_game_result on pick objects vs the columnar path on columns as a
+column query returns them (_score_pick_columns, used by _rescore_fixtures), and the bare kernel on prebuilt columns.
+Run from server/: python scripts/bench_scoring.py [--sizes 10000,100000,1000000] [--fixtures 380]"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+import scoring  # noqa: E402
+from app import _compute_game_result, _score_pick_columns  # noqa: E402
+
+
+def _make_fixtures(count, now):
+    """A season's worth of fixtures: most played, some placeholders before kickoff, a few unscored."""
+    fixtures = []
+    for i in range(count):
+        kickoff = now + timedelta(hours=random.randint(-24 * 200, 24 * 30))
+        scored = random.random() < 0.95
+        fixtures.append(SimpleNamespace(
+            id=i,
+            fixture_date=kickoff if i % 2 else kickoff.replace(tzinfo=timezone.utc),
+            actual_home_score=random.randint(0, 4) if scored else None,
+            actual_away_score=random.randint(0, 4) if scored else None,
+            is_completed=scored and kickoff <= now,
+        ))
+    return fixtures
+
+
+def _make_picks(size, fixtures):
+    return [
+        (SimpleNamespace(home_team_score=random.randint(0, 3), away_team_score=random.randint(0, 3)),
+         random.choice(fixtures))
+        for _ in range(size)
+    ]
+
+
+def _time(fn):
+    started = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - started, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='comma-separated pick counts')
+    parser.add_argument('--fixtures', type=int, default=380, help='distinct fixtures the picks are spread over')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    now = datetime.now(timezone.utc)
+    fixtures = _make_fixtures(args.fixtures, now.replace(tzinfo=None))
+    print(f"numpy: {'yes' if scoring.NUMPY_AVAILABLE else 'no (pure-Python fallback)'}; {args.fixtures} fixtures")
+    print(f"{'picks':>10} {'per-row s':>10} {'columnar s':>11} {'kernel s':>9} {'columnar':>9} {'kernel':>8}")
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        picks = _make_picks(size, fixtures)
+        per_row_s, expected = _time(lambda: [_compute_game_result(g, f, now=now) for g, f in picks])
+        # As _rescore_fixtures calls it: pick rows from a column query, fixture columns built once per fixture
+        rows = [(g.home_team_score, g.away_team_score, f.id) for g, f in picks]
+        by_id = {f.id: f for f in fixtures}
+        columnar_s, got = _time(lambda: _score_pick_columns(
+            [r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows], by_id, now=now))
+        if got != expected:
+            raise SystemExit(f'Mismatch at {size} picks: columnar results differ from _compute_game_result')
+        # Kernel only, on columns that are already built (as when they come straight from a column query)
+        started = scoring.fixtures_started([f.fixture_date for f in fixtures], [f.is_completed for f in fixtures], now=now)
+        index = {id(f): i for i, f in enumerate(fixtures)}
+        fixture_idx = [index[id(f)] for _, f in picks]
+        columns = (
+            [g.home_team_score for g, _ in picks], [g.away_team_score for g, _ in picks],
+            scoring.take([f.actual_home_score for f in fixtures], fixture_idx),
+            scoring.take([f.actual_away_score for f in fixtures], fixture_idx),
+            scoring.take(started, fixture_idx, dtype=bool),
+        )
+        kernel_s, _ = _time(lambda: scoring.score_picks(*columns))
+        print(f'{size:>10} {per_row_s:>10.3f} {columnar_s:>11.3f} {kernel_s:>9.4f} '
+              f'{per_row_s / columnar_s:>8.1f}x {per_row_s / kernel_s:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
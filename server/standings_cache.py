@@ -0,0 +1,185 @@
+"""External league-table cache (Pulselive, football-data.org) with stale-while-revalidate.
+
+Tables change a few times per matchweek, but the standings page and every Ask AI request used to fetch them. Each
+competition's table is now stored with the time it was fetched:
+  - younger than the TTL: served as is;
+  - older: served immediately while one background thread refreshes it (stale-while-revalidate);
+  - missing: fetched inline; concurrent requests for the same key wait for that fetch instead of starting their own.
+A refresh runs under a per-key lock shared by all workers: a Redis SET NX with expiry on the redis backend; on the
+memory backend a job_locks row (scheduler.RowLocks) by default, or a process-local lock with STANDINGS_CACHE_LOCK=local.
+Memory entries stay per process, so each worker still fetches once per TTL, but never at the same time as another. A failed refresh keeps the last good table, which is kept for
+STANDINGS_CACHE_STALE_SECONDS, so a provider outage or an exhausted football-data.org quota serves old data instead
+of an error.
+
+Fetchers return the value to cache, or None on failure (None is never stored).
+"""
+import json
+import os
+import socket
+import threading
+import time
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+OWNER = f'{socket.gethostname()}:{os.getpid()}'
+
+
+class MemoryBackend:
+    """Per-process entries, dropped after keep_seconds. Locks are per process unless a shared `locks` object (with
+    acquire(key, ttl_seconds) and release(key), e.g. scheduler.RowLocks) is given."""
+
+    def __init__(self, locks=None):
+        self._entries = {}
+        self._locks = {}
+        self._shared_locks = locks
+        self._mutex = threading.Lock()
+
+    def get(self, key):
+        with self._mutex:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            return entry[1] if entry else None
+
+    def set(self, key, value, keep_seconds):
+        with self._mutex:
+            self._entries[key] = (time.time() + keep_seconds, value)
+
+    def acquire(self, key, ttl_seconds):
+        if self._shared_locks is not None:
+            return self._shared_locks.acquire(key, ttl_seconds)
+        with self._mutex:
+            expires_at = self._locks.get(key)
+            if expires_at is not None and expires_at > time.time():
+                return False
+            self._locks[key] = time.time() + ttl_seconds
+            return True
+
+    def release(self, key):
+        if self._shared_locks is not None:
+            self._shared_locks.release(key)
+            return
+        with self._mutex:
+            self._locks.pop(key, None)
+
+    def clear(self):
+        with self._mutex:
+            self._entries.clear()
+            self._locks.clear()
+
+
+class RedisBackend:
+    """Entries and locks shared by all workers. Errors read as misses; a lock that cannot be taken is held elsewhere."""
+
+    def __init__(self, url, prefix='standings:'):
+        self._client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+        self._prefix = prefix
+
+    def get(self, key):
+        try:
+            raw = self._client.get(self._prefix + key)
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, keep_seconds):
+        try:
+            self._client.set(self._prefix + key, json.dumps(value), ex=max(1, int(keep_seconds)))
+        except redis.RedisError:
+            pass
+
+    def acquire(self, key, ttl_seconds):
+        try:
+            return bool(self._client.set(f'{self._prefix}lock:{key}', OWNER, nx=True, ex=max(1, int(ttl_seconds))))
+        except redis.RedisError:
+            return True  # Redis down: refresh locally rather than never
+
+    def release(self, key):
+        try:
+            lock_key = f'{self._prefix}lock:{key}'
+            if self._client.get(lock_key) == OWNER.encode('utf-8'):
+                self._client.delete(lock_key)
+        except redis.RedisError:
+            pass
+
+    def clear(self):
+        try:
+            keys = list(self._client.scan_iter(self._prefix + '*'))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+_settings = {'ttl_seconds': 600, 'stale_seconds': 7 * 24 * 3600, 'lock_seconds': 30}
+_backend = [MemoryBackend()]
+
+
+def configure(backend='memory', url='', ttl_seconds=600, stale_seconds=7 * 24 * 3600, lock_seconds=30, locks=None):
+    """Pick the backend ('memory', 'redis' or 'none'). 'redis' without the package or a URL falls back to memory.
+    locks: shared refresh locks for the memory backend (None: per process)."""
+    _settings.update(ttl_seconds=ttl_seconds, stale_seconds=max(stale_seconds, ttl_seconds), lock_seconds=lock_seconds)
+    if backend == 'none':
+        _backend[0] = None
+    elif backend == 'redis' and REDIS_AVAILABLE and url:
+        _backend[0] = RedisBackend(url)
+    else:
+        if backend == 'redis':
+            print("WARNING: STANDINGS_CACHE_BACKEND=redis needs the redis package and a URL; using the in-process cache")
+        _backend[0] = MemoryBackend(locks=locks)
+
+
+def _refresh(backend, key, fetch):
+    """Run fetch under the key's lock and store a non-None result. Returns the new value, or None."""
+    try:
+        value = fetch()
+    except Exception as e:
+        print(f"Standings cache: refresh of {key} failed: {e}")
+        value = None
+    try:
+        if value is not None:
+            backend.set(key, {'value': value, 'fetched_at': time.time()}, _settings['stale_seconds'])
+    finally:
+        backend.release(key)
+    return value
+
+
+def _refresh_in_background(backend, key, fetch):
+    threading.Thread(target=_refresh, args=(backend, key, fetch), name=f'standings-refresh:{key}', daemon=True).start()
+
+
+def get(key, fetch):
+    """Cached value for key, fetching it with fetch() when needed. Returns None only when there is no table at all
+    (never fetched successfully, and the fetch now failed or is still running elsewhere after lock_seconds)."""
+    backend = _backend[0]
+    if backend is None:
+        return fetch()
+    entry = backend.get(key)
+    if entry is not None:
+        if time.time() - entry['fetched_at'] >= _settings['ttl_seconds'] and backend.acquire(key, _settings['lock_seconds']):
+            _refresh_in_background(backend, key, fetch)
+        return entry['value']
+    if backend.acquire(key, _settings['lock_seconds']):
+        return _refresh(backend, key, fetch)
+    # Another request is fetching this table: wait for it rather than calling the provider again
+    deadline = time.monotonic() + _settings['lock_seconds']
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        entry = backend.get(key)
+        if entry is not None:
+            return entry['value']
+        if backend.acquire(key, _settings['lock_seconds']):
+            return _refresh(backend, key, fetch)
+    return None
+
+
+def clear():
+    backend = _backend[0]
+    if backend is not None:
+        backend.clear()
@@ -0,0 +1,240 @@
+"""Team-name normalization and fixture lookup by (home, away) team pair.
+
+Predictions, syncs and the leaderboard all decide "is this the same match?" with
+_fixture_matches_game. FixtureIndex answers the same question for a whole fixture list
+with dict lookups instead of a scan per game.
+
+Normalizers are memoized (a few hundred distinct spellings, called in every sync and
+leaderboard loop). Alias resolution goes through _TEAM_KEYS, which app.py loads from the
+teams / team_aliases registry (set_team_registry); until then the built-in _TEAM_ALIASES apply.
+"""
+import unicodedata
+from functools import lru_cache
+
+# Bound for the per-process name memos; distinct spellings across all competitions are far fewer.
+TEAM_NAME_MEMO_SIZE = 4096
+
+
+@lru_cache(maxsize=TEAM_NAME_MEMO_SIZE)
+def _normalize_team_name(s):
+    """Normalize team name for matching (e.g. 'Brighton & Hove Albion' vs 'Brighton and Hove Albion')."""
+    if s is None:
+        return ''
+    t = (s or '').strip().lower()
+    t = t.replace('&', 'and').replace('  ', ' ')
+    while '  ' in t:
+        t = t.replace('  ', ' ')
+    return t
+
+
+# Common short names / aliases for Premier League teams (normalized key -> normalized canonical name)
+_TEAM_ALIASES = {
+    'wolves': 'wolverhampton wanderers',
+    'spurs': 'tottenham hotspur',
+    'tottenham': 'tottenham hotspur',
+    'man utd': 'manchester united',
+    'man united': 'manchester united',
+    'man utd.': 'manchester united',
+    "man u": 'manchester united',
+    'man city': 'manchester city',
+    'city': 'manchester city',
+    'west ham': 'west ham united',
+    'forest': 'nottingham forest',
+    'notts forest': 'nottingham forest',
+    'newcastle': 'newcastle united',
+    'brighton': 'brighton and hove albion',
+    'villa': 'aston villa',
+    'bournemouth': 'afc bournemouth',
+    'utd': 'manchester united',  # risky but common
+}
+
+
+# Normalized spelling -> team key: registry team id (int) once loaded, else canonical name from _TEAM_ALIASES.
+_TEAM_KEYS = dict(_TEAM_ALIASES)
+# Match-normalized spelling -> registry team id, per competition (used to attach newly seen spellings).
+_TEAM_MATCH_KEYS = {}
+
+
+def set_team_registry(aliases):
+    """Replace the alias map with registry rows: iterable of (normalized alias, team id, competition_slug).
+    Every spelling of a team then resolves to the same small int. Clears the name memos."""
+    keys = {}
+    match_keys = {}
+    for alias, team_id, competition_slug in aliases:
+        keys[alias] = team_id
+        match_keys.setdefault((competition_slug or '', _normalize_team_name_for_match(alias)), team_id)
+    _TEAM_KEYS.clear()
+    _TEAM_KEYS.update(keys)
+    _TEAM_MATCH_KEYS.clear()
+    _TEAM_MATCH_KEYS.update(match_keys)
+    _alias_team_key.cache_clear()
+
+
+def reset_team_registry():
+    """Back to the built-in _TEAM_ALIASES (no registry loaded)."""
+    _TEAM_KEYS.clear()
+    _TEAM_KEYS.update(_TEAM_ALIASES)
+    _TEAM_MATCH_KEYS.clear()
+    _alias_team_key.cache_clear()
+
+
+def add_team_alias(alias, team_id, competition_slug=None):
+    """Record one newly registered spelling in the in-process map."""
+    _TEAM_KEYS[alias] = team_id
+    _TEAM_MATCH_KEYS.setdefault((competition_slug or '', _normalize_team_name_for_match(alias)), team_id)
+    _alias_team_key.cache_clear()
+
+
+def is_registered_spelling(name):
+    """True if the normalized spelling is already a registry alias."""
+    return isinstance(_alias_team_key(name), int)
+
+
+def registered_team_for(name, competition_slug=None):
+    """Registry team id for a raw spelling: exact normalized alias, else same match key in the competition."""
+    key = _alias_team_key(name)
+    if isinstance(key, int):
+        return key
+    return _TEAM_MATCH_KEYS.get((competition_slug or '', _normalize_team_name_for_match((name or '').strip())))
+
+
+def _team_names_equivalent(a, b):
+    """True if both team names refer to the same team (normalized + aliases)."""
+    return _alias_team_key(a) == _alias_team_key(b)
+
+
+@lru_cache(maxsize=TEAM_NAME_MEMO_SIZE)
+def _normalize_team_name_for_match(name):
+    """Normalize team name for deduplication: casing, accents (Curaçao/Curcao), umlauts (München/Munich), etc."""
+    if not name or not isinstance(name, str):
+        return ''
+    s = name.strip().lower()
+    # Strip accents (Curaçao -> curacao, Iran/New Zealand already ascii)
+    s = unicodedata.normalize('NFKD', s)
+    s = ''.join(c for c in s if not unicodedata.combining(c))
+    # Umlauts -> ascii so München matches Munich
+    for char, repl in [('ü', 'ue'), ('ö', 'oe'), ('ä', 'ae'), ('ß', 'ss')]:
+        s = s.replace(char, repl)
+    # Drop common prefixes so "FC Bayern München" and "Bayern Munich" match
+    for prefix in ('fc ', 'afc ', 'ssc ', 'sc ', 'cf ', 'fk ', 'real ', 'atletico '):
+        if s.startswith(prefix):
+            s = s[len(prefix):].strip()
+    # Drop common suffixes so "Chelsea FC" and "Chelsea" match (football-data.org uses suffix style)
+    for suffix in (' fc', ' fc.', ' afc', ' afc.'):
+        if s.endswith(suffix):
+            s = s[:-len(suffix)].strip()
+    # Place-name variants (German vs English)
+    s = s.replace('muenchen', 'munich')
+    s = s.replace('moenchengladbach', 'munchengladbach')
+    s = s.replace('&', ' and ')
+    while '  ' in s:
+        s = s.replace('  ', ' ')
+    return s.strip()
+
+
+def _fixture_matches_game(fixture, home_team, away_team):
+    """True if fixture's teams match the given home/away (exact, case-insensitive, normalized, or alias).
+    Uses _normalize_team_name_for_match so 'Chelsea FC' matches 'Chelsea' (leaderboard and predictions)."""
+    if not fixture or not fixture.fixture_home_team or not fixture.fixture_away_team:
+        return False
+    f_h = (fixture.fixture_home_team or '').strip()
+    f_a = (fixture.fixture_away_team or '').strip()
+    g_h = (home_team or '').strip()
+    g_a = (away_team or '').strip()
+    if f_h == g_h and f_a == g_a:
+        return True
+    if f_h.lower() == g_h.lower() and f_a.lower() == g_a.lower():
+        return True
+    if _normalize_team_name(f_h) == _normalize_team_name(g_h) and _normalize_team_name(f_a) == _normalize_team_name(g_a):
+        return True
+    if _team_names_equivalent(f_h, g_h) and _team_names_equivalent(f_a, g_a):
+        return True
+    if _normalize_team_name_for_match(f_h) == _normalize_team_name_for_match(g_h) and _normalize_team_name_for_match(f_a) == _normalize_team_name_for_match(g_a):
+        return True
+    return False
+
+
+@lru_cache(maxsize=TEAM_NAME_MEMO_SIZE)
+def _alias_team_key(name):
+    """Key under which _team_names_equivalent (and the exact/case-insensitive/& checks it subsumes) is equality:
+    registry team id when the spelling is registered, else the normalized (aliased) name."""
+    n = _normalize_team_name(name)
+    return _TEAM_KEYS.get(n, n)
+
+
+def _fixture_in_competition(fixture, competition_slug):
+    """Competition preference used by _fixture_for_game ('eng.1' includes legacy null and empty string)."""
+    comp = getattr(fixture, 'competition_slug', None)
+    if competition_slug == 'eng.1':
+        return comp in ('eng.1', None, '')
+    return comp == competition_slug
+
+
+class FixtureIndex:
+    """Fixtures hashed by normalized (home, away) pair, competition, kickoff date and id.
+
+    _fixture_matches_game is true exactly when the alias keys of both sides are equal or the
+    _normalize_team_name_for_match keys of both sides are equal, so a lookup is the union of two
+    buckets. Candidates keep their position in the source list, so find() returns the same fixture
+    as scanning the list: first match in the preferred competition, else first match anywhere.
+    Build once per request (or per competition) and reuse for every game.
+    """
+
+    def __init__(self, fixtures):
+        self.fixtures = list(fixtures)
+        self._by_alias_pair = {}
+        self._by_match_pair = {}
+        self._by_id = {}
+        self._by_competition = {}
+        self._by_date = {}
+        for pos, f in enumerate(self.fixtures):
+            fid = getattr(f, 'id', None)
+            if fid is not None:
+                self._by_id.setdefault(fid, f)
+            self._by_competition.setdefault(getattr(f, 'competition_slug', None) or '', []).append(f)
+            kickoff = getattr(f, 'fixture_date', None)
+            if kickoff is not None:
+                self._by_date.setdefault(kickoff.date(), []).append(f)
+            home = getattr(f, 'fixture_home_team', None)
+            away = getattr(f, 'fixture_away_team', None)
+            if not home or not away:
+                continue
+            self._by_alias_pair.setdefault((_alias_team_key(home), _alias_team_key(away)), []).append(pos)
+            self._by_match_pair.setdefault(
+                (_normalize_team_name_for_match(home.strip()), _normalize_team_name_for_match(away.strip())), []
+            ).append(pos)
+
+    def __len__(self):
+        return len(self.fixtures)
+
+    def candidates(self, home_team, away_team):
+        """All fixtures matching the team pair (same rules as _fixture_matches_game), in source-list order."""
+        home = (home_team or '').strip()
+        away = (away_team or '').strip()
+        positions = set(self._by_alias_pair.get((_alias_team_key(home), _alias_team_key(away)), ()))
+        positions.update(self._by_match_pair.get(
+            (_normalize_team_name_for_match(home), _normalize_team_name_for_match(away)), ()
+        ))
+        return [self.fixtures[pos] for pos in sorted(positions)]
+
+    def find(self, home_team, away_team, competition_slug=None):
+        """First matching fixture in competition_slug if given, else first matching fixture in any competition."""
+        matches = self.candidates(home_team, away_team)
+        if competition_slug:
+            for f in matches:
+                if _fixture_in_competition(f, competition_slug):
+                    return f
+        return matches[0] if matches else None
+
+    def get(self, fixture_id):
+        return self._by_id.get(fixture_id)
+
+    def for_competition(self, competition_slug):
+        """Fixtures in a competition ('eng.1' includes legacy null / empty slug)."""
+        if competition_slug == 'eng.1':
+            return self._by_competition.get('eng.1', []) + self._by_competition.get('', [])
+        return list(self._by_competition.get(competition_slug or '', []))
+
+    def on_date(self, day):
+        """Fixtures kicking off on a calendar date (datetime.date)."""
+        return list(self._by_date.get(day, []))
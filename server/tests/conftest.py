@@ -1,9 +1,12 @@
 """Pytest fixtures: in-memory SQLite + Flask test client."""
 import os
 import sys
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
+from sqlalchemy import MetaData, event
 
 SERVER_DIR = Path(__file__).resolve().parents[1]
 if str(SERVER_DIR) not in sys.path:
@@ -12,14 +15,45 @@ if str(SERVER_DIR) not in sys.path:
 os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
 os.environ.setdefault('SECRET_KEY', 'test-secret-key-for-smoke-tests')
 os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('PROVIDER_CACHE_DIR', tempfile.mkdtemp(prefix='provider-cache-'))
 
 from config import app, db, bcrypt  # noqa: E402
 import app as flask_app  # noqa: E402, F401 — registers routes on config.app
-
-from models import User, League, LeagueMembership, LeagueWeekWinner  # noqa: E402
-
-# Only tables needed for league endpoint tests (avoid sqlite + unnamed Fixture indexes).
-_TEST_TABLES = (User.__table__, League.__table__, LeagueMembership.__table__, LeagueWeekWinner.__table__)
+import leaderboard_cache  # noqa: E402
+
+from models import (  # noqa: E402
+    User, League, LeagueMembership, LeagueWeekWinner, LeagueStanding, Game, Fixture, JobLock, JobRun,
+    EmailOutbox, Prediction, LeagueRoundClose, LeagueRoundStanding, FixtureAISuggestion,
+)
+
+
+
+def _without_indexes(table):
+    """Copy of table without its indexes, in a separate MetaData so the model's own table is untouched. (The app's
+    naming convention has no 'ix' key, so index=True columns get unnamed indexes that SQLite's create() rejects;
+    migrations name them.)"""
+    copy = table.to_metadata(MetaData())
+    copy.indexes.clear()
+    return copy
+
+
+# Only tables needed for league endpoint tests. Leaderboard/standings code reads games and fixtures.
+_TEST_TABLES = (
+    User.__table__,
+    League.__table__,
+    LeagueMembership.__table__,
+    LeagueWeekWinner.__table__,
+    LeagueRoundClose.__table__,
+    LeagueRoundStanding.__table__,
+    LeagueStanding.__table__,
+    Game.__table__,
+    _without_indexes(Fixture.__table__),
+    FixtureAISuggestion.__table__,
+    JobLock.__table__,
+    JobRun.__table__,
+    EmailOutbox.__table__,
+    Prediction.__table__,
+)
 
 
 def _create_test_tables():
@@ -36,6 +70,7 @@ def _drop_test_tables():
 def client():
     app.config['TESTING'] = True
     app.config['SIGNUP_LEAGUE_ID'] = None
+    leaderboard_cache.clear()  # league ids and versions repeat across tests' fresh databases
     with app.test_client() as test_client:
         with app.app_context():
             _create_test_tables()
@@ -44,6 +79,25 @@ def client():
             _drop_test_tables()
 
 
+@pytest.fixture
+def sql_log():
+    """`with sql_log() as statements:` records the SQL run on db.engine inside the block, in order.
+    sql_log('commit') records one connection per commit instead."""
+    @contextmanager
+    def _record(event_name='before_cursor_execute'):
+        recorded = []
+
+        def _append(conn, *args):
+            recorded.append(args[1] if event_name == 'before_cursor_execute' else conn)
+
+        event.listen(db.engine, event_name, _append)
+        try:
+            yield recorded
+        finally:
+            event.remove(db.engine, event_name, _append)
+    return _record
+
+
 def auth_headers(user_id):
     token = flask_app.generate_token(user_id)
     if isinstance(token, bytes):
@@ -0,0 +1,90 @@
+"""Ask AI: one backend call per round, stored in fixture_ai_suggestions and reused while fresh."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import ai_suggestions
+from config import app, db
+from models import Fixture, FixtureAISuggestion, JobLock, League
+
+
+@pytest.fixture
+def local_backend(monkeypatch):
+    import app as flask_app
+
+    saved = ai_suggestions._backend[0]
+    ai_suggestions.configure(backend='local')
+    calls = []
+    real_predict = ai_suggestions._backend[0].predict_round
+
+    def _counting_predict(fixtures, standings, competition_name='League'):
+        calls.append([f['fixture_id'] for f in fixtures])
+        return real_predict(fixtures, standings, competition_name=competition_name)
+
+    monkeypatch.setattr(ai_suggestions._backend[0], 'predict_round', _counting_predict)
+    monkeypatch.setattr(flask_app, '_ai_competition_table', lambda slug: (None, 'Bundesliga'))
+    yield calls
+    ai_suggestions._backend[0] = saved
+
+
+def test_round_is_predicted_once_and_served_from_the_table(client, member_setup, local_backend):
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=2)
+    with app.app_context():
+        db.session.get(League, member_setup['league_id']).ai_predictions_enabled = True
+        round_5 = [
+            Fixture(competition_slug='ger.1', fixture_round=5, fixture_date=kickoff, fixture_home_team=home,
+                    fixture_away_team=away)
+            for home, away in (('Bayern Munich', 'Borussia Dortmund'), ('RB Leipzig', 'SC Freiburg'), ('Mainz 05', 'FC Augsburg'))
+        ]
+        elsewhere = Fixture(competition_slug='esp.1', fixture_round=5, fixture_date=kickoff,
+                            fixture_home_team='Real Madrid', fixture_away_team='Barcelona')
+        db.session.add_all([*round_5, elsewhere])
+        db.session.commit()
+        ids = [f.id for f in round_5]
+
+    def ask(fixture_id):
+        return client.post('/api/v1/predictions/ask-ai', headers=member_setup['headers'],
+                           json={'fixture_id': fixture_id, 'league_id': member_setup['league_id']})
+
+    first = ask(ids[0])
+    assert first.status_code == 200
+    assert local_backend == [ids]  # the whole round in one call, not the other competition
+    second = ask(ids[1])
+    assert second.status_code == 200 and len(local_backend) == 1
+    assert ask(ids[0]).get_json() == first.get_json()
+
+    with app.app_context():
+        assert FixtureAISuggestion.query.count() == 3
+        db.session.get(FixtureAISuggestion, ids[2]).generated_at -= timedelta(minutes=app.config['AI_SUGGESTION_FRESH_MINUTES'] + 1)
+        db.session.commit()
+    again = ask(ids[2])
+    assert again.status_code == 200 and len(local_backend) == 2
+    # The local stand-in is deterministic
+    assert {k: v for k, v in again.get_json().items() if k != 'generated_at'} == {
+        k: v for k, v in ai_suggestions.LocalBackend().predict_round(
+            [{'fixture_id': ids[2], 'home_team': 'Mainz 05', 'away_team': 'FC Augsburg', 'round': 5}], None)[ids[2]].items()}
+
+
+def test_round_claimed_elsewhere_waits_for_its_rows_instead_of_calling_the_model(client, member_setup, local_backend,
+                                                                                monkeypatch):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=2)
+    db.session.get(League, member_setup['league_id']).ai_predictions_enabled = True
+    fixture = Fixture(competition_slug='ger.1', fixture_round=6, fixture_date=kickoff,
+                      fixture_home_team='VfB Stuttgart', fixture_away_team='Werder Bremen')
+    db.session.add(fixture)
+    # Another worker is generating round 6
+    db.session.add(JobLock(name='ai-round:ger.1:6', owner='other-host:1', expires_at=kickoff))
+    db.session.commit()
+    monkeypatch.setattr(flask_app, 'AI_ROUND_WAIT_SECONDS', 0.3)
+
+    response = client.post('/api/v1/predictions/ask-ai', headers=member_setup['headers'],
+                           json={'fixture_id': fixture.id, 'league_id': member_setup['league_id']})
+    assert response.status_code == 503 and local_backend == []
+
+    db.session.add(FixtureAISuggestion(fixture_id=fixture.id, home_team_score=2, away_team_score=0, rationale='',
+                                       model='local', generated_at=datetime.now(timezone.utc).replace(tzinfo=None)))
+    db.session.commit()
+    rows = flask_app._generate_round_ai_suggestions(ai_suggestions._backend[0], fixture)
+    assert (rows[fixture.id].home_team_score, rows[fixture.id].away_team_score) == (2, 0) and local_backend == []
@@ -5,13 +5,6 @@ from config import app, db
 from models import Fixture
 
 
-def _ensure_fixture_table():
-    # SQLite tests: unnamed indexes on Fixture break create(); columns only is enough.
-    table = Fixture.__table__
-    table.indexes.clear()
-    table.create(db.engine, checkfirst=True)
-
-
 def _clear_fixtures():
     Fixture.query.delete()
     db.session.commit()
@@ -19,7 +12,6 @@ def _clear_fixtures():
 
 def test_world_cup_current_round_ignores_espn_zero_zero_placeholders(client):
     """Upcoming ESPN fixtures use 0-0 scores; default day must still be the lowest incomplete round."""
-    _ensure_fixture_table()
     with app.app_context():
         _clear_fixtures()
         base = datetime(2026, 6, 11, 19, 0, 0)
@@ -0,0 +1,139 @@
+"""Email outbox: queued in the caller's transaction, drained over one reused SMTP connection with retries."""
+import socketserver
+import threading
+from datetime import timedelta
+
+import pytest
+
+import email_outbox
+from config import app, db
+from models import EmailOutbox
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO, MAIL, RCPT (scripted replies per address), DATA, RSET, QUIT."""
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self._reply('220 localhost ESMTP stand-in')
+        recipient = None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ('EHLO', 'HELO'):
+                self._reply('250 localhost')
+            elif verb == 'RCPT':
+                recipient = command.split(':', 1)[1].strip().strip('<>')
+                scripted = server.rcpt_replies.get(recipient) or []
+                self._reply(scripted.pop(0) if scripted else '250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if data_line in (b'.\r\n', b'.\n', b''):
+                        break
+                    lines.append(data_line)
+                server.delivered.append((recipient, b''.join(lines).decode()))
+                self._reply('250 OK queued')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:  # MAIL, RSET, NOOP
+                self._reply('250 OK')
+
+
+@pytest.fixture
+def smtp_server(client, monkeypatch):
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _SmtpHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.delivered = []
+    server.rcpt_replies = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    for key, value in {
+        'MAIL_SERVER': '127.0.0.1',
+        'MAIL_PORT': server.server_address[1],
+        'MAIL_USE_TLS': False,
+        'MAIL_USERNAME': '',
+        'MAIL_PASSWORD': '',
+        'MAIL_DEFAULT_SENDER': 'Fantasy Predictor <noreply@smoke.test>',
+        'EMAIL_SMTP_RATE_PER_SECOND': 0,
+    }.items():
+        monkeypatch.setitem(app.config, key, value)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_drain_reuses_one_connection_and_retries_transient_failures(smtp_server):
+    smtp_server.rcpt_replies = {
+        'busy@smoke.test': ['451 Try again later'],
+        'gone@smoke.test': ['550 No such user'],
+    }
+    with app.app_context():
+        for to in ('a@smoke.test', 'b@smoke.test', 'busy@smoke.test', 'gone@smoke.test', 'c@smoke.test'):
+            email_outbox.enqueue(to, f'Hello {to}', 'Body')
+        db.session.commit()
+
+        totals = email_outbox.drain(concurrency=1)
+        assert totals == {'sent': 3, 'retrying': 1, 'failed': 1}
+        assert smtp_server.connections == 1
+        assert sorted(to for to, _ in smtp_server.delivered) == ['a@smoke.test', 'b@smoke.test', 'c@smoke.test']
+
+        busy = EmailOutbox.query.filter_by(to_email='busy@smoke.test').one()
+        assert (busy.status, busy.attempts) == ('pending', 1)
+        assert EmailOutbox.query.filter_by(to_email='gone@smoke.test').one().status == 'failed'
+
+        # Not due yet: nothing is sent until the backoff has passed
+        assert email_outbox.drain(concurrency=1)['sent'] == 0
+        busy.next_attempt_at = busy.next_attempt_at - timedelta(hours=1)
+        db.session.commit()
+        assert email_outbox.drain(concurrency=1) == {'sent': 1, 'retrying': 0, 'failed': 0}
+        assert db.session.get(EmailOutbox, busy.id).status == 'sent'
+
+
+def test_forgot_password_queues_the_email_with_the_token(client, smtp_server):
+    from models import User
+
+    with app.app_context():
+        user = User(email='reset@smoke.test')
+        user.password_hash = 'password'
+        db.session.add(user)
+        db.session.commit()
+
+    response = client.post('/api/v1/forgot-password', json={
+        'email': 'reset@smoke.test', 'frontend_url': 'https://app.smoke.test'})
+    assert response.status_code == 200 and response.get_json()['email_queued'] is True
+    assert smtp_server.delivered == []  # nothing sent inside the request
+
+    with app.app_context():
+        queued = EmailOutbox.query.one()
+        token = User.query.filter_by(email='reset@smoke.test').one().reset_token
+        assert queued.kind == 'password_reset' and token in queued.body
+        assert email_outbox.drain()['sent'] == 1
+        assert db.session.get(EmailOutbox, queued.id).body == ''  # the token does not outlive the send
+    assert smtp_server.delivered[0][0] == 'reset@smoke.test' and token in smtp_server.delivered[0][1]
+
+
+def test_purge_deletes_finished_rows_past_retention(smtp_server):
+    old = email_outbox._utcnow() - timedelta(days=app.config['EMAIL_OUTBOX_RETENTION_DAYS'] + 1)
+    for to in ('old@smoke.test', 'recent@smoke.test', 'waiting@smoke.test'):
+        email_outbox.enqueue(to, 'Hello', 'Body')
+    db.session.commit()
+    assert email_outbox.drain()['sent'] == 3
+    done = EmailOutbox.query.filter_by(to_email='old@smoke.test').one()
+    done.sent_at = old
+    waiting = EmailOutbox.query.filter_by(to_email='waiting@smoke.test').one()
+    waiting.status, waiting.created_at, waiting.sent_at = 'pending', old, None
+    db.session.commit()
+
+    assert email_outbox.purge() == 1
+    assert sorted(r.to_email for r in EmailOutbox.query.all()) == ['recent@smoke.test', 'waiting@smoke.test']
@@ -0,0 +1,149 @@
+"""ESPN sync fetches per-date scoreboards concurrently against a local stand-in server."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from config import app, db
+from models import Fixture
+
+# Trimmed Bundesliga scoreboard responses in ESPN's shape: base calendar + events for two matchdays.
+RECORDED = json.loads((Path(__file__).parent / 'data' / 'espn_ger1_scoreboard.json').read_text(encoding='utf-8'))
+LATENCY_SECONDS = 0.01
+
+
+class _ScoreboardHandler(BaseHTTPRequestHandler):
+    requested_dates = []
+
+    def do_GET(self):
+        time.sleep(LATENCY_SECONDS)
+        dates = parse_qs(urlparse(self.path).query).get('dates')
+        if dates:
+            self.requested_dates.append(dates[0])
+        if dates:
+            body = RECORDED['dates'].get(dates[0], {'events': []})
+        else:
+            body = RECORDED['scoreboard']
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def espn_stand_in():
+    _ScoreboardHandler.requested_dates = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ScoreboardHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    saved = {k: app.config[k] for k in ('ESPN_API_BASE_URL', 'ESPN_FETCH_CONCURRENCY', 'ESPN_FETCH_DELAY_SECONDS')}
+    app.config['ESPN_API_BASE_URL'] = f'http://127.0.0.1:{server.server_address[1]}'
+    app.config['ESPN_FETCH_DELAY_SECONDS'] = 0.0
+    yield app.config['ESPN_API_BASE_URL']
+    app.config.update(saved)
+    server.shutdown()
+    server.server_close()
+
+
+def test_concurrent_fetch_matches_sequential_order(espn_stand_in):
+    from app import _fetch_espn_scoreboards
+
+    base_url = f'{espn_stand_in}/ger.1/scoreboard'
+    dates = [f'202508{d:02d}' for d in range(1, 32)]
+
+    start = time.perf_counter()
+    sequential = _fetch_espn_scoreboards(base_url, dates, {}, concurrency=1)
+    sequential_s = time.perf_counter() - start
+    start = time.perf_counter()
+    concurrent = _fetch_espn_scoreboards(base_url, dates, {}, concurrency=8)
+    concurrent_s = time.perf_counter() - start
+
+    assert concurrent == sequential
+    assert [d for d, _ in concurrent] == dates
+    assert sum(len(data['events']) for _, data in concurrent) == 18
+    assert concurrent_s < sequential_s
+
+
+def test_fetch_spacing_and_failed_dates(espn_stand_in):
+    import provider_client
+    from app import _fetch_espn_scoreboards
+
+    provider_client.configure(retries=0)
+    try:
+        start = time.perf_counter()
+        results = _fetch_espn_scoreboards('http://127.0.0.1:9/nothing', ['20250822', '20250823'], {},
+                                          concurrency=2, delay_seconds=0.05)
+    finally:
+        provider_client.configure(retries=app.config['PROVIDER_HTTP_RETRIES'])
+    assert results == [('20250822', None), ('20250823', None)]
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_sync_fixtures_espn_against_stand_in(client, espn_stand_in):
+    from app import _sync_fixtures_espn
+
+    app.config['ESPN_FETCH_CONCURRENCY'] = 8
+    with app.app_context():
+        added, updated, seen, error = _sync_fixtures_espn('ger.1')
+        db.session.commit()
+        assert error is None
+        assert (added, updated, seen) == (18, 0, 18)
+        rounds = {}
+        for f in Fixture.query.filter_by(competition_slug='ger.1').all():
+            rounds.setdefault(f.fixture_round, []).append(f)
+        assert sorted(rounds) == [1, 2]
+        assert all(len(fs) == 9 for fs in rounds.values())
+        assert {f.fixture_home_team for f in rounds[1]} >= {'Bayern Munich', 'RB Leipzig'}
+
+
+def test_unchanged_scoreboards_skip_the_second_sync(client, espn_stand_in):
+    from app import _mark_provider_feeds_processed, _sync_fixtures_espn
+
+    with app.app_context():
+        assert _sync_fixtures_espn('ger.1')[:3] == (18, 0, 18)
+        db.session.commit()
+        _mark_provider_feeds_processed()
+        assert _sync_fixtures_espn('ger.1') == (0, 0, 0, None)
+        # Scores-only syncs keep their own marker, so the first one still applies the feed.
+        assert _sync_fixtures_espn('ger.1', scores_only=True)[:3] == (0, 18, 18)
+
+
+def test_live_mode_requests_only_live_window_dates(client, espn_stand_in):
+    from app import _sync_scores_live
+
+    # ger.1 is football-data.org in SUPPORTED_COMPETITIONS; the stand-in serves its ESPN scoreboards
+    comp = {'slug': 'ger.1', 'name': 'Bundesliga', 'source': 'espn', 'espn_slug': 'ger.1'}
+    with app.app_context():
+        db.session.add_all([
+            # In the window (kicked off an hour ago)
+            Fixture(competition_slug='ger.1', external_id='740010', fixture_round=2, fixture_date=datetime(2025, 8, 29, 18, 30),
+                    fixture_home_team='Borussia Dortmund', fixture_away_team='RB Leipzig', is_completed=False),
+            # Started yesterday, still not completed
+            Fixture(competition_slug='ger.1', external_id='739999', fixture_round=1, fixture_date=datetime(2025, 8, 28, 12, 0),
+                    fixture_home_team='Hamburg SV', fixture_away_team='FC St. Pauli', is_completed=False),
+            # Completed last week, and one next week: both outside the poll
+            Fixture(competition_slug='ger.1', external_id='740002', fixture_round=1, fixture_date=datetime(2025, 8, 23, 13, 30),
+                    fixture_home_team='RB Leipzig', fixture_away_team='Bayer Leverkusen', is_completed=True),
+            Fixture(competition_slug='ger.1', external_id='740019', fixture_round=3, fixture_date=datetime(2025, 9, 5, 18, 30),
+                    fixture_home_team='Bayern Munich', fixture_away_team='FC Augsburg', is_completed=False),
+        ])
+        db.session.commit()
+
+        added, updated, seen, error = _sync_scores_live(comp, now=datetime(2025, 8, 29, 19, 30, tzinfo=timezone.utc))
+        db.session.commit()
+
+        assert error is None
+        assert sorted(_ScoreboardHandler.requested_dates) == ['20250828', '20250829']
+        assert (added, updated, seen) == (0, 1, 1)
+        live = Fixture.query.filter_by(external_id='740010').one()
+        assert live.is_completed is True and live.actual_home_score is not None
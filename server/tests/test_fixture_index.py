@@ -0,0 +1,82 @@
+"""FixtureIndex must resolve games exactly like the linear _fixture_for_game scan."""
+from datetime import datetime
+from itertools import product
+from types import SimpleNamespace
+
+from team_matching import FixtureIndex, _fixture_matches_game
+
+NAMES = [
+    'Manchester United', 'Man Utd', 'man united', 'Manchester United FC',
+    'Brighton & Hove Albion', 'Brighton and Hove Albion', 'Brighton',
+    'FC Bayern München', 'Bayern Munich', 'Tottenham Hotspur', 'Spurs', ' Chelsea ', 'Chelsea FC',
+    'Curaçao', 'Curacao', 'Wolves', '',
+]
+
+
+def _fixtures():
+    pairs = [
+        ('Manchester United FC', 'Chelsea FC', 'eng.1'),
+        ('Man Utd', 'Chelsea', None),
+        ('FC Bayern München', 'Brighton & Hove Albion', 'ger.1'),
+        ('Bayern Munich', 'Brighton', 'eng.1'),
+        ('Tottenham Hotspur', 'Wolves', ''),
+        ('Spurs', 'Wolverhampton Wanderers', 'eng.2'),
+        ('Curacao', 'Chelsea', 'fifa.world'),
+        ('Curaçao', ' Chelsea ', 'fifa.world'),
+        ('Chelsea', None, 'eng.1'),
+    ]
+    return [
+        SimpleNamespace(id=i + 1, fixture_home_team=h, fixture_away_team=a, competition_slug=c,
+                        fixture_date=datetime(2026, 8, 16 + i % 3, 15, 0))
+        for i, (h, a, c) in enumerate(pairs)
+    ]
+
+
+def _scan(fixtures, home, away, competition_slug):
+    for f in fixtures:
+        if _fixture_matches_game(f, home, away):
+            if not competition_slug:
+                return f
+            comp = f.competition_slug
+            if competition_slug == 'eng.1' and comp in ('eng.1', None, ''):
+                return f
+            if competition_slug != 'eng.1' and comp == competition_slug:
+                return f
+    for f in fixtures:
+        if _fixture_matches_game(f, home, away):
+            return f
+    return None
+
+
+def test_index_candidates_equal_fixture_matches_game():
+    fixtures = _fixtures()
+    index = FixtureIndex(fixtures)
+    for home, away in product(NAMES, repeat=2):
+        expected = [f for f in fixtures if _fixture_matches_game(f, home, away)]
+        assert index.candidates(home, away) == expected, (home, away)
+
+
+def test_index_find_keeps_competition_precedence():
+    fixtures = _fixtures()
+    index = FixtureIndex(fixtures)
+    for (home, away), comp in product(product(NAMES, repeat=2), (None, 'eng.1', 'ger.1', 'eng.2', 'fifa.world')):
+        assert index.find(home, away, comp) is _scan(fixtures, home, away, comp), (home, away, comp)
+
+
+def test_fixture_for_game_uses_index(client):
+    from app import _fixture_for_game
+
+    fixtures = _fixtures()
+    index = FixtureIndex(fixtures)
+    game = SimpleNamespace(home_team='Man United', away_team='Chelsea', fixture_id=None)
+    assert _fixture_for_game(game, 'eng.1', fixture_index=index) is _fixture_for_game(game, 'eng.1', fixtures_list=fixtures)
+    assert _fixture_for_game(SimpleNamespace(home_team='x', away_team='y', fixture_id=3), fixture_index=index) is fixtures[2]
+
+
+def test_index_secondary_buckets():
+    fixtures = _fixtures()
+    index = FixtureIndex(fixtures)
+    assert index.get(4) is fixtures[3]
+    assert [f.id for f in index.for_competition('eng.1')] == [1, 4, 9, 2, 5]
+    assert [f.id for f in index.for_competition('fifa.world')] == [7, 8]
+    assert [f.id for f in index.on_date(datetime(2026, 8, 17).date())] == [2, 5, 8]
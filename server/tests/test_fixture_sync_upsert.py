@@ -0,0 +1,78 @@
+"""Fixture sync upsert: one indexed load per competition, same matching rules as the per-row queries."""
+from datetime import datetime, timezone
+
+from config import app, db
+from models import Fixture
+
+
+def _item(external_id, home, away, round_, kickoff, home_score=None, away_score=None, completed=False):
+    return {
+        'external_id': external_id,
+        'home_team': home,
+        'away_team': away,
+        'fixture_round': round_,
+        'fixture_date': kickoff,
+        'home_score': home_score,
+        'away_score': away_score,
+        'is_completed': completed,
+    }
+
+
+def test_upsert_matches_by_id_names_and_legacy_slug(client, sql_log):
+    from app import _upsert_synced_fixtures
+
+    kickoff = datetime(2026, 8, 22, 14, 0, tzinfo=timezone.utc)
+    with app.app_context():
+        by_id = Fixture(competition_slug='eng.1', external_id='100', fixture_round=1, fixture_date=datetime(2026, 8, 15, 14, 0),
+                        fixture_home_team='Arsenal FC', fixture_away_team='Chelsea FC')
+        by_name = Fixture(competition_slug='eng.1', fixture_round=2, fixture_date=datetime(2026, 8, 22, 14, 0),
+                          fixture_home_team='Liverpool', fixture_away_team='Everton')
+        legacy = Fixture(competition_slug=None, fixture_round=2, fixture_date=datetime(2026, 8, 22, 14, 0),
+                         fixture_home_team='Brentford', fixture_away_team='Fulham')
+        untouched = Fixture(competition_slug='eng.1', external_id='103', fixture_round=2, fixture_date=datetime(2026, 8, 23, 14, 0),
+                            fixture_home_team='Leeds United', fixture_away_team='Burnley')
+        db.session.add_all([by_id, by_name, legacy, untouched])
+        db.session.commit()
+        ids = (by_id.id, by_name.id, legacy.id, untouched.id)
+
+        items = [
+            _item('100', 'Arsenal FC', 'Chelsea FC', 1, datetime(2026, 8, 15, 14, 0, tzinfo=timezone.utc), 2, 1, True),
+            _item('101', 'Liverpool FC', 'Everton FC', 2, kickoff),
+            _item('102', 'Brentford FC', 'Fulham FC', 2, kickoff),
+            _item('103', 'Leeds United', 'Burnley', 2, datetime(2026, 8, 23, 14, 0, tzinfo=timezone.utc)),
+            _item('104', 'Wolves', 'Spurs', 2, kickoff),
+        ]
+        with sql_log() as statements:
+            added, matched, changes = _upsert_synced_fixtures('eng.1', items, exact_match='round', include_legacy=True)
+        db.session.commit()
+
+        assert (added, matched) == (1, 4)
+        # One load of the competition's fixtures (renames also look up predictions in games)
+        fixture_selects = [s for s in statements if s.lstrip().upper().startswith('SELECT') and 'FROM fixtures' in s]
+        assert len(fixture_selects) == 1
+        assert sorted(changes['updated']) == sorted(ids[:3])
+        assert changes['unchanged'] == [ids[3]]
+        assert len(changes['added']) == 1
+        assert db.session.info['fixture_changes']['added'] == set(changes['added'])
+
+        assert db.session.get(Fixture, ids[0]).actual_home_score == 2
+        assert db.session.get(Fixture, ids[1]).external_id == '101'
+        assert db.session.get(Fixture, ids[2]).competition_slug == 'eng.1'
+        assert Fixture.query.filter_by(external_id='104').one().fixture_home_team == 'Wolves'
+
+
+def test_duplicate_items_in_one_sync_update_the_new_row(client):
+    from app import _upsert_synced_fixtures
+
+    kickoff = datetime(2026, 6, 12, 19, 0, tzinfo=timezone.utc)
+    with app.app_context():
+        items = [
+            _item('9', 'Mexico', 'South Korea', 1, kickoff),
+            _item('', 'mexico', 'south korea', 1, kickoff, 1, 0, True),
+        ]
+        added, matched, changes = _upsert_synced_fixtures('fifa.world', items, exact_match='date')
+        db.session.commit()
+        assert (added, matched) == (1, 1)
+        assert changes['updated'] == []
+        fixture = Fixture.query.filter_by(competition_slug='fifa.world').one()
+        assert (fixture.fixture_home_team, fixture.actual_home_score, fixture.is_completed) == ('mexico', 1, True)
@@ -0,0 +1,54 @@
+"""Game.fixture_id: linked predictions resolve by key; legacy rows are linked once by team names."""
+from datetime import datetime
+from types import SimpleNamespace
+
+from config import app, db
+from models import Fixture, Game
+
+
+def test_game_for_fixture_prefers_link_over_team_names():
+    from app import _game_for_fixture
+
+    this_season = SimpleNamespace(id=2, fixture_home_team='Arsenal', fixture_away_team='Chelsea',
+                                  fixture_date=datetime(2026, 8, 16, 15, 0))
+    linked_old = SimpleNamespace(fixture_id=1, home_team='Arsenal', away_team='Chelsea',
+                                 game_week=datetime(2026, 8, 16, 15, 0))
+    linked_new = SimpleNamespace(fixture_id=2, home_team='Arsenal', away_team='Chelsea',
+                                 game_week=datetime(2026, 8, 16, 15, 0))
+    unlinked = SimpleNamespace(fixture_id=None, home_team='Arsenal', away_team='Chelsea',
+                               game_week=datetime(2026, 8, 16, 15, 0))
+
+    # A game linked to another fixture never matches by name
+    assert _game_for_fixture(this_season, [linked_old]) is None
+    assert _game_for_fixture(this_season, [linked_old, unlinked]) is unlinked
+    assert _game_for_fixture(this_season, [unlinked, linked_new]) is linked_new
+
+
+def test_link_game_fixtures_uses_closest_kickoff(client, member_setup):
+    from app import _fixture_for_game, _link_game_fixtures
+
+    user_id = member_setup['user_id']
+    with app.app_context():
+        last_season = Fixture(fixture_home_team='Arsenal', fixture_away_team='Chelsea', competition_slug='eng.1',
+                              fixture_round=3, fixture_date=datetime(2025, 8, 30, 15, 0))
+        this_season = Fixture(fixture_home_team='Arsenal', fixture_away_team='Chelsea', competition_slug='eng.1',
+                              fixture_round=2, fixture_date=datetime(2026, 8, 22, 15, 0))
+        db.session.add_all([last_season, this_season])
+        db.session.add_all([
+            Game(user_id=user_id, home_team='Arsenal', away_team='Chelsea', game_week=datetime(2025, 8, 30, 15, 0)),
+            Game(user_id=user_id, home_team='arsenal', away_team='Chelsea FC', game_week=datetime(2026, 8, 22, 15, 0)),
+            Game(user_id=user_id, home_team='Arsenal', away_team='Chelsea', game_week=None),
+            Game(user_id=user_id, home_team='Arsenal', away_team='Liverpool', game_week=datetime(2026, 8, 22, 15, 0)),
+        ])
+        db.session.commit()
+
+        assert _link_game_fixtures(dry_run=True) == (2, 1, 1)
+        assert Game.query.filter(Game.fixture_id.isnot(None)).count() == 0
+
+        assert _link_game_fixtures() == (2, 1, 1)
+        old_game, new_game, undated, other = Game.query.order_by(Game.id).all()
+        assert old_game.fixture_id == last_season.id
+        assert new_game.fixture_id == this_season.id
+        assert undated.fixture_id is None
+        assert other.fixture_id is None
+        assert _fixture_for_game(new_game, 'eng.1', fixtures_list=[last_season, this_season]) is this_season
@@ -0,0 +1,77 @@
+"""game_result is written when scores change; GET /api/v1/predictions only reads it."""
+from datetime import datetime
+
+from config import db
+from models import Fixture, Game
+
+
+def test_score_change_writes_results_and_get_is_read_only(client, member_setup, sql_log):
+    import app as flask_app
+
+    fixture = Fixture(competition_slug='ger.1', fixture_round=3, fixture_date=datetime(2026, 9, 5, 13, 30),
+                      fixture_home_team='Bayern Munich', fixture_away_team='Borussia Dortmund')
+    db.session.add(fixture)
+    db.session.flush()
+    game = Game(user_id=member_setup['user_id'], home_team='Bayern Munich', away_team='Borussia Dortmund',
+                home_team_score=2, away_team_score=0, fixture_id=fixture.id, game_week=fixture.fixture_date)
+    db.session.add(game)
+    db.session.commit()
+    game_id = game.id
+
+    flask_app._set_fixture_result(fixture, 3, 1, True)
+    db.session.commit()
+    flask_app._refresh_dirty_standings()
+    assert db.session.get(Game, game_id).game_result == 'Draw'
+
+    with sql_log() as statements:
+        response = client.get('/api/v1/predictions', headers=member_setup['headers'])
+    assert response.status_code == 200
+    assert [p['game_result'] for p in response.get_json()['predictions']] == ['Draw']
+    assert [s for s in statements if s.lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))] == []
+
+
+def test_reconcile_reports_and_fixes_drift(client, member_setup):
+    import app as flask_app
+
+    fixture = Fixture(competition_slug='ger.1', fixture_round=3, fixture_date=datetime(2026, 9, 5, 13, 30),
+                      fixture_home_team='RB Leipzig', fixture_away_team='SC Freiburg',
+                      actual_home_score=1, actual_away_score=0, is_completed=True)
+    db.session.add(fixture)
+    db.session.flush()
+    db.session.add_all([
+        Game(user_id=member_setup['user_id'], home_team='RB Leipzig', away_team='SC Freiburg', home_team_score=1,
+             away_team_score=0, fixture_id=fixture.id, game_result='Win'),
+        # Legacy unlinked pick with a stale result
+        Game(user_id=member_setup['user_id'], home_team='RB Leipzig FC', away_team='SC Freiburg', home_team_score=0,
+             away_team_score=0, game_result='Win'),
+    ])
+    db.session.commit()
+
+    report = flask_app._reconcile_game_results()
+    assert (report['checked'], report['drift']) == (2, 1)
+    assert report['samples'][0]['expected'] == 'Loss'
+
+    flask_app._reconcile_game_results(fix=True)
+    assert flask_app._reconcile_game_results()['drift'] == 0
+
+
+def test_rescore_writes_results_of_unlinked_picks_on_the_fixture(client, member_setup):
+    import app as flask_app
+
+    fixture = Fixture(competition_slug='ger.1', fixture_round=4, fixture_date=datetime(2026, 9, 12, 13, 30),
+                      fixture_home_team='VfB Stuttgart', fixture_away_team='SC Freiburg')
+    db.session.add(fixture)
+    db.session.flush()
+    dated = Game(user_id=member_setup['user_id'], home_team='VfB Stuttgart', away_team='SC Freiburg',
+                 home_team_score=2, away_team_score=1, game_week=datetime(2026, 9, 12, 13, 30))
+    last_season = Game(user_id=member_setup['user_id'], home_team='VfB Stuttgart', away_team='SC Freiburg',
+                       home_team_score=0, away_team_score=0, game_week=datetime(2025, 9, 13, 13, 30))
+    db.session.add_all([dated, last_season])
+    db.session.commit()
+    dated_id, last_season_id = dated.id, last_season.id
+
+    flask_app._set_fixture_result(fixture, 1, 0, True)
+    db.session.commit()
+    flask_app._refresh_dirty_standings()
+    assert db.session.get(Game, dated_id).game_result == 'Draw'  # right winner, wrong score
+    assert db.session.get(Game, last_season_id).game_result is None  # outside the alignment window
@@ -57,3 +57,69 @@ def test_get_league_matches_list_entry_shape(client, member_setup):
         'members',
     ):
         assert single[key] == from_list[key], key
+
+
+def test_league_list_query_count_and_member_modes(client, member_setup, sql_log):
+    """The list is built from one league query plus selectin loads, however many leagues and members there are."""
+    from config import app, db
+    from models import League, LeagueMembership, User
+
+    with app.app_context():
+        for n in range(3):
+            league = League(name=f'Extra {n}', invite_code=f'EXTRA{n}', created_by=member_setup['user_id'],
+                            competition_slug='ger.1')
+            db.session.add(league)
+            db.session.flush()
+            db.session.add(LeagueMembership(user_id=member_setup['user_id'], league_id=league.id,
+                                            display_name='smoke_player', role='player'))
+            for m in range(4):
+                user = User(email=f'extra{n}_{m}@smoke.test')
+                user.password_hash = 'password'
+                db.session.add(user)
+                db.session.flush()
+                db.session.add(LeagueMembership(user_id=user.id, league_id=league.id, display_name=f'p{m}'))
+        db.session.commit()
+
+    with sql_log() as statements:
+        full = client.get('/api/v1/leagues', headers=member_setup['headers']).get_json()['leagues']
+    assert len(statements) <= 4  # caller, leagues, memberships, users
+    assert [(l['member_count'], l['is_admin']) for l in full] == [(1, True), (5, False), (5, False), (5, False)]
+    assert all('email' in m for m in full[1]['members'])
+
+    summary = client.get('/api/v1/leagues?members=summary', headers=member_setup['headers']).get_json()['leagues']
+    assert sorted(m['display_name'] for m in summary[1]['members']) == ['p0', 'p1', 'p2', 'p3', 'smoke_player']
+    assert all('email' not in m for m in summary[1]['members'])
+
+    bare = client.get('/api/v1/leagues?members=none', headers=member_setup['headers']).get_json()['leagues']
+    assert [(l['member_count'], 'members' in l) for l in bare] == [(1, False), (5, False), (5, False), (5, False)]
+
+
+def test_open_leagues_counts_membership_and_keyset_pages(client, member_setup, outsider_setup):
+    from config import app, db
+    from models import League, LeagueMembership
+
+    with app.app_context():
+        for name in ('Alpha Open', 'Beta Open', 'Beta Open', 'Gamma Open'):
+            db.session.add(League(name=name, invite_code=f'OPEN{db.session.query(League).count()}',
+                                  created_by=member_setup['user_id'], is_open=True))
+            db.session.flush()
+        beta = League.query.filter_by(name='Beta Open').order_by(League.id).first()
+        db.session.add_all([
+            LeagueMembership(user_id=member_setup['user_id'], league_id=beta.id, display_name='smoke_player'),
+            LeagueMembership(user_id=outsider_setup['user_id'], league_id=beta.id, display_name='outsider'),
+        ])
+        db.session.commit()
+        beta_id = beta.id
+
+    url = '/api/v1/leagues/open'
+    headers = member_setup['headers']
+    first = client.get(f'{url}?limit=2', headers=headers).get_json()
+    assert [(l['name'], l['member_count'], l['is_member']) for l in first['leagues']] == [
+        ('Alpha Open', 0, False), ('Beta Open', 2, True)]
+    assert first['leagues'][1]['id'] == beta_id and first['next_cursor']
+    second = client.get(f"{url}?limit=2&cursor={first['next_cursor']}", headers=headers).get_json()
+    assert [l['name'] for l in second['leagues']] == ['Beta Open', 'Gamma Open'] and second['next_cursor'] is None
+
+    search = client.get(f'{url}?q=beta', headers=headers).get_json()['leagues']
+    assert [l['name'] for l in search] == ['Beta Open', 'Beta Open']
+    assert client.get(f'{url}?cursor=nonsense', headers=headers).status_code == 400
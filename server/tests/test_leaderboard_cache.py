@@ -0,0 +1,91 @@
+"""Leaderboard cache: strong ETags, 304s, and invalidation only by changes that touch the league."""
+from datetime import datetime, timedelta, timezone
+
+from config import db
+from models import Fixture, Game, League, LeagueMembership, User
+
+
+def _version(league_id):
+    db.session.expire_all()
+    return db.session.get(League, league_id).leaderboard_version
+
+
+def test_etag_304_and_precise_invalidation(client, member_setup, sql_log):
+    league_id = member_setup['league_id']
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=3)
+    fixture = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Bayern Munich',
+                      fixture_away_team='Borussia Dortmund', actual_home_score=1, actual_away_score=0)
+    elsewhere = Fixture(competition_slug='esp.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Real Madrid',
+                        fixture_away_team='Barcelona')
+    other_league = League(name='La Liga League', invite_code='LALIGA', created_by=member_setup['user_id'],
+                          competition_slug='esp.1')
+    # Scoring starts before kickoff even when "3 hours ago" falls on the previous (UTC) day
+    db.session.get(League, league_id).season_started_at = kickoff - timedelta(days=1)
+    db.session.add_all([fixture, elsewhere, other_league])
+    db.session.commit()
+    fixture_id, elsewhere_id, other_league_id = fixture.id, elsewhere.id, other_league.id
+
+    url = f'/api/v1/leagues/{league_id}/leaderboard'
+    first = client.get(url, headers=member_setup['headers'])
+    assert first.status_code == 200 and first.headers['ETag']
+
+    with sql_log() as statements:
+        again = client.get(url, headers={**member_setup['headers'], 'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304 and again.headers['ETag'] == first.headers['ETag']
+    assert not any('FROM games' in s for s in statements)  # served from the cache
+
+    before = _version(league_id)
+    # Changes in another competition or league leave this league's entries alone
+    db.session.get(Fixture, elsewhere_id).actual_home_score = 2
+    outsider = User(email='outsider@smoke.test')
+    outsider.password_hash = 'password'
+    db.session.add(outsider)
+    db.session.flush()
+    db.session.add(LeagueMembership(user_id=outsider.id, league_id=other_league_id, display_name='outsider'))
+    db.session.commit()
+    assert _version(league_id) == before
+
+    # A member's prediction does invalidate it
+    db.session.add(Game(user_id=member_setup['user_id'], fixture_id=fixture_id, home_team_score=1, away_team_score=0,
+                        home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff))
+    db.session.commit()
+    assert _version(league_id) == before + 1
+
+    # So does a score change in the league's competition
+    db.session.get(Fixture, fixture_id).actual_home_score = 2
+    db.session.commit()
+    assert _version(league_id) == before + 2
+
+    fresh = client.get(url, headers={**member_setup['headers'], 'If-None-Match': first.headers['ETag']})
+    assert fresh.status_code == 200 and fresh.headers['ETag'] != first.headers['ETag']
+    assert fresh.get_json()['leaderboard'][0]['draws'] == 1
+
+
+def test_versions_bumped_once_at_commit_not_per_flush(client, member_setup, sql_log):
+    league_id = member_setup['league_id']
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=3)
+    fixture = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Bayern Munich',
+                      fixture_away_team='Borussia Dortmund')
+    db.session.add(fixture)
+    db.session.commit()
+    before = _version(league_id)
+
+    def _version_bumps(statements):
+        return [s for s in statements if s.lstrip().upper().startswith('UPDATE LEAGUES')]
+
+    with sql_log() as statements:
+        db.session.add(Game(user_id=member_setup['user_id'], fixture_id=fixture.id, home_team_score=1, away_team_score=0,
+                            home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff))
+        db.session.flush()
+        fixture.actual_home_score, fixture.actual_away_score = 1, 0
+        db.session.flush()
+        assert _version_bumps(statements) == []  # no league row locked while the transaction is still open
+        fixture.is_completed = True  # left for commit's own flush
+        db.session.commit()
+    assert len(_version_bumps(statements)) == 1
+    assert _version(league_id) == before + 1
+
+    db.session.get(Fixture, fixture.id).actual_home_score = 2
+    db.session.rollback()
+    db.session.commit()
+    assert _version(league_id) == before + 1  # a rolled-back change bumps nothing
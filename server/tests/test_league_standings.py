@@ -0,0 +1,128 @@
+"""league_standings: full-season leaderboard is materialized and kept current on score changes."""
+from datetime import datetime, timedelta, timezone
+
+from config import app, db
+from models import Fixture, Game, League, LeagueMembership, LeagueStanding, User
+
+
+def _setup_full_season_fixture(league_id, user_id, pick=(2, 1), actual=(2, 1)):
+    """Make the smoke league full-season and add one finished fixture with the member's pick."""
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=3)
+    league = db.session.get(League, league_id)
+    league.leaderboard_scope = 'full_season'
+    league.season_started_at = kickoff - timedelta(days=2)
+    fixture = Fixture(
+        competition_slug='ger.1',
+        fixture_round=1,
+        fixture_date=kickoff,
+        fixture_home_team='Bayern Munich',
+        fixture_away_team='Borussia Dortmund',
+        actual_home_score=actual[0],
+        actual_away_score=actual[1],
+        is_completed=True,
+    )
+    db.session.add(fixture)
+    db.session.add(Game(
+        user_id=user_id,
+        home_team='Bayern Munich',
+        away_team='Borussia Dortmund',
+        home_team_score=pick[0],
+        away_team_score=pick[1],
+        game_week=kickoff,
+    ))
+    db.session.commit()
+    return fixture.id
+
+
+def test_leaderboard_reads_and_stores_standings(client, member_setup):
+    from app import _refresh_stale_standings
+
+    league_id = member_setup['league_id']
+    with app.app_context():
+        _setup_full_season_fixture(league_id, member_setup['user_id'])
+
+    resp = client.get(f'/api/v1/leagues/{league_id}/leaderboard', headers=member_setup['headers'])
+    assert resp.status_code == 200
+    row = resp.get_json()['leaderboard'][0]
+    assert (row['wins'], row['draws'], row['losses'], row['points']) == (1, 0, 0, 3)
+    assert LeagueStanding.query.filter_by(league_id=league_id).count() == 0  # the GET only reads
+
+    with app.app_context():
+        assert _refresh_stale_standings() == 1
+        assert _refresh_stale_standings() == 0  # stored and current
+        stored = LeagueStanding.query.filter_by(league_id=league_id, user_id=member_setup['user_id']).all()
+        assert len(stored) == 1
+        assert stored[0].points == 3
+
+    resp = client.get(f'/api/v1/leagues/{league_id}/leaderboard', headers=member_setup['headers'])
+    assert resp.get_json()['leaderboard'][0] == row
+
+    live = client.get(f'/api/v1/leagues/{league_id}/leaderboard?debug=1', headers=member_setup['headers'])
+    live_row = live.get_json()['leaderboard'][0]
+    assert {k: live_row[k] for k in row} == row
+
+
+def test_score_change_refreshes_standings(client, member_setup):
+    from app import _refresh_dirty_standings, _set_fixture_result
+
+    league_id = member_setup['league_id']
+    with app.app_context():
+        fixture_id = _setup_full_season_fixture(league_id, member_setup['user_id'])
+    client.get(f'/api/v1/leagues/{league_id}/leaderboard', headers=member_setup['headers'])
+
+    with app.app_context():
+        fixture = db.session.get(Fixture, fixture_id)
+        assert _set_fixture_result(fixture, 3, 1, True) is True
+        db.session.commit()
+        assert _refresh_dirty_standings() == 1
+        stored = LeagueStanding.query.filter_by(league_id=league_id, user_id=member_setup['user_id']).one()
+        assert (stored.wins, stored.draws, stored.points) == (0, 1, 1)
+        # Unchanged scores do not mark anything dirty
+        assert _set_fixture_result(fixture, 3, 1, True) is False
+        assert _refresh_dirty_standings() == 0
+
+    resp = client.get(f'/api/v1/leagues/{league_id}/leaderboard', headers=member_setup['headers'])
+    assert resp.get_json()['leaderboard'][0]['points'] == 1
+
+
+def test_rebuild_league_standings_reports_and_fixes_drift(client, member_setup):
+    from app import _rebuild_league_standings
+
+    league_id = member_setup['league_id']
+    with app.app_context():
+        _setup_full_season_fixture(league_id, member_setup['user_id'], pick=(0, 2))
+        checked, mismatches = _rebuild_league_standings(league_id=league_id)
+        assert checked == 1
+        assert len(mismatches) == 1  # no rows stored yet
+        assert _rebuild_league_standings(league_id=league_id, check_only=True)[1] == []
+
+        stored = LeagueStanding.query.filter_by(league_id=league_id).one()
+        assert (stored.losses, stored.points) == (1, 0)
+        stored.points = 99
+        db.session.commit()
+        drift = _rebuild_league_standings(league_id=league_id, check_only=True)[1]
+        assert [m['user_id'] for m in drift] == [member_setup['user_id']]
+        assert LeagueStanding.query.filter_by(league_id=league_id).one().points == 99
+
+        _rebuild_league_standings(league_id=league_id)
+        assert LeagueStanding.query.filter_by(league_id=league_id).one().points == 0
+
+
+def test_member_without_a_row_is_computed_without_writing(client, member_setup):
+    from app import _refresh_stale_standings
+
+    league_id = member_setup['league_id']
+    _setup_full_season_fixture(league_id, member_setup['user_id'])
+    _refresh_stale_standings()
+    newcomer = User(email='newcomer@smoke.test')
+    newcomer.password_hash = 'password'
+    db.session.add(newcomer)
+    db.session.flush()
+    db.session.add(LeagueMembership(league_id=league_id, user_id=newcomer.id, display_name='Newcomer'))
+    db.session.commit()
+
+    resp = client.get(f'/api/v1/leagues/{league_id}/leaderboard', headers=member_setup['headers'])
+    assert resp.status_code == 200
+    assert [(r['user_id'], r['points']) for r in resp.get_json()['leaderboard']] == [
+        (member_setup['user_id'], 3), (newcomer.id, 0)]
+    assert LeagueStanding.query.filter_by(league_id=league_id).count() == 1
@@ -0,0 +1,70 @@
+"""Missing-prediction reminders: planned with a fixed number of queries, matched in memory."""
+from datetime import datetime, timedelta, timezone
+
+from config import app, db
+from models import EmailOutbox, Fixture, Game, League, LeagueMembership, User
+
+
+def _member(league, email, display_name, notify=True):
+    user = User(email=email)
+    user.password_hash = 'password'
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(LeagueMembership(user_id=user.id, league_id=league.id, display_name=display_name,
+                                    notify_missing_predictions=notify))
+    return user
+
+
+def test_reminders_skip_members_with_linked_or_name_matched_picks(client, monkeypatch, sql_log):
+    import app as flask_app
+
+    now = datetime(2026, 3, 6, 12, 0, tzinfo=timezone.utc)
+    kickoff = datetime(2026, 3, 7, 10, 0)  # 22h after now: inside the 24h window
+    with app.app_context():
+        owner = User(email='owner@smoke.test')
+        owner.password_hash = 'password'
+        db.session.add(owner)
+        db.session.flush()
+        league = League(name='Reminder League', invite_code='REMIND', created_by=owner.id, competition_slug='ger.1')
+        db.session.add(league)
+        db.session.flush()
+        bayern = Fixture(competition_slug='ger.1', fixture_round=25, fixture_date=kickoff,
+                         fixture_home_team='Bayern Munich', fixture_away_team='Borussia Dortmund', is_completed=False)
+        later = Fixture(competition_slug='ger.1', fixture_round=25, fixture_date=kickoff + timedelta(days=3),
+                        fixture_home_team='RB Leipzig', fixture_away_team='SC Freiburg', is_completed=False)
+        db.session.add_all([bayern, later])
+        db.session.flush()
+
+        linked = _member(league, 'linked@smoke.test', 'linked')
+        by_name = _member(league, 'byname@smoke.test', 'byname')
+        missing = _member(league, 'missing@smoke.test', 'missing')
+        _member(league, 'optout@smoke.test', 'optout', notify=False)
+        db.session.add_all([
+            Game(user_id=linked.id, home_team='Bayern Munich', away_team='Borussia Dortmund', fixture_id=bayern.id),
+            Game(user_id=by_name.id, home_team='FC Bayern Munich', away_team='Borussia Dortmund FC'),
+            # A pick for a fixture outside the 24h window does not count
+            Game(user_id=missing.id, home_team='RB Leipzig', away_team='SC Freiburg', fixture_id=later.id),
+        ])
+        db.session.commit()
+
+        with sql_log() as statements:
+            due, stats = flask_app._missing_prediction_reminders(now_utc=now)
+        selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+
+        assert [(lm.user_id, round_) for lm, _league, round_ in due] == [(missing.id, 25)]
+        assert (stats['fixtures'], stats['members_checked'], stats['members_missing']) == (1, 3, 1)
+        assert len(selects) == 4  # fixtures, leagues, memberships + users, games
+
+        # Window boundary: a kickoff exactly 24h ahead is due, one a minute further out is not
+        at_edge = (kickoff - timedelta(hours=24)).replace(tzinfo=timezone.utc)
+        assert flask_app._missing_prediction_reminders(now_utc=at_edge)[1]['fixtures'] == 1
+        outside, outside_stats = flask_app._missing_prediction_reminders(now_utc=at_edge - timedelta(minutes=1))
+        assert outside == [] and outside_stats['fixtures'] == 0
+
+        monkeypatch.setattr(flask_app, '_missing_prediction_reminders', lambda: (due, stats))
+        monkeypatch.setitem(app.config, 'MAIL_SERVER', 'smtp.smoke.test')
+        sent, err, stats = flask_app._send_missing_predictions_notifications()
+        assert (sent, err, stats['sent']) == (1, None, 1)
+        queued = EmailOutbox.query.all()
+        assert [(m.to_email, m.kind, m.status) for m in queued] == [('missing@smoke.test', 'missing_predictions', 'pending')]
+        assert LeagueMembership.query.filter_by(user_id=missing.id).one().last_missing_predictions_round == 25
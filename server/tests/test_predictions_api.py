@@ -0,0 +1,64 @@
+"""GET /api/v1/predictions: round/season scoped, cursor-paginated, fixtures from one join."""
+from datetime import datetime
+
+import app as flask_app
+from config import db
+from models import Fixture, Game
+
+
+def _seed(user_id):
+    last_season = Fixture(competition_slug='ger.1', fixture_round=5, fixture_date=datetime(2025, 9, 20, 13, 30),
+                          fixture_home_team='Bayern Munich', fixture_away_team='Borussia Dortmund',
+                          actual_home_score=2, actual_away_score=1, is_completed=True)
+    round_5 = [
+        Fixture(competition_slug='ger.1', fixture_round=5, fixture_date=datetime(2026, 9, 19, 13, 30),
+                fixture_home_team=home, fixture_away_team=away, actual_home_score=1, actual_away_score=1, is_completed=True)
+        for home, away in (('RB Leipzig', 'SC Freiburg'), ('VfB Stuttgart', 'Werder Bremen'), ('Mainz 05', 'FC Augsburg'))
+    ]
+    round_6 = Fixture(competition_slug='ger.1', fixture_round=6, fixture_date=datetime(2026, 9, 26, 13, 30),
+                      fixture_home_team='Bayern Munich', fixture_away_team='Borussia Dortmund')
+    other_comp = Fixture(competition_slug='esp.1', fixture_round=5, fixture_date=datetime(2026, 9, 19, 19, 0),
+                         fixture_home_team='Real Madrid', fixture_away_team='Barcelona')
+    db.session.add_all([last_season, *round_5, round_6, other_comp])
+    db.session.flush()
+    games = [Game(user_id=user_id, home_team=f.fixture_home_team, away_team=f.fixture_away_team, home_team_score=1,
+                  away_team_score=1, fixture_id=f.id, game_week=f.fixture_date, game_week_name=f'Week {f.fixture_round}')
+             for f in [last_season, *round_5[:2], round_6, other_comp]]
+    # Legacy pick without fixture_id, matched by team names within the league's competition
+    games.append(Game(user_id=user_id, home_team='Mainz 05', away_team='Augsburg', home_team_score=0, away_team_score=2,
+                      game_week=round_5[2].fixture_date, game_week_name='Week 5'))
+    db.session.add_all(games)
+    db.session.commit()
+    return [f.id for f in round_5]
+
+
+def test_round_scope_uses_league_competition_and_current_season(client, member_setup, sql_log):
+    round_5_ids = _seed(member_setup['user_id'])
+    flask_app._reconcile_game_results(fix=True)  # results are stored on the write path, not by the GET
+
+    with sql_log() as statements:
+        response = client.get(f"/api/v1/predictions?league_id={member_setup['league_id']}&round=5",
+                              headers=member_setup['headers'])
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT') and 'FROM games' in s]
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [p['fixture']['id'] for p in data['predictions']] == round_5_ids
+    assert [p['game_result'] for p in data['predictions']] == ['Win', 'Win', 'Loss']
+    assert data['next_cursor'] is None
+    assert len(selects) == 1  # games joined to fixtures
+
+
+def test_cursor_pages_through_every_prediction(client, member_setup):
+    _seed(member_setup['user_id'])
+
+    seen, cursor = [], ''
+    for _ in range(10):
+        data = client.get(f'/api/v1/predictions?limit=4&cursor={cursor}', headers=member_setup['headers']).get_json()
+        seen.extend(p['id'] for p in data['predictions'])
+        cursor = data['next_cursor']
+        if cursor is None:
+            break
+    assert len(seen) == 6 and seen == sorted(seen)
+
+    assert client.get('/api/v1/predictions?season=abc', headers=member_setup['headers']).status_code == 400
@@ -0,0 +1,67 @@
+"""POST /api/v1/predictions/batch: a whole round in one transaction with a status per fixture."""
+from datetime import datetime, timedelta, timezone
+
+
+from config import db
+from models import Fixture, Game, Prediction
+
+
+def test_batch_upserts_round_and_reports_per_fixture_status(client, member_setup, sql_log):
+    user_id = member_setup['user_id']
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0) + timedelta(days=2)
+    fixtures = [
+        Fixture(competition_slug='ger.1', fixture_round=7, fixture_date=kickoff, fixture_home_team=home,
+                fixture_away_team=away)
+        for home, away in (('Bayern Munich', 'Borussia Dortmund'), ('RB Leipzig', 'SC Freiburg'),
+                           ('VfB Stuttgart', 'Werder Bremen'))
+    ]
+    started = Fixture(competition_slug='ger.1', fixture_round=7, fixture_date=kickoff - timedelta(days=3),
+                      fixture_home_team='Mainz 05', fixture_away_team='FC Augsburg')
+    db.session.add_all([*fixtures, started])
+    db.session.flush()
+    # Existing linked pick and a legacy unlinked pick (matched by the fixture's team names)
+    db.session.add_all([
+        Game(user_id=user_id, home_team='Bayern Munich', away_team='Borussia Dortmund', home_team_score=1,
+             away_team_score=0, fixture_id=fixtures[0].id, game_week_name='Week 7'),
+        Game(user_id=user_id, home_team='RB Leipzig', away_team='SC Freiburg', home_team_score=0, away_team_score=0),
+    ])
+    db.session.commit()
+    ids = [f.id for f in fixtures] + [started.id]
+
+    with sql_log('commit') as commits:
+        response = client.post('/api/v1/predictions/batch', headers=member_setup['headers'], json={'predictions': [
+            {'fixture_id': ids[0], 'home_team_score': 1, 'away_team_score': 0},
+            {'fixture_id': ids[1], 'home_team_score': 2, 'away_team_score': 2},
+            {'fixture_id': ids[2], 'home_team_score': 3, 'away_team_score': 1},
+            {'fixture_id': ids[3], 'home_team_score': 1, 'away_team_score': 1},
+            {'fixture_id': 999999, 'home_team_score': 1, 'away_team_score': 1},
+            {'fixture_id': ids[2], 'home_team_score': -1, 'away_team_score': 1},
+        ]})
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [r['status'] for r in data['results']] == ['unchanged', 'updated', 'created', 'locked', 'not_found', 'invalid']
+    assert data['saved'] == 3
+    assert len(commits) == 2  # the picks, then the member's league standings
+
+    games = Game.query.filter_by(user_id=user_id).order_by(Game.id).all()
+    assert [(g.fixture_id, g.home_team_score, g.away_team_score) for g in games] == [
+        (ids[0], 1, 0), (ids[1], 2, 2), (ids[2], 3, 1)]
+    assert Prediction.query.filter_by(user_id=user_id).count() == 3
+
+
+def test_single_post_rejects_non_numeric_and_negative_scores(client, member_setup):
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=2)
+    fixture = Fixture(competition_slug='ger.1', fixture_round=7, fixture_date=kickoff,
+                      fixture_home_team='Bayern Munich', fixture_away_team='Borussia Dortmund')
+    db.session.add(fixture)
+    db.session.commit()
+
+    def post(home, away):
+        return client.post('/api/v1/predictions', headers=member_setup['headers'],
+                           json={'fixture_id': fixture.id, 'home_team_score': home, 'away_team_score': away})
+
+    assert post('two', 1).status_code == 400
+    assert post(-1, 1).status_code == 400
+    assert post('2', 1).status_code == 201
+    assert Game.query.filter_by(user_id=member_setup['user_id']).one().home_team_score == 2
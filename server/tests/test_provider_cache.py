@@ -0,0 +1,107 @@
+"""provider_cache: ETag revalidation, max-age, LRU size bound, and per-consumer 'unchanged' markers."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import provider_cache
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    bodies = {}
+    cache_control = ''
+    requests_seen = []
+
+    def do_GET(self):
+        body = self.bodies.get(self.path, b'{"matches": []}')
+        etag = f'"{len(body)}-{hash(body) & 0xffff}"'
+        self.requests_seen.append((self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        if self.cache_control:
+            self.send_header('Cache-Control', self.cache_control)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server(tmp_path):
+    _FeedHandler.bodies = {}
+    _FeedHandler.cache_control = ''
+    _FeedHandler.requests_seen = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    saved = dict(provider_cache._settings)
+    provider_cache.configure(directory=str(tmp_path / 'cache'), max_bytes=10 * 1024 * 1024)
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    provider_cache.configure(**saved)
+    server.shutdown()
+    server.server_close()
+
+
+def test_revalidates_with_etag_and_serves_304_from_disk(feed_server):
+    url = f'{feed_server}/matches'
+    _FeedHandler.bodies['/matches'] = b'{"matches": [1, 2]}'
+    first = provider_cache.fetch(url)
+    second = provider_cache.fetch(url)
+    assert not first.from_cache and second.from_cache
+    assert second.status_code == 200 and second.json() == {'matches': [1, 2]}
+    assert [inm for _, inm in _FeedHandler.requests_seen] == [None, first.headers['ETag']]
+
+
+def test_fresh_entry_is_served_without_a_request(feed_server):
+    _FeedHandler.cache_control = 'public, max-age=60'
+    url = f'{feed_server}/standings'
+    provider_cache.fetch(url)
+    assert provider_cache.fetch(url).from_cache
+    assert len(_FeedHandler.requests_seen) == 1
+
+
+def test_unchanged_only_after_mark_processed(feed_server):
+    url = f'{feed_server}/matches'
+    _FeedHandler.bodies['/matches'] = b'{"matches": [1]}'
+    feed = provider_cache.fetch(url)
+    assert not feed.unchanged_for('fixtures')
+    provider_cache.mark_processed(feed, 'fixtures')
+    again = provider_cache.fetch(url)
+    assert again.unchanged_for('fixtures')
+    assert not again.unchanged_for('scores')
+
+    _FeedHandler.bodies['/matches'] = b'{"matches": [1, 2]}'
+    assert not provider_cache.fetch(url).unchanged_for('fixtures')
+
+
+def test_size_limit_evicts_least_recently_used(feed_server):
+    provider_cache.configure(max_bytes=1800)
+    for name in ('a', 'b', 'c'):
+        _FeedHandler.bodies[f'/{name}'] = b'{"x": "' + name.encode() * 400 + b'"}'
+    provider_cache.fetch(f'{feed_server}/a')
+    provider_cache.fetch(f'{feed_server}/b')
+    provider_cache.fetch(f'{feed_server}/a')  # a is now more recent than b
+    provider_cache.fetch(f'{feed_server}/c')
+    assert provider_cache._read_entry(f'{feed_server}/a')[0] is not None
+    assert provider_cache._read_entry(f'{feed_server}/b')[0] is None
+    assert provider_cache._read_entry(f'{feed_server}/c')[0] is not None
+
+
+def test_standings_override_url_is_not_cached(feed_server):
+    import app as flask_app
+
+    _FeedHandler.bodies['/standings'] = (
+        b'{"matchweek": 9, "tables": [{"entries": [{"team": {"name": "Arsenal"}, "overall": {"position": 1}}]}]}')
+    url = f'{feed_server}/standings'
+    standings, matchweek = flask_app._fetch_standings_data(url)
+    assert matchweek == 9 and standings[0]['team'] == 'Arsenal'
+    assert provider_cache._read_entry(url)[0] is None
@@ -0,0 +1,88 @@
+"""provider_client: pooled keep-alive sessions per host, retries on 429/5xx for GET only."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import provider_client
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    statuses = []
+    client_ports = []
+    retry_after = '0'
+    lock = threading.Lock()
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        with self.lock:
+            self.client_ports.append(self.client_address[1])
+            status = self.statuses.pop(0) if self.statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', self.retry_after)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    _FlakyHandler.statuses = []
+    _FlakyHandler.client_ports = []
+    _FlakyHandler.retry_after = '0'
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    provider_client.configure(retries=2, backoff_factor=0)
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    provider_client.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def test_sessions_are_shared_per_host_and_keep_alive(flaky_server):
+    assert provider_client.session_for(f'{flaky_server}/a') is provider_client.session_for(f'{flaky_server}/b?x=1')
+    assert provider_client.session_for(f'{flaky_server}/a') is not provider_client.session_for('https://example.com/a')
+    for _ in range(5):
+        assert provider_client.get(f'{flaky_server}/scoreboard').status_code == 200
+    assert len(_FlakyHandler.client_ports) == 5
+    assert len(set(_FlakyHandler.client_ports)) == 1  # one TCP connection reused
+
+
+def test_get_retries_on_5xx_and_429(flaky_server):
+    _FlakyHandler.statuses = [503, 429]
+    resp = provider_client.get(f'{flaky_server}/scoreboard')
+    assert resp.status_code == 200
+    assert len(_FlakyHandler.client_ports) == 3
+
+
+def test_post_is_not_retried_on_5xx(flaky_server):
+    _FlakyHandler.statuses = [500]
+    assert provider_client.post(f'{flaky_server}/mail/send', json={}).status_code == 500
+    assert len(_FlakyHandler.client_ports) == 1
+
+    _FlakyHandler.statuses = [429]
+    assert provider_client.post(f'{flaky_server}/mail/send', json={}).status_code == 200
+    assert len(_FlakyHandler.client_ports) == 3
+
+
+def test_get_caps_retry_after(flaky_server, monkeypatch):
+    monkeypatch.setattr(provider_client, 'MAX_RETRY_AFTER_SECONDS', 0.1)
+    _FlakyHandler.retry_after = '3600'
+    _FlakyHandler.statuses = [429]
+    started = time.monotonic()
+    assert provider_client.get(f'{flaky_server}/scoreboard').status_code == 200
+    assert time.monotonic() - started < 5
+    assert len(_FlakyHandler.client_ports) == 2
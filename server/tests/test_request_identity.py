@@ -0,0 +1,62 @@
+"""Request-scoped identity: one token decode per request, memoized membership checks, and league endpoints whose
+query count does not grow with the number of members."""
+import leaderboard_cache
+from config import db
+from models import LeagueMembership, User
+
+
+def _selects(client, sql_log, url, headers):
+    leaderboard_cache.clear()
+    with sql_log() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    return [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+
+
+def _add_members(league_id, count, start=0):
+    for n in range(start, start + count):
+        user = User(email=f'crowd{n}@smoke.test')
+        user.password_hash = 'password'
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(LeagueMembership(user_id=user.id, league_id=league_id, display_name=f'crowd{n}'))
+    db.session.commit()
+
+
+def test_league_endpoint_query_counts_do_not_grow_with_members(client, member_setup, sql_log):
+    league_id = member_setup['league_id']
+    headers = member_setup['headers']
+    urls = [
+        f'/api/v1/leagues/{league_id}',
+        '/api/v1/leagues',
+        f'/api/v1/leagues/{league_id}/leaderboard',
+        f'/api/v1/leagues/{league_id}/round-standings/history',
+    ]
+    _add_members(league_id, 2)
+    small = {url: len(_selects(client, sql_log, url, headers)) for url in urls}
+    _add_members(league_id, 6, start=2)
+    large = {url: len(_selects(client, sql_log, url, headers)) for url in urls}
+    assert large == small
+
+
+def test_token_decoded_once_and_membership_checks_memoized(client, member_setup, monkeypatch, sql_log):
+    import app as flask_app
+
+    decodes = []
+    real_decode = flask_app.jwt.decode
+
+    def _counting_decode(*args, **kwargs):
+        decodes.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(flask_app.jwt, 'decode', _counting_decode)
+    league_id = member_setup['league_id']
+    # Admin check and member lookup for the same (user, league): one membership query between them
+    url = f"/api/v1/leagues/{league_id}/members/{member_setup['user_id']}/predictions"
+    statements = _selects(client, sql_log, url, member_setup['headers'])
+    assert len(decodes) == 1
+    assert len([s for s in statements if 'FROM league_memberships' in s]) == 1
+
+    decodes.clear()
+    _selects(client, sql_log, f'/api/v1/leagues/{league_id}/leaderboard', member_setup['headers'])
+    assert len(decodes) == 1
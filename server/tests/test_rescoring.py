@@ -0,0 +1,100 @@
+"""Rescoring engine: a score change rescores only the picks on that fixture and their members' standings."""
+from datetime import datetime, timedelta, timezone
+
+from config import app, db
+from models import Fixture, Game, League, LeagueStanding, LeagueMembership, User
+
+
+def test_score_change_rescores_linked_picks_only(client, member_setup, sql_log):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=3)
+    with app.app_context():
+        league = db.session.get(League, member_setup['league_id'])
+        league.leaderboard_scope = 'full_season'
+        league.season_started_at = kickoff - timedelta(days=2)
+        other = User(email='other@smoke.test')
+        other.password_hash = 'password'
+        db.session.add(other)
+        db.session.flush()
+        db.session.add(LeagueMembership(user_id=other.id, league_id=league.id, display_name='other'))
+        changed = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Bayern Munich',
+                          fixture_away_team='Borussia Dortmund', actual_home_score=0, actual_away_score=0)
+        untouched = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='RB Leipzig',
+                            fixture_away_team='SC Freiburg', actual_home_score=1, actual_away_score=0, is_completed=True)
+        db.session.add_all([changed, untouched])
+        db.session.flush()
+        picks = [
+            Game(user_id=member_setup['user_id'], fixture_id=changed.id, home_team_score=2, away_team_score=1, game_result='Loss',
+                 home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff),
+            Game(user_id=other.id, fixture_id=changed.id, home_team_score=1, away_team_score=0, game_result='Loss',
+                 home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff),
+            Game(user_id=other.id, fixture_id=untouched.id, home_team_score=1, away_team_score=0, game_result='Win',
+                 home_team='RB Leipzig', away_team='SC Freiburg', game_week=kickoff),
+        ]
+        db.session.add_all(picks)
+        db.session.commit()
+        pick_ids = [g.id for g in picks]
+
+        assert flask_app._set_fixture_result(changed, 2, 1, True) is True
+        db.session.commit()
+
+        with sql_log() as statements:
+            flask_app._refresh_dirty_standings()
+
+        assert [db.session.get(Game, gid).game_result for gid in pick_ids] == ['Win', 'Draw', 'Win']
+        assert db.session.get(Fixture, changed.id).results_pending is False
+        # Picks were read for the changed fixture only, never the whole games table
+        game_selects = [s for s in statements if s.lstrip().upper().startswith('SELECT') and 'FROM games' in s
+                        and 'fixture_id IS NULL' not in s and 'user_id IN' not in s]
+        assert game_selects and all('fixture_id IN' in s for s in game_selects)
+        stored = {r.user_id: r.points for r in LeagueStanding.query.filter_by(league_id=league.id).all()}
+        assert stored == {member_setup['user_id']: 3, other.id: 4}
+
+
+def test_rescore_job_picks_up_leftover_flags(client, member_setup):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=3)
+    with app.app_context():
+        fixture = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Mainz 05',
+                          fixture_away_team='FC Augsburg', actual_home_score=0, actual_away_score=0, is_completed=True,
+                          results_pending=True)
+        db.session.add(fixture)
+        db.session.flush()
+        game = Game(user_id=member_setup['user_id'], fixture_id=fixture.id, home_team_score=1, away_team_score=1,
+                    home_team='Mainz 05', away_team='FC Augsburg', game_week=kickoff)
+        db.session.add(game)
+        db.session.commit()
+
+        assert flask_app._job_rescore_results() == (1, [])
+        assert db.session.get(Game, game.id).game_result == 'Draw'
+        assert flask_app._rescore_fixtures() == (0, 0)
+
+
+def test_unlinked_picks_mark_only_members_naming_a_changed_fixture(client, member_setup):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=3)
+    other = User(email='other@smoke.test')
+    other.password_hash = 'password'
+    db.session.add(other)
+    fixture = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Bayern Munich',
+                      fixture_away_team='Borussia Dortmund', actual_home_score=0, actual_away_score=0)
+    db.session.add(fixture)
+    db.session.flush()
+    db.session.add_all([
+        # Legacy picks without fixture_id: one names the changed fixture, one another match
+        Game(user_id=member_setup['user_id'], home_team='Bayern Munich', away_team='Borussia Dortmund',
+             home_team_score=2, away_team_score=1, game_week=kickoff),
+        Game(user_id=other.id, home_team='RB Leipzig', away_team='SC Freiburg', home_team_score=1, away_team_score=0,
+             game_week=kickoff),
+    ])
+    db.session.commit()
+
+    assert flask_app._set_fixture_result(fixture, 2, 1, True) is True
+    db.session.commit()
+    db.session.info.pop('results_dirty_fixtures', None)
+    assert flask_app._rescore_fixtures([fixture.id]) == (1, 1)  # the unlinked pick's result is written too
+    assert db.session.info.pop('standings_dirty_members') == {'ger.1': {member_setup['user_id']}}
+    assert Game.query.filter_by(user_id=member_setup['user_id']).one().game_result == 'Win'
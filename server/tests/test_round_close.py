@@ -0,0 +1,64 @@
+"""Round close: weekly winners are written once when a round completes; the leaderboard GET only reads them."""
+from datetime import datetime, timedelta, timezone
+
+from config import app, db
+from models import Fixture, Game, League, LeagueMembership, LeagueRoundClose, LeagueWeekWinner, User
+
+
+def test_round_close_awards_winners_once_and_get_only_reads(client, member_setup, sql_log):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=3)
+    with app.app_context():
+        league = db.session.get(League, member_setup['league_id'])
+        league.season_started_at = kickoff - timedelta(days=2)
+        other = User(email='other@smoke.test')
+        other.password_hash = 'password'
+        db.session.add(other)
+        db.session.flush()
+        db.session.add(LeagueMembership(user_id=other.id, league_id=league.id, display_name='other'))
+        round_1 = [
+            Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Bayern Munich',
+                    fixture_away_team='Borussia Dortmund', actual_home_score=2, actual_away_score=1, is_completed=True),
+            Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='RB Leipzig',
+                    fixture_away_team='SC Freiburg', actual_home_score=0, actual_away_score=0, is_completed=True),
+        ]
+        round_2 = Fixture(competition_slug='ger.1', fixture_round=2, fixture_date=kickoff + timedelta(days=7),
+                          fixture_home_team='Mainz 05', fixture_away_team='FC Augsburg')
+        db.session.add_all([*round_1, round_2])
+        db.session.flush()
+        db.session.add_all([
+            # member: exact + right outcome = 4 points; other: one exact, missed the second fixture = 3 points
+            Game(user_id=member_setup['user_id'], fixture_id=round_1[0].id, home_team_score=2, away_team_score=1,
+                 home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff),
+            Game(user_id=member_setup['user_id'], fixture_id=round_1[1].id, home_team_score=1, away_team_score=1,
+                 home_team='RB Leipzig', away_team='SC Freiburg', game_week=kickoff),
+            Game(user_id=other.id, fixture_id=round_1[0].id, home_team_score=2, away_team_score=1,
+                 home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff),
+            Game(user_id=other.id, fixture_id=round_2.id, home_team_score=1, away_team_score=0,
+                 home_team='Mainz 05', away_team='FC Augsburg', game_week=round_2.fixture_date),
+        ])
+        db.session.commit()
+        other_id, round_2_id = other.id, round_2.id
+
+        with sql_log() as statements:
+            response = client.get(f"/api/v1/leagues/{member_setup['league_id']}/leaderboard", headers=member_setup['headers'])
+        writes = [s for s in statements if s.lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))]
+        assert response.status_code == 200
+        assert response.get_json()['current_round'] == 2
+        assert writes == [] and LeagueWeekWinner.query.count() == 0
+
+        assert flask_app._close_completed_rounds() == 1
+        assert flask_app._close_completed_rounds() == 0
+        assert [(w.fixture_round, w.user_id) for w in LeagueWeekWinner.query.all()] == [(1, member_setup['user_id'])]
+
+        # Round 2's only fixture gets its score: the post-sync refresh closes it
+        flask_app._set_fixture_result(db.session.get(Fixture, round_2_id), 1, 0, True)
+        db.session.commit()
+        flask_app._refresh_dirty_standings()
+        assert {r.fixture_round for r in LeagueRoundClose.query.all()} == {1, 2}
+        assert LeagueWeekWinner.query.filter_by(fixture_round=2).one().user_id == other_id
+
+    rows = client.get(f"/api/v1/leagues/{member_setup['league_id']}/leaderboard?round=1",
+                      headers=member_setup['headers']).get_json()['leaderboard']
+    assert [(r['points'], r['losses'], r['weeks_won']) for r in rows] == [(4, 0, 1), (3, 1, 1)]
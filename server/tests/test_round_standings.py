@@ -0,0 +1,112 @@
+"""Round standings snapshots: written at round close, read back with rank movement and as a points series."""
+from datetime import datetime, timedelta, timezone
+
+from config import app, db
+from models import Fixture, Game, League, LeagueMembership, LeagueRoundStanding, LeagueWeekWinner, User
+
+
+def test_round_close_snapshots_standings_with_rank_movement(client, member_setup):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=10)
+    with app.app_context():
+        league = db.session.get(League, member_setup['league_id'])
+        league.leaderboard_scope = 'full_season'
+        league.season_started_at = kickoff - timedelta(days=2)
+        other = User(email='other@smoke.test')
+        other.password_hash = 'password'
+        db.session.add(other)
+        db.session.flush()
+        db.session.add(LeagueMembership(user_id=other.id, league_id=league.id, display_name='other'))
+
+        def fixture(fixture_round, home, away, score, days):
+            return Fixture(competition_slug='ger.1', fixture_round=fixture_round, fixture_date=kickoff + timedelta(days=days),
+                           fixture_home_team=home, fixture_away_team=away, actual_home_score=score[0],
+                           actual_away_score=score[1], is_completed=True)
+
+        f1 = fixture(1, 'Bayern Munich', 'Borussia Dortmund', (2, 1), 0)
+        f2 = fixture(2, 'RB Leipzig', 'SC Freiburg', (0, 0), 7)
+        f3 = fixture(2, 'Mainz 05', 'FC Augsburg', (1, 2), 7)
+        db.session.add_all([f1, f2, f3])
+        db.session.flush()
+
+        def pick(uid, f, home, away):
+            return Game(user_id=uid, fixture_id=f.id, home_team_score=home, away_team_score=away,
+                        home_team=f.fixture_home_team, away_team=f.fixture_away_team, game_week=f.fixture_date)
+
+        member_id = member_setup['user_id']
+        db.session.add_all([
+            pick(member_id, f1, 2, 1), pick(other.id, f1, 1, 0),  # round 1: 3 vs 1
+            pick(member_id, f2, 1, 0), pick(other.id, f2, 0, 0), pick(other.id, f3, 1, 2),  # round 2: 0 vs 6
+        ])
+        db.session.commit()
+        other_id = other.id
+
+        assert flask_app._close_completed_rounds() == 2
+        assert LeagueWeekWinner.query.count() == 0  # full-season league: snapshots only
+        assert LeagueRoundStanding.query.count() == 4
+
+    url = f"/api/v1/leagues/{member_setup['league_id']}/round-standings"
+    latest = client.get(url, headers=member_setup['headers']).get_json()
+    assert (latest['round'], latest['previous_round'], latest['rounds']) == (2, 1, [1, 2])
+    assert [(r['user_id'], r['points'], r['total_points'], r['total_losses'], r['rank'], r['rank_change'])
+            for r in latest['standings']] == [(other_id, 6, 7, 0, 1, 1), (member_id, 0, 3, 2, 2, -1)]
+    first = client.get(f'{url}?round=1', headers=member_setup['headers']).get_json()
+    assert [(r['user_id'], r['rank'], r['rank_change']) for r in first['standings']] == [(member_id, 1, None), (other_id, 2, None)]
+    assert client.get(f'{url}?round=3', headers=member_setup['headers']).status_code == 404
+
+    history = client.get(f'{url}/history', headers=member_setup['headers']).get_json()
+    totals = {s['user_id']: [p['total_points'] for p in s['points']] for s in history['series']}
+    assert totals == {member_id: [3, 3], other_id: [1, 7]}
+
+    with app.app_context():
+        assert flask_app._backfill_round_standings() == 2
+        assert LeagueRoundStanding.query.count() == 4
+
+
+def test_closed_round_follows_score_and_pick_corrections(client, member_setup):
+    import app as flask_app
+
+    kickoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=3)
+    league = db.session.get(League, member_setup['league_id'])
+    league.season_started_at = kickoff - timedelta(days=2)
+    other = User(email='other@smoke.test')
+    other.password_hash = 'password'
+    db.session.add(other)
+    db.session.flush()
+    db.session.add(LeagueMembership(user_id=other.id, league_id=league.id, display_name='other'))
+    f1 = Fixture(competition_slug='ger.1', fixture_round=1, fixture_date=kickoff, fixture_home_team='Bayern Munich',
+                 fixture_away_team='Borussia Dortmund', actual_home_score=2, actual_away_score=1, is_completed=True)
+    db.session.add(f1)
+    db.session.flush()
+    member_id, other_id = member_setup['user_id'], other.id
+    member_pick = Game(user_id=member_id, fixture_id=f1.id, home_team_score=2, away_team_score=1,
+                       home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff)
+    db.session.add_all([member_pick, Game(user_id=other_id, fixture_id=f1.id, home_team_score=0, away_team_score=1,
+                                          home_team='Bayern Munich', away_team='Borussia Dortmund', game_week=kickoff)])
+    db.session.commit()
+    f1_id, pick_id = f1.id, member_pick.id
+    assert flask_app._close_completed_rounds() == 1
+
+    def round_1():
+        rows = LeagueRoundStanding.query.filter_by(league_id=member_setup['league_id'], fixture_round=1).all()
+        winners = LeagueWeekWinner.query.filter_by(league_id=member_setup['league_id'], fixture_round=1).all()
+        return {r.user_id: r.points for r in rows}, {w.user_id for w in winners}
+
+    url = f"/api/v1/leagues/{member_setup['league_id']}/leaderboard?round=1"
+    assert round_1() == ({member_id: 3, other_id: 0}, {member_id})
+    assert client.get(url, headers=member_setup['headers']).status_code == 200  # cached under the current version
+
+    # The provider corrects the score after the round closed
+    flask_app._set_fixture_result(db.session.get(Fixture, f1_id), 0, 1, True)
+    db.session.commit()
+    flask_app._refresh_dirty_standings()
+    assert round_1() == ({member_id: 0, other_id: 3}, {other_id})
+    rows = client.get(url, headers=member_setup['headers']).get_json()['leaderboard']
+    assert [(r['user_id'], r['points']) for r in rows] == [(other_id, 3), (member_id, 0)]
+
+    # An admin fixes the member's pick
+    response = client.patch(f"/api/v1/leagues/{member_setup['league_id']}/games/{pick_id}",
+                            headers=member_setup['headers'], json={'home_team_score': 0, 'away_team_score': 1})
+    assert response.status_code == 200
+    assert round_1() == ({member_id: 3, other_id: 3}, {member_id, other_id})
@@ -0,0 +1,70 @@
+"""Scheduler: DB lock per job, due checks across workers, and job_runs bookkeeping."""
+from datetime import datetime, timedelta
+
+import pytest
+
+import scheduler
+from config import app, db
+from models import JobLock, JobRun
+
+
+@pytest.fixture
+def test_jobs():
+    saved = dict(scheduler._jobs)
+    scheduler._jobs.clear()
+    yield scheduler._jobs
+    scheduler._jobs.clear()
+    scheduler._jobs.update(saved)
+
+
+def test_lock_is_exclusive_until_released_or_expired(client, test_jobs):
+    job = scheduler.register_job('sweep', lambda: (0, []), interval=timedelta(minutes=5), lock_ttl=timedelta(minutes=1))
+    now = datetime(2026, 10, 17, 12, 0)
+    with app.app_context():
+        assert scheduler.try_acquire(job, now=now)
+        # Another worker: lock held, and the job is not due again for 5 minutes
+        db.session.query(JobLock).filter_by(name='sweep').update({'owner': 'other:1'})
+        db.session.commit()
+        assert not scheduler.try_acquire(job, now=now + timedelta(seconds=30), force=True)
+        # Expired lock, job due again
+        assert scheduler.try_acquire(job, now=now + timedelta(minutes=6))
+        assert db.session.get(JobLock, 'sweep').owner == scheduler.OWNER
+
+
+def test_daily_job_runs_once_per_slot(client, test_jobs):
+    job = scheduler.register_job('nightly', lambda: (0, []), daily_at_hour=4)
+    with app.app_context():
+        assert scheduler.try_acquire(job, now=datetime(2026, 10, 17, 4, 1))
+        scheduler.release(job)
+        assert not scheduler.try_acquire(job, now=datetime(2026, 10, 17, 23, 0))
+        assert scheduler.try_acquire(job, now=datetime(2026, 10, 18, 4, 0))
+
+
+def test_run_job_records_items_and_errors(client, test_jobs):
+    scheduler.register_job('ok-job', lambda: (7, []), interval=timedelta(minutes=1))
+
+    def _boom():
+        raise RuntimeError('provider down')
+
+    scheduler.register_job('bad-job', _boom, interval=timedelta(minutes=1))
+    with app.app_context():
+        ok = scheduler.run_job('ok-job')
+        bad = scheduler.run_job('bad-job')
+        assert (ok.status, ok.items_processed, ok.error) == ('ok', 7, None)
+        assert bad.status == 'error' and 'provider down' in bad.error
+        assert scheduler.run_job('ok-job') is None  # not due again yet
+        assert JobRun.query.count() == 2
+        assert db.session.get(JobLock, 'bad-job').expires_at is None
+
+
+def test_job_runs_endpoint_requires_cron_secret(client, test_jobs):
+    app.config['NOTIFICATION_CRON_SECRET'] = 'cron-secret'
+    scheduler.register_job('ok-job', lambda: (3, []), interval=timedelta(minutes=1))
+    with app.app_context():
+        scheduler.run_job('ok-job')
+    assert client.get('/api/v1/admin/job-runs').status_code == 401
+    resp = client.get('/api/v1/admin/job-runs?job=ok-job', headers={'X-Cron-Secret': 'cron-secret'})
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert [r['items_processed'] for r in body['runs']] == [3]
+    assert body['jobs'][0]['name'] == 'ok-job' and body['jobs'][0]['last_started_at']
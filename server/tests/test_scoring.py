@@ -0,0 +1,65 @@
+"""Columnar scoring kernel: same W/D/L as the per-row rule, with and without NumPy."""
+from datetime import datetime, timedelta, timezone
+from itertools import product
+
+import pytest
+
+import scoring
+from app import _pick_result
+
+
+@pytest.fixture(params=['numpy', 'fallback'])
+def kernel(request, monkeypatch):
+    if request.param == 'numpy' and not scoring.NUMPY_AVAILABLE:
+        pytest.skip('numpy not installed')
+    if request.param == 'fallback':
+        monkeypatch.setattr(scoring, 'NUMPY_AVAILABLE', False)
+    return scoring
+
+
+def test_score_picks_matches_pick_result(kernel):
+    values = [None, 0, 1, 2, 3]
+    rows = list(product(values, repeat=4))
+    columns = [list(col) for col in zip(*rows)]
+    assert kernel.result_names(kernel.score_picks(*columns)) == [_pick_result(*row) for row in rows]
+
+
+def test_started_flags_gate_results_and_tally_per_member(kernel):
+    now = datetime(2026, 9, 19, 15, 0)
+    kickoffs = [now - timedelta(hours=2), now + timedelta(hours=2), now + timedelta(hours=2),
+                (now - timedelta(hours=1)).replace(tzinfo=timezone.utc), None]
+    started = kernel.fixtures_started(kickoffs, [False, False, True, False, False], now=now)
+    assert list(started) == [True, False, True, True, False]
+
+    # Picks: (member, fixture, predicted) against fixtures that all finished 1-1
+    picks = [(0, 0, (1, 1)), (0, 1, (1, 1)), (0, 2, (2, 2)), (1, 3, (2, 0)), (1, 4, (1, 1)), (1, 0, (0, 0))]
+    fixture_idx = [f for _, f, _ in picks]
+    codes = kernel.score_picks(
+        [p[0] for _, _, p in picks], [p[1] for _, _, p in picks],
+        kernel.take([1] * 5, fixture_idx), kernel.take([1] * 5, fixture_idx),
+        kernel.take(started, fixture_idx, dtype=bool),
+    )
+    assert kernel.result_names(codes) == ['Win', None, 'Draw', 'Loss', None, 'Draw']
+    assert list(kernel.points(codes)) == [3, 0, 1, 0, 0, 1]
+    assert kernel.tally(codes, [m for m, _, _ in picks], 2) == ([1, 0], [1, 1], [0, 1])
+
+
+def test_pick_columns_match_compute_game_result(kernel):
+    from types import SimpleNamespace
+
+    from app import _compute_game_result, _score_pick_columns
+
+    now = datetime(2026, 9, 19, 15, 0, tzinfo=timezone.utc)
+    fixtures = {
+        10: SimpleNamespace(fixture_date=datetime(2026, 9, 19, 13, 0), is_completed=True, actual_home_score=2, actual_away_score=1),
+        11: SimpleNamespace(fixture_date=datetime(2026, 9, 19, 17, 0), is_completed=False, actual_home_score=0, actual_away_score=0),
+        12: SimpleNamespace(fixture_date=datetime(2026, 9, 19, 14, 0), is_completed=False, actual_home_score=None,
+                            actual_away_score=None),
+    }
+    picks = [(2, 1, 10), (1, 0, 10), (0, 2, 10), (0, 0, 11), (1, 1, 12), (None, 1, 10)]
+    expected = [
+        _compute_game_result(SimpleNamespace(home_team_score=h, away_team_score=a), fixtures[fid], now=now)
+        for h, a, fid in picks
+    ]
+    assert _score_pick_columns([p[0] for p in picks], [p[1] for p in picks], [p[2] for p in picks], fixtures,
+                               now=now) == expected == ['Win', 'Draw', 'Loss', None, None, None]
@@ -0,0 +1,85 @@
+"""Standings cache: fresh hits, stale-while-revalidate, one fetch per key, last-known-good on provider failure."""
+import threading
+import time
+
+import pytest
+
+import scheduler
+import standings_cache
+from models import JobLock
+
+
+@pytest.fixture
+def cache():
+    saved, saved_backend = dict(standings_cache._settings), standings_cache._backend[0]
+    standings_cache.configure(backend='memory', ttl_seconds=60, stale_seconds=3600, lock_seconds=5)
+    yield standings_cache
+    standings_cache._settings.update(saved)
+    standings_cache._backend[0] = saved_backend
+
+
+def test_stale_entry_served_while_one_background_refresh_runs(cache):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {'standings': [len(calls)]}
+
+    assert cache.get('eng.1', fetch) == {'standings': [1]}
+    assert cache.get('eng.1', fetch) == {'standings': [1]} and len(calls) == 1  # fresh
+
+    cache._settings['ttl_seconds'] = 0
+    assert cache.get('eng.1', fetch) == {'standings': [1]}  # stale value served immediately
+    deadline = time.monotonic() + 2
+    while cache._backend[0].get('eng.1')['value'] != {'standings': [2]} and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache._backend[0].get('eng.1')['value'] == {'standings': [2]} and len(calls) == 2
+
+
+def test_failed_refresh_keeps_last_good_and_miss_without_table_is_none(cache):
+    assert cache.get('ger.1', lambda: {'standings': ['ok']}) == {'standings': ['ok']}
+    cache._settings['ttl_seconds'] = 0
+
+    def failing():
+        raise RuntimeError('quota exhausted')
+
+    assert cache.get('ger.1', failing) == {'standings': ['ok']}
+    time.sleep(0.05)
+    assert cache.get('ger.1', lambda: None) == {'standings': ['ok']}
+    assert cache.get('ita.1', lambda: None) is None
+
+
+def test_concurrent_misses_share_one_fetch(cache):
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(2)
+        return {'standings': ['table']}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('fra.1', slow_fetch))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1 and results == [{'standings': ['table']}] * 4
+
+
+def test_memory_backend_refresh_lock_is_a_job_locks_row(client):
+    locks = scheduler.RowLocks('standings:')
+    backend = standings_cache.MemoryBackend(locks=locks)
+    assert backend.acquire('eng.1', 30)
+    assert not backend.acquire('eng.1', 30)  # held, as it would be for another worker
+    row = scheduler.db.session.get(JobLock, 'standings:eng.1')
+    assert row.owner == scheduler.OWNER and row.expires_at is not None
+    backend.release('eng.1')
+    assert backend.acquire('eng.1', 30)
+
+    JobLock.query.filter_by(name='standings:eng.1').update({'owner': 'other-host:1'})
+    scheduler.db.session.commit()
+    backend.release('eng.1')  # only the owner releases
+    assert not backend.acquire('eng.1', 30)
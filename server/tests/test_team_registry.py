@@ -0,0 +1,82 @@
+"""Team registry: spellings resolve to a registry team id; syncs register new spellings."""
+import pytest
+
+from config import app, db
+from models import Team, TeamAlias
+import team_matching
+from team_matching import _alias_team_key, _fixture_matches_game, _team_names_equivalent
+
+
+@pytest.fixture
+def registry(client):
+    import app as flask_app
+
+    with app.app_context():
+        Team.__table__.create(db.engine, checkfirst=True)
+        TeamAlias.__table__.create(db.engine, checkfirst=True)
+        united = Team(competition_slug='eng.1', canonical_name='manchester united')
+        db.session.add(united)
+        db.session.flush()
+        for alias in ('manchester united', 'man utd', 'utd'):
+            db.session.add(TeamAlias(team_id=united.id, alias=alias, source='seed'))
+        db.session.commit()
+        yield united.id
+        db.session.remove()
+        TeamAlias.__table__.drop(db.engine, checkfirst=True)
+        Team.__table__.drop(db.engine, checkfirst=True)
+    team_matching.reset_team_registry()
+    flask_app._team_registry_loaded = False
+
+
+def test_loaded_registry_maps_spellings_to_team_id(registry):
+    from app import _load_team_registry
+
+    assert _load_team_registry() == 3
+    assert _alias_team_key('Man Utd') == registry
+    assert _alias_team_key(' MANCHESTER UNITED ') == registry
+    assert _team_names_equivalent('utd', 'Manchester United')
+    # Spellings not in the registry fall back to their normalized name
+    assert _alias_team_key('Spurs') == 'spurs'
+    assert not _team_names_equivalent('Spurs', 'Tottenham Hotspur')
+
+
+def test_register_team_spellings_attaches_and_creates(registry):
+    from app import _register_team_spellings
+
+    added = _register_team_spellings(['Manchester United FC', 'Brentford', 'Man Utd', ''], 'eng.1', 'football-data')
+    db.session.commit()
+    assert added == 2
+
+    fc = TeamAlias.query.filter_by(alias='manchester united fc').one()
+    assert fc.team_id == registry
+    assert fc.source == 'football-data'
+    brentford = TeamAlias.query.filter_by(alias='brentford').one()
+    assert brentford.team_id != registry
+    assert Team.query.count() == 2
+
+    fixture = type('F', (), {'fixture_home_team': 'Manchester United FC', 'fixture_away_team': 'Brentford'})()
+    assert _fixture_matches_game(fixture, 'man utd', 'brentford')
+    # Already registered: nothing new
+    assert _register_team_spellings(['Manchester United FC'], 'eng.1', 'espn') == 0
+
+
+def test_registered_spellings_reach_the_map_only_after_commit(registry):
+    from app import _register_team_spellings
+
+    assert _register_team_spellings(['Burnley FC'], 'eng.1', 'espn') == 1
+    assert not team_matching.is_registered_spelling('Burnley FC')  # not committed yet
+    db.session.rollback()  # the sync failed: the map never sees the spelling
+    assert not team_matching.is_registered_spelling('Burnley FC')
+
+    assert _register_team_spellings(['Sunderland AFC'], 'eng.1', 'espn') == 1
+    db.session.commit()
+    assert team_matching.is_registered_spelling('Sunderland AFC')
+
+
+def test_name_normalization_is_memoized():
+    team_matching._normalize_team_name_for_match.cache_clear()
+    for _ in range(3):
+        team_matching._normalize_team_name_for_match('FC Bayern München')
+    info = team_matching._normalize_team_name_for_match.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    assert info.maxsize == team_matching.TEAM_NAME_MEMO_SIZE